@@ -0,0 +1,90 @@
+"""
+Measure rendering of `Calendar` keyboard for each scope.
+
+Default calendar renders buttons in a batch, custom one uses texts with
+`when` condition, so each button is rendered by widgets one by one.
+
+Run: python benchmarks/calendar_render.py
+"""
+import asyncio
+import time
+from unittest.mock import MagicMock, Mock
+
+from aiogram.fsm.state import State
+
+from aiogram_dialog.api.entities import Context
+from aiogram_dialog.widgets.kbd import Calendar, CalendarScope
+from aiogram_dialog.widgets.kbd.calendar_kbd import (
+    CalendarDaysView,
+    CalendarMonthView,
+    CalendarYearsView,
+)
+from aiogram_dialog.widgets.text import Format
+
+ROUNDS = 2000
+
+
+class WidgetCalendar(Calendar):
+    def _init_views(self):
+        def text(fmt: str) -> Format:
+            return Format(fmt, when=lambda *args: True)
+
+        return {
+            CalendarScope.DAYS: CalendarDaysView(
+                self._item_callback_data,
+                date_text=text("{date:%d}"),
+                today_text=text("[ {date:%d} ]"),
+                weekday_text=text("{date:%a}"),
+            ),
+            CalendarScope.MONTHS: CalendarMonthView(
+                self._item_callback_data,
+                month_text=text("{date:%B}"),
+                this_month_text=text("[ {date:%B} ]"),
+            ),
+            CalendarScope.YEARS: CalendarYearsView(
+                self._item_callback_data,
+                year_text=text("{date:%Y}"),
+                this_year_text=text("[ {date:%Y} ]"),
+            ),
+        }
+
+
+def create_manager() -> MagicMock:
+    manager = MagicMock()
+    context = Context(
+        dialog_data={},
+        start_data={},
+        widget_data={},
+        state=State(),
+        _stack_id="",
+        _intent_id="",
+    )
+    manager.current_context = Mock(return_value=context)
+    manager.is_preview = Mock(return_value=False)
+    return manager
+
+
+async def run(calendar: Calendar, scope: CalendarScope) -> float:
+    manager = create_manager()
+    calendar.set_scope(scope, manager)
+    await calendar.render_keyboard({}, manager)  # warm up
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await calendar.render_keyboard({}, manager)
+    return (time.perf_counter() - started) / ROUNDS
+
+
+async def main():
+    for scope in CalendarScope:
+        widgets = await run(WidgetCalendar(id="calendar"), scope)
+        batch = await run(Calendar(id="calendar"), scope)
+        print(  # noqa: T201
+            f"{scope.value:<6} "
+            f"widgets: {widgets * 1e6:.0f} us, "
+            f"batch: {batch * 1e6:.0f} us, "
+            f"speedup: {widgets / batch:.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""
+Measure latency of an update processed by the last of many dialogs.
+
+Dialogs for current state are found by registry, so others are skipped
+without running their filters. Legacy dialogs ignore the found dialog
+and check `IntentFilter` for each event as before.
+
+Run: python benchmarks/dialog_dispatch.py
+"""
+import asyncio
+import time
+from typing import Any
+
+from aiogram import Dispatcher, Router
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.text import Const
+
+DIALOG_COUNTS = (10, 100, 300)
+ROUNDS = 200
+
+
+class LegacyDialog(Dialog):
+    async def propagate_event(self, update_type: str, event, **kwargs: Any):
+        return await Router.propagate_event(
+            self, update_type, event, **kwargs,
+        )
+
+
+async def on_input(message: Message, widget, manager: DialogManager):
+    pass
+
+
+def create_dispatcher(count: int, dialog_cls: type[Dialog]):
+    groups = [
+        type(f"SG{i}", (StatesGroup,), {"start": State()})
+        for i in range(count)
+    ]
+
+    async def start(message: Message, dialog_manager: DialogManager):
+        await dialog_manager.start(
+            groups[-1].start, mode=StartMode.RESET_STACK,
+        )
+
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.message.register(start, CommandStart())
+    for group in groups:
+        dp.include_router(dialog_cls(Window(
+            Const("stub"),
+            MessageInput(on_input),
+            state=group.start,
+        )))
+    setup_dialogs(dp, message_manager=MockMessageManager())
+    return dp
+
+
+async def run(count: int, dialog_cls: type[Dialog]) -> float:
+    client = BotClient(create_dispatcher(count, dialog_cls))
+    await client.send("/start")
+    await client.send("warm up")
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await client.send("hello")
+    return (time.perf_counter() - started) / ROUNDS
+
+
+async def main():
+    for count in DIALOG_COUNTS:
+        legacy = await run(count, LegacyDialog)
+        direct = await run(count, Dialog)
+        print(  # noqa: T201
+            f"{count:>4} dialogs "
+            f"filters: {legacy * 1e6:.0f} us, "
+            f"registry: {direct * 1e6:.0f} us, "
+            f"speedup: {legacy / direct:.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
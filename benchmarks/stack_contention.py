@@ -0,0 +1,129 @@
+"""
+Compare per-stack locks and optimistic mode under contention.
+
+Several users' clicks on the same dialog message are processed
+concurrently. Each click waits for an emulated API call. In `read`
+workload clicks do not change dialog, in `write` workload each click
+increments a counter in dialog data, so concurrent events conflict and
+are retried in optimistic mode.
+
+Run: python benchmarks/stack_contention.py
+"""
+import asyncio
+import time
+
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import CallbackQuery, Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.api.entities import NewMessage, OldMessage
+from aiogram_dialog.context.dialog_storage import MemoryVersionedDialogStorage
+from aiogram_dialog.context.storage import StorageStats
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.keyboard import InlineButtonTextLocator
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.kbd import Button
+from aiogram_dialog.widgets.text import Const, Format
+
+DELAY = 0.01
+CONCURRENCY = (1, 4, 16)
+ROUNDS = 10
+
+
+class MainSG(StatesGroup):
+    read = State()
+    write = State()
+
+
+class EditingMessageManager(MockMessageManager):
+    async def show_message(
+            self, bot, new_message: NewMessage,
+            old_message: OldMessage | None,
+    ) -> OldMessage:
+        if old_message and old_message.text == new_message.text:
+            return old_message  # not modified
+        return await super().show_message(bot, new_message, old_message)
+
+
+async def on_read(event: CallbackQuery, button, manager: DialogManager):
+    await asyncio.sleep(DELAY)
+
+
+async def on_write(event: CallbackQuery, button, manager: DialogManager):
+    await asyncio.sleep(DELAY)
+    counter = manager.dialog_data.get("counter", 0)
+    manager.dialog_data["counter"] = counter + 1
+
+
+async def getter(dialog_manager: DialogManager, **kwargs):
+    return {"counter": dialog_manager.dialog_data.get("counter", 0)}
+
+
+async def run(
+        state: State, concurrency: int, optimistic: bool,
+) -> tuple[float, int]:
+    async def start(message: Message, dialog_manager: DialogManager):
+        await dialog_manager.start(state, mode=StartMode.RESET_STACK)
+
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(
+        Window(
+            Const("read"),
+            Button(Const("click"), id="click", on_click=on_read),
+            state=MainSG.read,
+        ),
+        Window(
+            Format("write {counter}"),
+            Button(Const("click"), id="click", on_click=on_write),
+            state=MainSG.write,
+            getter=getter,
+        ),
+    ))
+    dp.message.register(start, CommandStart())
+    message_manager = EditingMessageManager()
+    stats = StorageStats()
+    setup_dialogs(
+        dp,
+        message_manager=message_manager,
+        storage_stats=stats,
+        dialog_storage=MemoryVersionedDialogStorage() if optimistic else None,
+        conflict_retries=concurrency,
+    )
+    client = BotClient(dp)
+    await client.send("/start")
+    locator = InlineButtonTextLocator("click")
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        message = message_manager.last_message()
+        await asyncio.gather(*(
+            client.click(message, locator) for _ in range(concurrency)
+        ))
+    return (time.perf_counter() - started) / ROUNDS, stats.conflicts
+
+
+async def main():
+    for state in MainSG.__all_states__:
+        for concurrency in CONCURRENCY:
+            locks, _ = await run(state, concurrency, optimistic=False)
+            optimistic, conflicts = await run(
+                state, concurrency, optimistic=True,
+            )
+            print(  # noqa: T201
+                f"{state.state:<13} x{concurrency:<3} "
+                f"locks: {locks * 1e3:.1f} ms, "
+                f"optimistic: {optimistic * 1e3:.1f} ms, "
+                f"conflicts: {conflicts}",
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
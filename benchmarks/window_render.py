@@ -0,0 +1,93 @@
+"""
+Compare sequential and concurrent rendering of window parts.
+
+Text, keyboard and media widgets emulate async work (i18n lookup,
+remote template etc.) with `asyncio.sleep`.
+
+Run: python benchmarks/window_render.py
+"""
+import asyncio
+import time
+
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import ContentType, Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.api.entities import MediaAttachment
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.kbd import Button
+from aiogram_dialog.widgets.media import Media
+from aiogram_dialog.widgets.text import Text
+
+DELAY = 0.01
+ROUNDS = 50
+
+
+class MainSG(StatesGroup):
+    sequential = State()
+    concurrent = State()
+
+
+class SlowText(Text):
+    async def _render_text(self, data, manager: DialogManager) -> str:
+        await asyncio.sleep(DELAY)
+        return "text"
+
+
+class SlowMedia(Media):
+    async def _render_media(
+            self, data, manager: DialogManager,
+    ) -> MediaAttachment:
+        await asyncio.sleep(DELAY)
+        return MediaAttachment(ContentType.PHOTO, url="https://example.com")
+
+
+def slow_window(state: State, concurrent_render: bool) -> Window:
+    return Window(
+        SlowText(),
+        Button(SlowText(), id="button"),
+        SlowMedia(),
+        state=state,
+        concurrent_render=concurrent_render,
+    )
+
+
+async def run(state: State) -> float:
+    async def start(message: Message, dialog_manager: DialogManager):
+        await dialog_manager.start(state, mode=StartMode.RESET_STACK)
+
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(
+        slow_window(MainSG.sequential, concurrent_render=False),
+        slow_window(MainSG.concurrent, concurrent_render=True),
+    ))
+    dp.message.register(start, CommandStart())
+    setup_dialogs(dp, message_manager=MockMessageManager())
+    client = BotClient(dp)
+
+    await client.send("/start")  # warm up
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await client.send("/start")
+    return (time.perf_counter() - started) / ROUNDS
+
+
+async def main():
+    sequential = await run(MainSG.sequential)
+    concurrent = await run(MainSG.concurrent)
+    print(f"sequential: {sequential * 1000:.1f} ms per render")  # noqa: T201
+    print(f"concurrent: {concurrent * 1000:.1f} ms per render")  # noqa: T201
+    print(f"speedup: {sequential / concurrent:.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -12,6 +12,7 @@ __all__ = [
     "DialogManager",
     "DialogProtocol",
     "LaunchMode",
+    "OutdatedClickMode",
     "ShowMode",
     "StartMode",
     "SubManager",
@@ -29,6 +30,7 @@ from .api.entities import (
     ChatEvent,
     Data,
     LaunchMode,
+    OutdatedClickMode,
     ShowMode,
     StartMode,
 )
@@ -14,11 +14,14 @@ __all__ = [
     "DialogUpdateEvent",
     "EventContext",
     "LaunchMode",
+    "Lazy",
     "MarkupVariant",
     "MediaAttachment",
     "MediaId",
     "NewMessage",
     "OldMessage",
+    "OutdatedClickMode",
+    "RenderData",
     "ShowMode",
     "Stack",
     "StartMode",
@@ -30,8 +33,9 @@ from .context import Context, Data
 from .events import EVENT_CONTEXT_KEY, ChatEvent, EventContext
 from .launch_mode import LaunchMode
 from .media import MediaAttachment, MediaId
-from .modes import ShowMode, StartMode
+from .modes import OutdatedClickMode, ShowMode, StartMode
 from .new_message import MarkupVariant, NewMessage, OldMessage, UnknownText
+from .render_data import Lazy, RenderData
 from .stack import DEFAULT_STACK_ID, GROUP_STACK_ID, Stack
 from .update_event import (
     DIALOG_EVENT_NAME,
@@ -62,3 +62,25 @@ class StartMode(Enum):
     NORMAL = "NORMAL"
     RESET_STACK = "RESET_STACK"
     NEW_STACK = "NEW_STACK"
+
+
+class OutdatedClickMode(Enum):
+    """
+    Modes of processing clicks on buttons of outdated dialog messages.
+
+    **RAISE**:
+        default mode.
+
+        `OutdatedIntent` is raised, so it can be processed by errors
+        handlers.
+
+    **ANSWER**:
+        answer callback query and do nothing else.
+
+    **SHOW**:
+        answer callback query and show the current dialog again.
+    """
+
+    RAISE = "RAISE"
+    ANSWER = "ANSWER"
+    SHOW = "SHOW"
@@ -36,6 +36,7 @@ class OldMessage:
     has_reply_keyboard: bool = False
     business_connection_id: str | None = None
     content_type: ContentType | None = None
+    digest: str | None = None
 
 
 @dataclass
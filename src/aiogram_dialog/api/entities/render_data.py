@@ -0,0 +1,100 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from inspect import isawaitable
+from typing import Any
+
+from aiogram_dialog.api.exceptions import LazyDataNotLoaded
+
+
+class Lazy:
+    """
+    Value of getter data which is calculated on first access.
+
+    Provider is called without arguments and can return an awaitable.
+    Window is rendered again after async values are loaded.
+    """
+
+    def __init__(self, provider: Callable[[], Any | Awaitable[Any]]):
+        self.provider = provider
+
+    def __repr__(self) -> str:
+        return f"Lazy({self.provider!r})"
+
+
+class RenderData(dict):
+    """
+    Data passed to widgets, resolves `Lazy` values on access.
+
+    Async values are started once and `LazyDataNotLoaded` is raised
+    until they are loaded with `load_pending`.
+    Copies share started loads with the original data.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._loads: dict[Any, asyncio.Future] = {}
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if not isinstance(value, Lazy):
+            return value
+        future = self._loads.get(key)
+        if future is None:
+            value = value.provider()
+            if not isawaitable(value):
+                super().__setitem__(key, value)
+                return value
+            future = self._loads[key] = asyncio.ensure_future(value)
+        if not future.done():
+            raise LazyDataNotLoaded(key)
+        value = future.result()
+        super().__setitem__(key, value)
+        return value
+
+    def __iter__(self) -> Iterator:
+        # `dict(data)` and `{**data}` read values via `__getitem__`
+        return super().__iter__()
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
+
+    def copy(self) -> "RenderData":
+        data = RenderData(super().items())
+        data._loads = self._loads
+        return data
+
+    def is_loading(self, key) -> bool:
+        return key in self._loads
+
+    async def load_pending(self) -> None:
+        """Wait for all started async values."""
+        for future in list(self._loads.values()):
+            await future
+
+    def resolve(self, keys: Iterable | None = None) -> dict:
+        """
+        Get plain dict with lazy values loaded for selected keys.
+
+        Other lazy values are not included. Loads of all selected keys
+        are started before `LazyDataNotLoaded` is raised
+        """
+        if keys is None:
+            keys = list(self)
+        result = {
+            key: value
+            for key, value in super().items()
+            if not isinstance(value, Lazy)
+        }
+        not_loaded = None
+        for key in keys:
+            if key not in self:
+                continue
+            try:
+                result[key] = self[key]
+            except LazyDataNotLoaded as e:
+                not_loaded = e
+        if not_loaded:
+            raise not_loaded
+        return result
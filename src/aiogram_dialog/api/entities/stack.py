@@ -14,6 +14,10 @@ DEFAULT_STACK_ID = ""
 GROUP_STACK_ID = "<->"
 _STACK_LIMIT = 100
 _ID_SYMS = string.digits + string.ascii_letters
+# separates stack id embedded into intent id, not used in generated ids
+_INTENT_SEP = "."
+# other stack ids are not embedded to keep callback data short
+_EMBEDDED_STACK_IDS = frozenset((DEFAULT_STACK_ID, GROUP_STACK_ID))
 
 
 def new_int_id() -> int:
@@ -35,6 +39,39 @@ def new_id():
     return id_to_str(new_int_id())
 
 
+def _is_user_default_stack(stack_id: str) -> bool:
+    return stack_id.startswith("<") and stack_id[1:-1].isdigit()
+
+
+def new_intent_id(stack_id: str) -> str:
+    """
+    Generate intent id which contains the id of its stack.
+
+    Only default and group stack ids are embedded. Default stack
+    of a user is stored as `DEFAULT_STACK_ID`, as it is found again
+    for the user who sent an event.
+    """
+    if _is_user_default_stack(stack_id):
+        stack_id = DEFAULT_STACK_ID
+    if stack_id not in _EMBEDDED_STACK_IDS:
+        return new_id()
+    return stack_id + _INTENT_SEP + new_id()
+
+
+def stack_id_from_intent(intent_id: str) -> str | None:
+    """
+    Get the stack id embedded into intent id.
+
+    Returns `None` for intent ids created without the stack id.
+    Result is only a guess for default stacks and must be checked
+    against the loaded context.
+    """
+    stack_id, sep, _ = intent_id.rpartition(_INTENT_SEP)
+    if not sep:
+        return None
+    return stack_id
+
+
 @dataclass(unsafe_hash=True)
 class Stack:
     _id: str = field(compare=True, default_factory=new_id)
@@ -46,6 +83,7 @@ class Stack:
     last_income_media_group_id: str | None = field(
         compare=False, default=None,
     )
+    last_message_digest: str | None = field(compare=False, default=None)
     content_type: ContentType | None = field(compare=False, default=None)
     access_settings: AccessSettings | None = None
     has_protected_content: bool | None = field(compare=False, default=None)
@@ -61,7 +99,7 @@ class Stack:
                 f"Max count is {_STACK_LIMIT}",
             )
         context = Context(
-            _intent_id=new_id(),
+            _intent_id=new_intent_id(self.id),
             _stack_id=self.id,
             state=state,
             start_data=data,
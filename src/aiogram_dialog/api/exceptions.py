@@ -21,6 +21,10 @@ class UnknownState(DialogsError):
     pass
 
 
+class ConcurrentUpdateError(DialogsError):
+    pass
+
+
 class DialogStackOverflow(DialogsError):
     pass
 
@@ -58,3 +62,11 @@ class InvalidWidgetType(InvalidWidget):
 
 class InvalidKeyboardType(DialogsError):
     pass
+
+
+class LazyDataNotLoaded(DialogsError):
+    """Async lazy value is accessed, window is rendered again after load."""
+
+    def __init__(self, key):
+        super().__init__(f"Lazy value for {key!r} is not loaded")
+        self.key = key
@@ -1,7 +1,9 @@
 __all__ = [
     "CALLBACK_DATA_KEY",
     "CONTEXT_KEY",
+    "DIALOG_KEY",
     "EVENT_SIMULATED",
+    "PENDING_MESSAGES_KEY",
     "STACK_KEY",
     "STORAGE_KEY",
     "ButtonVariant",
@@ -13,6 +15,7 @@ __all__ = [
     "KeyboardWidget",
     "LinkPreviewWidget",
     "MediaWidget",
+    "PagedKeyboardWidget",
     "RawKeyboard",
     "ReplyCallbackQuery",
     "StyleWidget",
@@ -28,7 +31,9 @@ from .manager import (
 from .middleware import (
     CALLBACK_DATA_KEY,
     CONTEXT_KEY,
+    DIALOG_KEY,
     EVENT_SIMULATED,
+    PENDING_MESSAGES_KEY,
     STACK_KEY,
     STORAGE_KEY,
 )
@@ -39,6 +44,7 @@ from .widgets import (
     KeyboardWidget,
     LinkPreviewWidget,
     MediaWidget,
+    PagedKeyboardWidget,
     RawKeyboard,
     StyleWidget,
     TextWidget,
@@ -1,5 +1,7 @@
 STORAGE_KEY = "aiogd_storage_proxy"
 STACK_KEY = "aiogd_stack"
 CONTEXT_KEY = "aiogd_context"
+DIALOG_KEY = "aiogd_dialog"
 CALLBACK_DATA_KEY = "aiogd_original_callback_data"
 EVENT_SIMULATED = "aiogd_event_simulated"
+PENDING_MESSAGES_KEY = "aiogd_pending_messages"
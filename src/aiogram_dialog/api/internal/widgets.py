@@ -102,6 +102,46 @@ class KeyboardWidget(Widget, Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class PagedKeyboardWidget(KeyboardWidget, Protocol):
+    """
+    Keyboard which can render only a part of its contents.
+
+    Used by scrolls to avoid rendering of invisible buttons.
+    Counts are returned for the keyboard as `render_keyboard` would create it,
+    including `when` condition. `None` means the count cannot be
+    calculated without rendering, so the whole keyboard is rendered instead.
+    """
+
+    @abstractmethod
+    async def get_rows_count(
+            self, data: dict, manager: DialogManager,
+    ) -> int | None:
+        """Get number of keyboard rows."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def render_rows(
+            self, data: dict, manager: DialogManager, offset: int, limit: int,
+    ) -> RawKeyboard:
+        """Create keyboard rows from `offset` to `offset + limit`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_buttons_count(
+            self, data: dict, manager: DialogManager,
+    ) -> int | None:
+        """Get number of buttons in all rows."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def render_buttons(
+            self, data: dict, manager: DialogManager, offset: int, limit: int,
+    ) -> list[ButtonVariant]:
+        """Create buttons from `offset` to `offset + limit` of all rows."""
+        raise NotImplementedError
+
+
 @runtime_checkable
 class MediaWidget(Widget, Protocol):
     @abstractmethod
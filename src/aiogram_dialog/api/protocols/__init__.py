@@ -6,14 +6,24 @@ __all__ = [
     "DialogProtocol",
     "DialogRegistryProtocol",
     "DialogRegistryProtocol",
+    "DialogStorageProtocol",
     "MediaIdStorageProtocol",
     "MessageManagerProtocol",
     "MessageNotModified",
+    "RecordSerializerProtocol",
     "StackAccessValidator",
+    "StorageRecord",
     "UnsetId",
+    "VersionedDialogStorageProtocol",
 ]
 
 from .dialog import CancelEventProcessing, DialogProtocol
+from .dialog_storage import (
+    DialogStorageProtocol,
+    RecordSerializerProtocol,
+    StorageRecord,
+    VersionedDialogStorageProtocol,
+)
 from .manager import (
     BaseDialogManager,
     BgManagerFactory,
@@ -0,0 +1,103 @@
+from abc import abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Any, Protocol, runtime_checkable
+
+from aiogram.fsm.storage.base import StorageKey
+
+StorageRecord = dict[str, Any]
+
+
+class DialogStorageProtocol(Protocol):
+    @abstractmethod
+    async def get_many(
+            self, keys: Sequence[StorageKey],
+    ) -> list[StorageRecord]:
+        """
+        Load records for all keys using as few round-trips as possible.
+
+        Missing records are returned as empty dicts in the same order
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        """
+        Store all records using as few round-trips as possible.
+
+        Empty record means that the key should be removed
+        """
+        raise NotImplementedError
+
+    async def touch_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        """
+        Prolong expiration of records which are saved unchanged.
+
+        It is called instead of `set_many` for such records.
+        Storages without expiration do nothing
+        """
+
+
+@runtime_checkable
+class VersionedDialogStorageProtocol(DialogStorageProtocol, Protocol):
+    """
+    Dialog storage with versioned records and compare-and-set writes.
+
+    Using such storage enables optimistic mode: stacks are not locked
+    while an event is processed, instead its changes are saved only if
+    records read by the event were not changed by others.
+    """
+
+    @abstractmethod
+    async def get_many_versioned(
+            self, keys: Sequence[StorageKey],
+    ) -> list[tuple[StorageRecord, int]]:
+        """
+        Load records with their versions.
+
+        Missing records are returned as empty dicts with version 0
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def compare_and_set_many(
+            self,
+            expected: Mapping[StorageKey, int],
+            items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> list[int] | None:
+        """
+        Store all records if `expected` versions are still actual.
+
+        Check and write must be atomic. Versions of stored records are
+        increased and returned in the same order, `None` is returned if
+        any of expected versions has changed
+        """
+        raise NotImplementedError
+
+
+class RecordSerializerProtocol(Protocol):
+    """
+    Converts plain context and stack fields to storage records and back.
+
+    Plain fields are the ones accepted by `Context` and `Stack` with
+    state and access settings already converted to builtin types.
+    """
+
+    @abstractmethod
+    def dump_context(self, data: StorageRecord) -> StorageRecord:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_context(self, record: StorageRecord) -> StorageRecord:
+        raise NotImplementedError
+
+    @abstractmethod
+    def dump_stack(self, data: StorageRecord) -> StorageRecord:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_stack(self, record: StorageRecord) -> StorageRecord:
+        raise NotImplementedError
@@ -14,3 +14,12 @@ class DialogRegistryProtocol(Protocol):
     @abstractmethod
     def states_groups(self) -> dict[str, type[StatesGroup]]:
         raise NotImplementedError
+
+    def states_index(self) -> dict[str, State]:
+        """
+        Get all registered states by their string representation.
+
+        Empty index is returned by default, so states are searched
+        in `states_groups` instead.
+        """
+        return {}
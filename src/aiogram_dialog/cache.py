@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from cachetools import TTLCache
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class StatsTTLCache(TTLCache):
+    """LRU cache with TTL which counts evictions into `CacheStats`."""
+
+    def __init__(self, maxsize: int, ttl: float, stats: CacheStats):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.stats = stats
+
+    def popitem(self):
+        item = super().popitem()
+        self.stats.evictions += 1
+        return item
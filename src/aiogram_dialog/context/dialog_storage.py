@@ -0,0 +1,232 @@
+import asyncio
+from collections.abc import Mapping, Sequence
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+from aiogram.fsm.storage.base import BaseStorage, StorageKey
+
+from aiogram_dialog.api.protocols import (
+    DialogStorageProtocol,
+    StorageRecord,
+    VersionedDialogStorageProtocol,
+)
+from aiogram_dialog.cache import CacheStats, StatsTTLCache
+
+if TYPE_CHECKING:
+    from aiogram.fsm.storage.redis import RedisStorage
+
+
+class FsmDialogStorage(DialogStorageProtocol):
+    """
+    Adapter for any aiogram FSM storage.
+
+    Storage has no batch API, so requests are sent concurrently
+    """
+
+    def __init__(self, storage: BaseStorage):
+        self.storage = storage
+
+    async def get_many(
+            self, keys: Sequence[StorageKey],
+    ) -> list[StorageRecord]:
+        if len(keys) == 1:
+            return [await self.storage.get_data(keys[0])]
+        return list(await asyncio.gather(*(
+            self.storage.get_data(key) for key in keys
+        )))
+
+    async def set_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        if len(items) == 1:
+            key, data = items[0]
+            await self.storage.set_data(key=key, data=data)
+            return
+        await asyncio.gather(*(
+            self.storage.set_data(key=key, data=data)
+            for key, data in items
+        ))
+
+    async def touch_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        # e.g. `RedisStorage.data_ttl`, expiration is reset by writing
+        if getattr(self.storage, "data_ttl", None):
+            await self.set_many(items)
+
+
+class RedisDialogStorage(DialogStorageProtocol):
+    """
+    Adapter for aiogram `RedisStorage` using single round-trip per batch.
+
+    Keys and data format are the same as used by `RedisStorage` itself
+    """
+
+    def __init__(self, storage: "RedisStorage"):
+        self.storage = storage
+
+    def _redis_key(self, key: StorageKey) -> str:
+        return self.storage.key_builder.build(key, "data")
+
+    async def get_many(
+            self, keys: Sequence[StorageKey],
+    ) -> list[StorageRecord]:
+        if not keys:
+            return []
+        values = await self.storage.redis.mget(
+            [self._redis_key(key) for key in keys],
+        )
+        result = []
+        for value in values:
+            if value is None:
+                result.append({})
+                continue
+            if isinstance(value, bytes):
+                value = value.decode("utf-8")
+            result.append(self.storage.json_loads(value))
+        return result
+
+    async def set_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        if not items:
+            return
+        async with self.storage.redis.pipeline(transaction=False) as pipe:
+            for key, data in items:
+                redis_key = self._redis_key(key)
+                if not data:
+                    pipe.delete(redis_key)
+                else:
+                    pipe.set(
+                        redis_key,
+                        self.storage.json_dumps(data),
+                        ex=self.storage.data_ttl,
+                    )
+            await pipe.execute()
+
+    async def touch_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        ttl = self.storage.data_ttl
+        if not ttl or not items:
+            return
+        async with self.storage.redis.pipeline(transaction=False) as pipe:
+            for key, data in items:
+                if data:
+                    pipe.expire(self._redis_key(key), ttl)
+            await pipe.execute()
+
+
+class MemoryVersionedDialogStorage(VersionedDialogStorageProtocol):
+    """
+    In-memory storage with versioned records.
+
+    Data is not shared between processes, so it is a stand-in for tests
+    and benchmarks of optimistic mode. Shared storages can implement
+    the same using Redis `WATCH`/`MULTI` or a Lua script
+    """
+
+    def __init__(self):
+        # removed records are kept empty, so versions never go back
+        self.records: dict[StorageKey, tuple[StorageRecord, int]] = {}
+
+    def _version(self, key: StorageKey) -> int:
+        _, version = self.records.get(key, ({}, 0))
+        return version
+
+    async def get_many(
+            self, keys: Sequence[StorageKey],
+    ) -> list[StorageRecord]:
+        return [
+            data for data, _ in await self.get_many_versioned(keys)
+        ]
+
+    async def get_many_versioned(
+            self, keys: Sequence[StorageKey],
+    ) -> list[tuple[StorageRecord, int]]:
+        result = []
+        for key in keys:
+            data, version = self.records.get(key, ({}, 0))
+            result.append((deepcopy(data), version))
+        return result
+
+    async def set_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        await self.compare_and_set_many({}, items)
+
+    async def compare_and_set_many(
+            self,
+            expected: Mapping[StorageKey, int],
+            items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> list[int] | None:
+        for key, version in expected.items():
+            if self._version(key) != version:
+                return None
+        versions = []
+        for key, data in items:
+            version = self._version(key) + 1
+            self.records[key] = (deepcopy(data), version)
+            versions.append(version)
+        return versions
+
+
+class CachedDialogStorage(DialogStorageProtocol):
+    """
+    Per-process write-through LRU cache with TTL.
+
+    All writes made by this process go through the cache, and events for
+    the same stack are serialized by events isolation, so records stay
+    coherent. Changes made by other processes are seen after `ttl` expires
+    """
+
+    def __init__(
+            self,
+            storage: DialogStorageProtocol,
+            maxsize: int = 10240,
+            ttl: float = 60,
+    ):
+        self.storage = storage
+        self.stats = CacheStats()
+        self.cache = StatsTTLCache(
+            maxsize=maxsize, ttl=ttl, stats=self.stats,
+        )
+
+    async def get_many(
+            self, keys: Sequence[StorageKey],
+    ) -> list[StorageRecord]:
+        result = [self.cache.get(key) for key in keys]
+        missing = [
+            key
+            for key, data in zip(keys, result, strict=True)
+            if data is None
+        ]
+        self.stats.hits += len(keys) - len(missing)
+        self.stats.misses += len(missing)
+        loaded = {}
+        if missing:
+            records = await self.storage.get_many(missing)
+            loaded = dict(zip(missing, records, strict=True))
+            for key, data in loaded.items():
+                self.cache[key] = deepcopy(data)
+        return [
+            loaded[key] if data is None else deepcopy(data)
+            for key, data in zip(keys, result, strict=True)
+        ]
+
+    async def set_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        try:
+            await self.storage.set_many(items)
+        except:
+            for key, _ in items:
+                self.cache.pop(key, None)
+            raise
+        for key, data in items:
+            self.cache[key] = deepcopy(data)
+
+    async def touch_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        await self.storage.touch_many(items)
@@ -1,4 +1,5 @@
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from logging import getLogger
 from typing import Any
 
@@ -17,24 +18,32 @@ from aiogram.types.error_event import ErrorEvent
 
 from aiogram_dialog.api.entities import (
     DEFAULT_STACK_ID,
+    DIALOG_EVENT_NAME,
     EVENT_CONTEXT_KEY,
     ChatEvent,
     Context,
+    DialogAction,
     DialogUpdate,
     DialogUpdateEvent,
     EventContext,
+    OutdatedClickMode,
     Stack,
 )
+from aiogram_dialog.api.entities.stack import stack_id_from_intent
 from aiogram_dialog.api.exceptions import (
+    ConcurrentUpdateError,
     InvalidStackIdError,
     OutdatedIntent,
     UnknownIntent,
     UnknownState,
+    UnregisteredDialogError,
 )
 from aiogram_dialog.api.internal import (
     CALLBACK_DATA_KEY,
     CONTEXT_KEY,
+    DIALOG_KEY,
     EVENT_SIMULATED,
+    PENDING_MESSAGES_KEY,
     STACK_KEY,
     STORAGE_KEY,
     ReplyCallbackQuery,
@@ -44,11 +53,18 @@ from aiogram_dialog.api.protocols import (
     StackAccessValidator,
 )
 from aiogram_dialog.utils import remove_intent_id, split_reply_callback
-from .storage import StorageProxy
+from .storage import StorageProxy, StorageProxyFactory
 
 logger = getLogger(__name__)
 
 FORBIDDEN_STACK_KEY = "aiogd_stack_forbidden"
+OUTDATED_STACK_KEY = "aiogd_outdated_stack"
+
+
+@dataclass
+class OutdatedClickStats:
+    clicks: int = 0
+    reshown: int = 0
 
 
 def get_thread_id(message: Message) -> int | None:
@@ -149,41 +165,78 @@ class IntentMiddlewareFactory:
             registry: DialogRegistryProtocol,
             access_validator: StackAccessValidator,
             events_isolation: BaseEventIsolation,
+            storage_proxy_factory: StorageProxyFactory | None = None,
+            outdated_click_mode: OutdatedClickMode = OutdatedClickMode.RAISE,
+            outdated_click_stats: OutdatedClickStats | None = None,
     ):
         super().__init__()
         self.registry = registry
         self.access_validator = access_validator
         self.events_isolation = events_isolation
+        if storage_proxy_factory is None:
+            storage_proxy_factory = StorageProxyFactory(
+                registry=registry,
+                events_isolation=events_isolation,
+            )
+        self.storage_proxy_factory = storage_proxy_factory
+        self.outdated_click_mode = outdated_click_mode
+        if outdated_click_stats is None:
+            outdated_click_stats = OutdatedClickStats()
+        self.outdated_click_stats = outdated_click_stats
 
     def storage_proxy(
             self, event_context: EventContext, fsm_storage: BaseStorage,
     ) -> StorageProxy:
-        return StorageProxy(
-            bot=event_context.bot,
-            storage=fsm_storage,
-            events_isolation=self.events_isolation,
-            state_groups=self.registry.states_groups(),
-            user_id=event_context.user.id,
-            chat_id=event_context.chat.id,
-            thread_id=event_context.thread_id,
-            business_connection_id=event_context.business_connection_id,
-        )
+        return self.storage_proxy_factory(event_context, fsm_storage)
+
+    def _is_outdated(self, intent_id: str, stack: Stack) -> bool:
+        return stack.empty() or intent_id != stack.last_intent_id()
 
     def _check_outdated(self, intent_id: str, stack: Stack):
         """Check if intent id is outdated for stack."""
-        if stack.empty():
-            raise OutdatedIntent(
-                stack.id,
-                f"Outdated intent id ({intent_id}) "
-                f"for stack ({stack.id})",
-            )
-        if intent_id != stack.last_intent_id():
+        if self._is_outdated(intent_id, stack):
             raise OutdatedIntent(
                 stack.id,
                 f"Outdated intent id ({intent_id}) "
                 f"for stack ({stack.id})",
             )
 
+    def _skips_outdated(self, event: ChatEvent) -> bool:
+        """Check if outdated event is processed without raising errors."""
+        return (
+            isinstance(event, CallbackQuery)
+            and self.outdated_click_mode is not OutdatedClickMode.RAISE
+        )
+
+    async def _process_outdated_click(
+            self,
+            event: CallbackQuery,
+            stack: Stack,
+            data: dict,
+    ):
+        if not isinstance(event, ReplyCallbackQuery):
+            # reply keyboard click is a message, nothing to answer
+            await event.answer()
+        if (
+                self.outdated_click_mode is not OutdatedClickMode.SHOW
+                or stack.empty()
+        ):
+            return None
+        self.outdated_click_stats.reshown += 1
+        event_context: EventContext = data[EVENT_CONTEXT_KEY]
+        update = DialogUpdateEvent(
+            action=DialogAction.UPDATE,
+            data={},
+            from_user=event_context.user,
+            chat=event_context.chat,
+            intent_id=None,
+            stack_id=stack.id,
+            thread_id=event_context.thread_id,
+            business_connection_id=event_context.business_connection_id,
+        ).as_(data["bot"])
+        router: Router = data["event_router"]
+        return await router.propagate_event(DIALOG_EVENT_NAME, update, **data)
+
     async def _load_stack(
             self,
             event: ChatEvent,
@@ -195,6 +248,11 @@ class IntentMiddlewareFactory:
             raise InvalidStackIdError("Both stack id and intent id are None")
         return await proxy.load_stack(stack_id)
 
+    def _overrides_load_stack(self) -> bool:
+        # stack and context are loaded together only by default loader
+        load_stack = self._load_stack.__func__
+        return load_stack is not IntentMiddlewareFactory._load_stack
+
     async def _load_context_by_stack(
             self,
             event: ChatEvent,
@@ -244,15 +302,24 @@ class IntentMiddlewareFactory:
             "Loading context for intent: `%s`, user: `%s`, chat: `%s`",
             intent_id, proxy.user_id, proxy.chat_id,
         )
-        context = await proxy.load_context(intent_id)
-        stack = await self._load_stack(event, context.stack_id, proxy, data)
-        if not stack:
-            return
-        try:
-            self._check_outdated(intent_id, stack)
-        except:
+        stack_id = stack_id_from_intent(intent_id)
+        if stack_id is None or self._overrides_load_stack():
+            context = await proxy.load_context(intent_id)
+            stack = await self._load_stack(
+                event, context.stack_id, proxy, data,
+            )
+            if not stack:
+                return
+        else:
+            context, stack = await proxy.load_intent(intent_id, stack_id)
+        if self._is_outdated(intent_id, stack):
+            if isinstance(event, CallbackQuery):
+                self.outdated_click_stats.clicks += 1
             await proxy.unlock()
-            raise
+            if self._skips_outdated(event):
+                data[OUTDATED_STACK_KEY] = stack
+                return
+            self._check_outdated(intent_id, stack)
 
         if not await self.access_validator.is_allowed(
                 stack, context, event, data,
@@ -418,6 +485,11 @@ class IntentMiddlewareFactory:
             data[CALLBACK_DATA_KEY] = original_data
         else:
             await self._load_default_context(event, data, event_context)
+        outdated_stack = data.pop(OUTDATED_STACK_KEY, None)
+        if outdated_stack is not None:
+            return await self._process_outdated_click(
+                event, outdated_stack, data,
+            )
         result = await handler(event, data)
         if result is UNHANDLED and data.get(FORBIDDEN_STACK_KEY):
             await event.answer()
@@ -438,32 +510,106 @@ async def context_saver_middleware(handler, event, data):
     result = await handler(event, data)
     proxy: StorageProxy = data.pop(STORAGE_KEY, None)
     if proxy:
-        await proxy.save_context(data.pop(CONTEXT_KEY))
-        await proxy.save_stack(data.pop(STACK_KEY))
+        await proxy.save(data.pop(CONTEXT_KEY), data.pop(STACK_KEY))
     return result
 
 
+def submit_pending_messages(pending: list[Callable[[], Any]]) -> None:
+    """Send messages deferred by dialog manager, after changes are saved."""
+    for submit in pending:
+        submit()
+
+
 async def context_unlocker_middleware(handler, event, data):
     proxy: StorageProxy = data.get(STORAGE_KEY, None)
+    pending = data[PENDING_MESSAGES_KEY] = []
     try:
         result = await handler(event, data)
     finally:
         if proxy:
             await proxy.unlock()
+    submit_pending_messages(pending)
     return result
 
 
+class ConflictRetryMiddleware(BaseMiddleware):
+    """
+    Process event again if its changes conflict with concurrent ones.
+
+    Used in optimistic mode. Handlers are called again, so any actions
+    they have done before the conflict (like sending messages) are
+    repeated.
+    """
+
+    def __init__(self, retries: int):
+        super().__init__()
+        self.retries = retries
+
+    async def __call__(
+            self,
+            handler: Callable[
+                [ChatEvent, dict[str, Any]], Awaitable[Any],
+            ],
+            event: ChatEvent,
+            data: dict[str, Any],
+    ) -> Any:
+        for attempt in range(self.retries):
+            try:
+                return await handler(event, dict(data))
+            except ConcurrentUpdateError:  # noqa: PERF203
+                logger.debug("Conflict on attempt %s, retrying", attempt)
+        return await handler(event, data)
+
+
+class DialogResolverMiddleware(BaseMiddleware):
+    """
+    Find a dialog for the loaded context using registry.
+
+    Dialogs check found one instead of running their filters,
+    so only the dialog for current state processes the event.
+    """
+
+    def __init__(self, registry: DialogRegistryProtocol):
+        super().__init__()
+        self.registry = registry
+
+    async def __call__(
+            self,
+            handler: Callable[
+                [ChatEvent, dict[str, Any]], Awaitable[Any],
+            ],
+            event: ChatEvent,
+            data: dict[str, Any],
+    ) -> Any:
+        context: Context | None = data.get(CONTEXT_KEY)
+        dialog = None
+        if context is not None:
+            try:
+                dialog = self.registry.find_dialog(context.state)
+            except UnregisteredDialogError:
+                logger.debug("No dialog found for state %s", context.state)
+        data[DIALOG_KEY] = dialog
+        return await handler(event, data)
+
+
 class IntentErrorMiddleware(BaseMiddleware):
     def __init__(
             self,
             registry: DialogRegistryProtocol,
             access_validator: StackAccessValidator,
             events_isolation: BaseEventIsolation,
+            storage_proxy_factory: StorageProxyFactory | None = None,
     ):
         super().__init__()
         self.registry = registry
         self.events_isolation = events_isolation
         self.access_validator = access_validator
+        if storage_proxy_factory is None:
+            storage_proxy_factory = StorageProxyFactory(
+                registry=registry,
+                events_isolation=events_isolation,
+            )
+        self.storage_proxy_factory = storage_proxy_factory
 
     def _is_error_supported(
             self, event: ErrorEvent, data: dict[str, Any],
@@ -516,21 +662,15 @@ class IntentErrorMiddleware(BaseMiddleware):
         if not self._is_error_supported(event, data):
             return await handler(event, data)
 
+        pending = data[PENDING_MESSAGES_KEY] = []
         try:
             event_context = event_context_from_error(event)
             data[EVENT_CONTEXT_KEY] = event_context
-            proxy = StorageProxy(
-                bot=event_context.bot,
-                storage=data["fsm_storage"],
-                events_isolation=self.events_isolation,
-                state_groups=self.registry.states_groups(),
-                user_id=event_context.user.id,
-                chat_id=event_context.chat.id,
-                thread_id=event_context.thread_id,
-                business_connection_id=event_context.business_connection_id,
+            proxy = self.storage_proxy_factory(
+                event_context, data["fsm_storage"],
             )
             data[STORAGE_KEY] = proxy
-            stack = await self._load_stack(proxy, event)
+            stack = await self._load_stack(proxy, error)
             if stack.empty() or isinstance(error, UnknownState):
                 context = None
             else:
@@ -557,7 +697,5 @@ class IntentErrorMiddleware(BaseMiddleware):
             proxy: StorageProxy = data.pop(STORAGE_KEY, None)
             if proxy:
                 await proxy.unlock()
-                context = data.pop(CONTEXT_KEY)
-                if context is not None:
-                    await proxy.save_context(context)
-                await proxy.save_stack(data.pop(STACK_KEY))
+                await proxy.save(data.pop(CONTEXT_KEY), data.pop(STACK_KEY))
+            submit_pending_messages(pending)
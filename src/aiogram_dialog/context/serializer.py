@@ -0,0 +1,175 @@
+import json
+import zlib
+from base64 import b85decode, b85encode
+from copy import copy
+from typing import Any
+
+from aiogram_dialog.api.protocols import (
+    RecordSerializerProtocol,
+    StorageRecord,
+)
+
+COMPACT_VERSION = 1
+VERSION_TAG = "v"
+COMPRESSED_DIALOG_DATA_TAG = "z"
+
+CONTEXT_TAGS = {
+    "_intent_id": "i",
+    "_stack_id": "s",
+    "state": "t",
+    "start_data": "a",
+    "dialog_data": "d",
+    "widget_data": "w",
+    "access_settings": "u",
+}
+STACK_TAGS = {
+    "_id": "i",
+    "intents": "n",
+    "last_message_id": "m",
+    "last_reply_keyboard": "k",
+    "last_media_id": "f",
+    "last_media_unique_id": "q",
+    "last_income_media_group_id": "g",
+    "last_message_digest": "h",
+}
+
+# values equal to defaults are not stored
+_CONTEXT_DEFAULTS: dict[str, Any] = {
+    "start_data": None,
+    "dialog_data": {},
+    "widget_data": {},
+    "access_settings": None,
+}
+_STACK_DEFAULTS: dict[str, Any] = {
+    "intents": [],
+    "last_message_id": None,
+    "last_reply_keyboard": False,
+    "last_media_id": None,
+    "last_media_unique_id": None,
+    "last_income_media_group_id": None,
+    "last_message_digest": None,
+}
+
+
+class DictRecordSerializer(RecordSerializerProtocol):
+    """
+    Default format, fields are stored as is.
+
+    Compact records are still read, so they are converted back
+    on the next write.
+    """
+
+    def dump_context(self, data: StorageRecord) -> StorageRecord:
+        return data
+
+    def load_context(self, record: StorageRecord) -> StorageRecord:
+        if VERSION_TAG in record:
+            return CompactRecordSerializer().load_context(record)
+        return record
+
+    def dump_stack(self, data: StorageRecord) -> StorageRecord:
+        return data
+
+    def load_stack(self, record: StorageRecord) -> StorageRecord:
+        if VERSION_TAG in record:
+            return CompactRecordSerializer().load_stack(record)
+        return record
+
+
+def _pack(
+        data: StorageRecord, tags: dict[str, str], defaults: dict[str, Any],
+) -> StorageRecord:
+    record = {VERSION_TAG: COMPACT_VERSION}
+    for name, value in data.items():
+        if name in defaults and value == defaults[name]:
+            continue
+        record[tags[name]] = value
+    return record
+
+
+def _unpack(
+        record: StorageRecord, tags: dict[str, str],
+        defaults: dict[str, Any],
+) -> StorageRecord:
+    data = {}
+    for name, tag in tags.items():
+        if tag in record:
+            data[name] = record[tag]
+        elif name in defaults:
+            data[name] = copy(defaults[name])
+    return data
+
+
+class CompactRecordSerializer(RecordSerializerProtocol):
+    """
+    Stores records with short field tags and without default values.
+
+    It is enabled with `setup_dialogs(record_serializer=...)`. Versions
+    without this serializer cannot read such records.
+
+    If `compress_threshold` is set, `dialog_data` which is longer than this
+    number of bytes in JSON is stored zlib-compressed.
+    Records in plain dict format are still read, so they are migrated
+    on the next write.
+    """
+
+    def __init__(self, compress_threshold: int | None = None):
+        self.compress_threshold = compress_threshold
+
+    def _compress(self, record: StorageRecord) -> None:
+        dialog_data = record.get(CONTEXT_TAGS["dialog_data"])
+        if not dialog_data:
+            return
+        try:
+            raw = json.dumps(dialog_data, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return  # cannot compress, keep as is
+        if json.loads(raw) != dialog_data:
+            return  # e.g. int keys or tuples, JSON would change them
+        raw = raw.encode("utf-8")
+        if len(raw) <= self.compress_threshold:
+            return
+        del record[CONTEXT_TAGS["dialog_data"]]
+        record[COMPRESSED_DIALOG_DATA_TAG] = b85encode(
+            zlib.compress(raw),
+        ).decode("ascii")
+
+    def _decompress(self, record: StorageRecord) -> None:
+        compressed = record.pop(COMPRESSED_DIALOG_DATA_TAG, None)
+        if compressed is None:
+            return
+        record[CONTEXT_TAGS["dialog_data"]] = json.loads(
+            zlib.decompress(b85decode(compressed)),
+        )
+
+    def dump_context(self, data: StorageRecord) -> StorageRecord:
+        record = _pack(data, CONTEXT_TAGS, _CONTEXT_DEFAULTS)
+        access_tag = CONTEXT_TAGS["access_settings"]
+        if access_settings := record.get(access_tag):
+            record[access_tag] = [
+                access_settings["user_ids"], access_settings["custom"],
+            ]
+        if self.compress_threshold is not None:
+            self._compress(record)
+        return record
+
+    def load_context(self, record: StorageRecord) -> StorageRecord:
+        if VERSION_TAG not in record:
+            return record
+        record = dict(record)
+        self._decompress(record)
+        data = _unpack(record, CONTEXT_TAGS, _CONTEXT_DEFAULTS)
+        if access_settings := data["access_settings"]:
+            user_ids, custom = access_settings
+            data["access_settings"] = {"user_ids": user_ids, "custom": custom}
+        return data
+
+    def dump_stack(self, data: StorageRecord) -> StorageRecord:
+        if not data:
+            return data
+        return _pack(data, STACK_TAGS, _STACK_DEFAULTS)
+
+    def load_stack(self, record: StorageRecord) -> StorageRecord:
+        if VERSION_TAG not in record:
+            return record
+        return _unpack(record, STACK_TAGS, _STACK_DEFAULTS)
@@ -1,5 +1,7 @@
+from collections.abc import Sequence
 from contextlib import AsyncExitStack
-from copy import copy
+from copy import copy, deepcopy
+from dataclasses import dataclass
 
 from aiogram import Bot
 from aiogram.fsm.state import State, StatesGroup
@@ -13,12 +15,41 @@ from aiogram_dialog.api.entities import (
     DEFAULT_STACK_ID,
     AccessSettings,
     Context,
+    EventContext,
     Stack,
 )
-from aiogram_dialog.api.exceptions import UnknownIntent, UnknownState
+from aiogram_dialog.api.exceptions import (
+    ConcurrentUpdateError,
+    UnknownIntent,
+    UnknownState,
+)
+from aiogram_dialog.api.protocols import (
+    DialogRegistryProtocol,
+    DialogStorageProtocol,
+    RecordSerializerProtocol,
+    StorageRecord,
+    VersionedDialogStorageProtocol,
+)
+from .dialog_storage import FsmDialogStorage
+from .serializer import DictRecordSerializer
+
+
+@dataclass
+class StorageStats:
+    writes: int = 0
+    skipped_writes: int = 0
+    conflicts: int = 0
 
 
 class StorageProxy:
+    """
+    Loads and saves dialog records for a single event.
+
+    With versioned dialog storage stacks are not locked. Versions of all
+    read records are remembered instead and checked when saving, so
+    `ConcurrentUpdateError` is raised if any of them was changed.
+    """
+
     def __init__(
             self,
             storage: BaseStorage,
@@ -29,18 +60,62 @@ class StorageProxy:
             business_connection_id: str | None,
             bot: Bot,
             state_groups: dict[str, type[StatesGroup]],
+            dialog_storage: DialogStorageProtocol | None = None,
+            stats: StorageStats | None = None,
+            serializer: RecordSerializerProtocol | None = None,
+            states_index: dict[str, State] | None = None,
     ):
         self.storage = storage
+        if dialog_storage is None:
+            dialog_storage = FsmDialogStorage(storage)
+        self.dialog_storage = dialog_storage
+        self.optimistic = isinstance(
+            dialog_storage, VersionedDialogStorageProtocol,
+        )
         self.events_isolation = events_isolation
         self.state_groups = state_groups
+        self.states_index = states_index
         self.user_id = user_id
         self.chat_id = chat_id
         self.thread_id = thread_id
         self.business_connection_id = business_connection_id
         self.bot = bot
         self.lock_stack = AsyncExitStack()
+        if stats is None:
+            stats = StorageStats()
+        self.stats = stats
+        if serializer is None:
+            serializer = DictRecordSerializer()
+        self.serializer = serializer
+        # records as they are known to be in storage, used to skip writes
+        self._snapshots: dict[StorageKey, StorageRecord] = {}
+        # versions of records read or written in optimistic mode
+        self._versions: dict[StorageKey, int] = {}
+
+    def detached(self) -> "StorageProxy":
+        """
+        Create proxy with the same settings for a separate operation.
+
+        Records read by this proxy are not checked when saving by new one.
+        """
+        return StorageProxy(
+            storage=self.storage,
+            events_isolation=self.events_isolation,
+            user_id=self.user_id,
+            chat_id=self.chat_id,
+            thread_id=self.thread_id,
+            business_connection_id=self.business_connection_id,
+            bot=self.bot,
+            state_groups=self.state_groups,
+            dialog_storage=self.dialog_storage,
+            stats=self.stats,
+            serializer=self.serializer,
+            states_index=self.states_index,
+        )
 
     async def lock(self, key: StorageKey):
+        if self.optimistic:
+            return
         await self.lock_stack.enter_async_context(
             self.events_isolation.lock(key),
         )
@@ -48,14 +123,80 @@ class StorageProxy:
     async def unlock(self):
         await self.lock_stack.aclose()
 
-    async def load_context(self, intent_id: str) -> Context:
-        data = await self.storage.get_data(
-            key=self._context_key(intent_id),
+    async def _get(self, key: StorageKey) -> StorageRecord:
+        data, = await self._get_many([key])
+        return data
+
+    async def _get_many(
+            self, keys: Sequence[StorageKey],
+    ) -> list[StorageRecord]:
+        if not self.optimistic:
+            return await self.dialog_storage.get_many(keys)
+        records = await self.dialog_storage.get_many_versioned(keys)
+        result = []
+        for key, (data, version) in zip(keys, records, strict=True):
+            self._versions[key] = version
+            result.append(data)
+        return result
+
+    async def _set(self, key: StorageKey, data: StorageRecord) -> None:
+        await self._set_many([(key, data)])
+
+    async def _set_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        dirty = []
+        unchanged = []
+        for key, data in items:
+            if key in self._snapshots and self._snapshots[key] == data:
+                unchanged.append((key, data))
+            else:
+                dirty.append((key, data))
+        if unchanged:
+            self.stats.skipped_writes += len(unchanged)
+            await self.dialog_storage.touch_many(unchanged)
+        if not dirty:
+            return
+        if self.optimistic:
+            await self._compare_and_set_many(dirty)
+        else:
+            await self.dialog_storage.set_many(dirty)
+        self.stats.writes += len(dirty)
+        for key, data in dirty:
+            self._snapshots[key] = deepcopy(data)
+
+    async def _compare_and_set_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        versions = await self.dialog_storage.compare_and_set_many(
+            self._versions, items,
         )
-        if not data:
+        if versions is None:
+            self.stats.conflicts += 1
+            raise ConcurrentUpdateError(
+                f"Dialog records were changed concurrently "
+                f"for user `{self.user_id}`, chat `{self.chat_id}`",
+            )
+        for (key, _), version in zip(items, versions, strict=True):
+            self._versions[key] = version
+
+    def _remember(self, key: StorageKey, data: StorageRecord) -> None:
+        self._snapshots[key] = deepcopy(data)
+
+    async def load_context(self, intent_id: str) -> Context:
+        key = self._context_key(intent_id)
+        record = await self._get(key)
+        return self._parse_context(intent_id, key, record)
+
+    def _parse_context(
+            self, intent_id: str, key: StorageKey, record: StorageRecord,
+    ) -> Context:
+        if not record:
             raise UnknownIntent(
                 f"Context not found for intent id: {intent_id}",
             )
+        self._remember(key, record)
+        data = self.serializer.load_context(record)
         data["access_settings"] = self._parse_access_settings(
             data.pop("access_settings", None),
         )
@@ -69,63 +210,107 @@ class StorageProxy:
             return AccessSettings(user_ids=[])
 
     async def load_stack(self, stack_id: str = DEFAULT_STACK_ID) -> Stack:
-        fixed_stack_id = self._fixed_stack_id(stack_id)
-        key = self._stack_key(fixed_stack_id)
+        key = self._stack_key(stack_id)
         await self.lock(key)
-        data = await self.storage.get_data(key)
-        data.pop("access_settings", None)  # compat with 2.2a5
+        record = await self._get(key)
+        return self._parse_stack(stack_id, key, record)
+
+    async def load_intent(
+            self, intent_id: str, stack_id: str,
+    ) -> tuple[Context, Stack]:
+        """
+        Load context and its stack using single storage round-trip.
+
+        `stack_id` is the expected id of the context stack. If it is
+        wrong, the stack is reloaded by the id stored in context.
+        Stack is locked the same way as in `load_stack`.
+        """
+        context_key = self._context_key(intent_id)
+        stack_key = self._stack_key(stack_id)
+        await self.lock(stack_key)
+        context_record, stack_record = await self._get_many(
+            [context_key, stack_key],
+        )
+        try:
+            context = self._parse_context(
+                intent_id, context_key, context_record,
+            )
+        except:
+            await self.unlock()
+            raise
+        if self._stack_key(context.stack_id) != stack_key:
+            await self.unlock()
+            # wrong stack is not saved, so its version is not checked
+            self._versions.pop(stack_key, None)
+            return context, await self.load_stack(context.stack_id)
+        stack = self._parse_stack(context.stack_id, stack_key, stack_record)
+        return context, stack
+
+    def _parse_stack(
+            self, stack_id: str, key: StorageKey, record: StorageRecord,
+    ) -> Stack:
+        fixed_stack_id = self._fixed_stack_id(stack_id)
+        self._remember(key, record)
         access_settings = self._default_access_settings(stack_id)
-        if not data:
+        if not record:
             return Stack(_id=fixed_stack_id, access_settings=access_settings)
+        data = self.serializer.load_stack(record)
+        data.pop("access_settings", None)  # compat with 2.2a5
         return Stack(access_settings=access_settings, **data)
 
+    async def save(
+            self, context: Context | None, stack: Stack | None,
+    ) -> None:
+        """Save context and stack using single storage round-trip."""
+        items = []
+        if context:
+            items.append(self._dump_context(context))
+        if stack:
+            items.append(self._dump_stack(stack))
+        if items:
+            await self._set_many(items)
+
     async def save_context(self, context: Context | None) -> None:
         if not context:
             return
-        data = copy(vars(context))
-        data["state"] = data["state"].state
-        data["access_settings"] = self._dump_access_settings(
-            context.access_settings,
-        )
-        await self.storage.set_data(
-            key=self._context_key(context.id),
-            data=data,
-        )
+        await self._set_many([self._dump_context(context)])
 
     async def remove_context(self, intent_id: str):
-        await self.storage.set_data(
-            key=self._context_key(intent_id),
-            data={},
-        )
+        await self._set(self._context_key(intent_id), {})
 
     async def remove_stack(self, stack_id: str):
-        await self.storage.set_data(
-            key=self._stack_key(stack_id),
-            data={},
-        )
+        await self._set(self._stack_key(stack_id), {})
 
     async def save_stack(self, stack: Stack | None) -> None:
         if not stack:
             return
+        await self._set_many([self._dump_stack(stack)])
+
+    def _dump_context(
+            self, context: Context,
+    ) -> tuple[StorageKey, StorageRecord]:
+        data = copy(vars(context))
+        data["state"] = data["state"].state
+        data["access_settings"] = self._dump_access_settings(
+            context.access_settings,
+        )
+        key = self._context_key(context.id)
+        return key, self.serializer.dump_context(data)
+
+    def _dump_stack(self, stack: Stack) -> tuple[StorageKey, StorageRecord]:
+        key = self._stack_key(stack.id)
         if stack.empty() and not stack.last_message_id:
-            await self.storage.set_data(
-                key=self._stack_key(stack.id),
-                data={},
-            )
-        else:
-            data = {
-                "_id": stack.id,
-                "intents": stack.intents,
-                "last_message_id": stack.last_message_id,
-                "last_reply_keyboard": stack.last_reply_keyboard,
-                "last_media_id": stack.last_media_id,
-                "last_media_unique_id": stack.last_media_unique_id,
-                "last_income_media_group_id": stack.last_income_media_group_id,
-            }
-            await self.storage.set_data(
-                key=self._stack_key(stack.id),
-                data=data,
-            )
+            return key, {}
+        return key, self.serializer.dump_stack({
+            "_id": stack.id,
+            "intents": stack.intents,
+            "last_message_id": stack.last_message_id,
+            "last_reply_keyboard": stack.last_reply_keyboard,
+            "last_media_id": stack.last_media_id,
+            "last_media_unique_id": stack.last_media_unique_id,
+            "last_income_media_group_id": stack.last_income_media_group_id,
+            "last_message_digest": stack.last_message_digest,
+        })
 
     def _context_key(self, intent_id: str) -> StorageKey:
         return StorageKey(
@@ -160,6 +345,10 @@ class StorageProxy:
         )
 
     def _state(self, state: str) -> State:
+        if self.states_index is not None:
+            real_state = self.states_index.get(state)
+            if real_state is not None:
+                return real_state
         group, *_ = state.partition(":")
         try:
             for real_state in self.state_groups[group].__all_states__:
@@ -188,3 +377,58 @@ class StorageProxy:
             "user_ids": access_settings.user_ids,
             "custom": access_settings.custom,
         }
+
+
+class StorageProxyFactory:
+    """
+    Creates storage proxies for events.
+
+    Configuration shared by all proxies is prepared once
+    """
+
+    def __init__(
+            self,
+            registry: DialogRegistryProtocol,
+            events_isolation: BaseEventIsolation,
+            dialog_storage: DialogStorageProtocol | None = None,
+            stats: StorageStats | None = None,
+            serializer: RecordSerializerProtocol | None = None,
+    ):
+        self.registry = registry
+        self.events_isolation = events_isolation
+        self.dialog_storage = dialog_storage
+        if stats is None:
+            stats = StorageStats()
+        self.stats = stats
+        if serializer is None:
+            serializer = DictRecordSerializer()
+        self.serializer = serializer
+        self._fsm_dialog_storage: FsmDialogStorage | None = None
+
+    def _get_dialog_storage(
+            self, fsm_storage: BaseStorage,
+    ) -> DialogStorageProtocol:
+        if self.dialog_storage is not None:
+            return self.dialog_storage
+        cached = self._fsm_dialog_storage
+        if cached is None or cached.storage is not fsm_storage:
+            cached = self._fsm_dialog_storage = FsmDialogStorage(fsm_storage)
+        return cached
+
+    def __call__(
+            self, event_context: EventContext, fsm_storage: BaseStorage,
+    ) -> StorageProxy:
+        return StorageProxy(
+            bot=event_context.bot,
+            storage=fsm_storage,
+            events_isolation=self.events_isolation,
+            state_groups=self.registry.states_groups(),
+            states_index=self.registry.states_index(),
+            user_id=event_context.user.id,
+            chat_id=event_context.chat.id,
+            thread_id=event_context.thread_id,
+            business_connection_id=event_context.business_connection_id,
+            dialog_storage=self._get_dialog_storage(fsm_storage),
+            stats=self.stats,
+            serializer=self.serializer,
+        )
@@ -6,23 +6,24 @@ from typing import (
 )
 
 from aiogram import Router
+from aiogram.dispatcher.event.bases import UNHANDLED
 from aiogram.enums import ChatType
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import CallbackQuery, Chat, Message
+from aiogram.types import CallbackQuery, Chat, Message, TelegramObject
 
 from aiogram_dialog.api.entities import Context, Data, LaunchMode, NewMessage
 from aiogram_dialog.api.exceptions import (
     UnregisteredWindowError,
 )
-from aiogram_dialog.api.internal import Widget, WindowProtocol
+from aiogram_dialog.api.internal import DIALOG_KEY, Widget, WindowProtocol
 from aiogram_dialog.api.protocols import (
     CancelEventProcessing,
     DialogManager,
     DialogProtocol,
 )
 from .context.intent_filter import IntentFilter
-from .utils import remove_intent_id
-from .widgets.data import PreviewAwareGetter
+from .utils import gather_in_order, remove_intent_id
+from .widgets.data import GetterTimings, PreviewAwareGetter
 from .widgets.utils import GetterVariant, ensure_data_getter
 
 logger = getLogger(__name__)
@@ -33,6 +34,10 @@ OnResultEvent = Callable[[Data, Any, DialogManager], Awaitable]
 W = TypeVar("W", bound=Widget)
 
 
+async def _skip_event(event: TelegramObject, **kwargs: Any) -> Any:
+    return UNHANDLED
+
+
 class Dialog(Router, DialogProtocol):
     def __init__(
             self,
@@ -44,6 +49,8 @@ class Dialog(Router, DialogProtocol):
             getter: GetterVariant = None,
             preview_data: GetterVariant = None,
             name: str | None = None,
+            concurrent_getters: bool = False,
+            getter_timings: GetterTimings | None = None,
     ):
         if not windows:
             raise ValueError(
@@ -70,9 +77,10 @@ class Dialog(Router, DialogProtocol):
         self.on_process_result = on_process_result
         self._launch_mode = launch_mode
         self.getter = PreviewAwareGetter(
-            ensure_data_getter(getter),
+            ensure_data_getter(getter, concurrent_getters, getter_timings),
             ensure_data_getter(preview_data),
         )
+        self.concurrent_getters = concurrent_getters
         self._setup_filter()
         self._register_handlers()
 
@@ -115,8 +123,15 @@ class Dialog(Router, DialogProtocol):
     async def load_data(
             self, manager: DialogManager,
     ) -> dict:
-        data = await manager.load_data()
-        data.update(await self.getter(**manager.middleware_data))
+        if self.concurrent_getters:
+            data, dialog_data = await gather_in_order(
+                manager.load_data(),
+                self.getter.call(manager.middleware_data),
+            )
+        else:
+            data = await manager.load_data()
+            dialog_data = await self.getter.call(manager.middleware_data)
+        data.update(dialog_data)
         return data
 
     async def render(self, manager: DialogManager) -> NewMessage:
@@ -184,6 +199,23 @@ class Dialog(Router, DialogProtocol):
         for observer in self.observers.values():
             observer.filter(intent_filter)
 
+    async def propagate_event(
+            self, update_type: str, event: TelegramObject, **kwargs: Any,
+    ) -> Any:
+        # dialog for current state is already found by registry,
+        # so other dialogs skip the event without checking filters
+        dialog = kwargs.get(DIALOG_KEY, self)
+        if dialog is self:
+            return await super().propagate_event(update_type, event, **kwargs)
+        observer = self.observers.get(update_type)
+        if observer is None or not observer.outer_middleware:
+            return UNHANDLED
+        # outer middlewares are called for each event as in other routers
+        kwargs.update(event_router=self)
+        return await observer.wrap_outer_middleware(
+            _skip_event, event=event, data=kwargs,
+        )
+
     def _register_handlers(self) -> None:
         self.callback_query.register(self._callback_handler)
         self.message.register(self._message_handler)
@@ -1,11 +1,12 @@
 import sys
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from copy import deepcopy
+from functools import partial
 from logging import getLogger
 from typing import Any, cast
 
-from aiogram import Router
+from aiogram import Bot, Router
 from aiogram.enums import ChatType
 from aiogram.fsm.state import State
 from aiogram.types import (
@@ -29,6 +30,7 @@ from aiogram_dialog.api.entities import (
     MediaId,
     NewMessage,
     OldMessage,
+    RenderData,
     ShowMode,
     Stack,
     StartMode,
@@ -42,6 +44,7 @@ from aiogram_dialog.api.exceptions import (
 from aiogram_dialog.api.internal import (
     CONTEXT_KEY,
     EVENT_SIMULATED,
+    PENDING_MESSAGES_KEY,
     STACK_KEY,
     STORAGE_KEY,
     DataGetter,
@@ -60,15 +63,72 @@ from aiogram_dialog.api.protocols import (
 )
 from aiogram_dialog.context.storage import StorageProxy
 from aiogram_dialog.utils import get_media_id
+from aiogram_dialog.widgets.data import call_getter
 from .bg_manager import (
     BgManager,
     coalesce_business_connection_id,
     coalesce_thread_id,
 )
+from .outbox import MessageOutbox
 
 logger = getLogger(__name__)
 
 
+def save_last_message(stack: Stack, message: OldMessage) -> None:
+    stack.last_message_id = message.message_id
+    stack.last_media_id = message.media_id
+    stack.last_media_unique_id = message.media_uniq_id
+    stack.last_reply_keyboard = message.has_reply_keyboard
+    stack.content_type = message.content_type
+    stack.has_protected_content = message.has_protected_content
+    stack.last_message_digest = message.digest
+
+
+async def send_message(
+        message_manager: MessageManagerProtocol,
+        media_id_storage: MediaIdStorageProtocol,
+        bot: Bot,
+        new_message: NewMessage,
+        old_message: OldMessage | None,
+) -> OldMessage | None:
+    try:
+        sent_message = await message_manager.show_message(
+            bot, new_message, old_message,
+        )
+    except MessageNotModified:
+        # nothing changed so nothing to save
+        # we do not have the actual version of message
+        logger.debug("MessageNotModified, not storing ids")
+        return None
+    if new_message.media:
+        await media_id_storage.save_media_id(
+            path=new_message.media.path,
+            url=new_message.media.url,
+            type=new_message.media.type,
+            media_id=MediaId(
+                sent_message.media_id,
+                sent_message.media_uniq_id,
+            ),
+        )
+    return sent_message
+
+
+async def reconcile_last_message(
+        proxy: StorageProxy, stack_id: str, message: OldMessage,
+) -> None:
+    """Save message sent after the event into its stack."""
+    stack = await proxy.load_stack(stack_id)
+    try:
+        if (
+                stack.last_message_id is None
+                or stack.last_message_id <= message.message_id
+        ):
+            save_last_message(stack, message)
+            await proxy.save_stack(stack)
+    finally:
+        await proxy.unlock()
+
+
 class ManagerImpl(DialogManager):
 
     def __init__(
@@ -79,9 +139,11 @@ class ManagerImpl(DialogManager):
             router: Router,
             data: dict,
             getter: DataGetter | None,
+            outbox: MessageOutbox | None = None,
     ):
         self.disabled = False
         self.message_manager = message_manager
+        self.outbox = outbox
         self.media_id_storage = media_id_storage
         self._event = event
         self._data = data
@@ -130,16 +192,16 @@ class ManagerImpl(DialogManager):
     async def load_data(self) -> dict:
         context = self.current_context()
         if self._getter:
-            data = await self._getter(**self.middleware_data)
+            data = await call_getter(self._getter, self.middleware_data)
         else:
             data = {}
-        return {
+        return RenderData({
             "dialog_data": context.dialog_data,
             "start_data": context.start_data,
             "middleware_data": self._data,
             "event": self.event,
             **data,
-        }
+        })
 
     def is_preview(self) -> bool:
         return False
@@ -184,6 +246,7 @@ class ManagerImpl(DialogManager):
             show_mode=self._calc_show_mode(),
         )
         self.current_stack().last_message_id = None
+        self.current_stack().last_message_digest = None
 
     async def _process_last_dialog_result(
             self,
@@ -394,26 +457,17 @@ class ManagerImpl(DialogManager):
 
             self._ensure_stack_compatible(stack, new_message)
 
-            try:
-                sent_message = await self.message_manager.show_message(
+            pending = self._data.get(PENDING_MESSAGES_KEY)
+            if self.outbox is not None and pending is not None:
+                pending.append(self._prepare_outbox_message(
+                    bot, stack, new_message, old_message,
+                ))
+            else:
+                sent_message = await self._send_message(
                     bot, new_message, old_message,
                 )
-            except MessageNotModified:
-                # nothing changed so nothing to save
-                # we do not have the actual version of message
-                logger.debug("MessageNotModified, not storing ids")
-            else:
-                self._save_last_message(sent_message)
-                if new_message.media:
-                    await self.media_id_storage.save_media_id(
-                        path=new_message.media.path,
-                        url=new_message.media.url,
-                        type=new_message.media.type,
-                        media_id=MediaId(
-                            sent_message.media_id,
-                            sent_message.media_uniq_id,
-                        ),
-                    )
+                if sent_message:
+                    self._save_last_message(sent_message)
             if isinstance(self.event, Message):
                 stack.last_income_media_group_id = self.event.media_group_id
         except Exception as e:
@@ -424,6 +478,62 @@ class ManagerImpl(DialogManager):
             raise
 
 
+    async def _send_message(
+            self,
+            bot: Bot,
+            new_message: NewMessage,
+            old_message: OldMessage | None,
+    ) -> OldMessage | None:
+        return await send_message(
+            self.message_manager, self.media_id_storage,
+            bot, new_message, old_message,
+        )
+
+    def _prepare_outbox_message(
+            self,
+            bot: Bot,
+            stack: Stack,
+            new_message: NewMessage,
+            old_message: OldMessage | None,
+    ) -> Callable[[], Any]:
+        """Create a callback which submits message to outbox."""
+        outbox = self.outbox
+        message_manager = self.message_manager
+        media_id_storage = self.media_id_storage
+        proxy = self.storage()
+        stack_id = stack.id
+        chat_key = (
+            bot.id,
+            new_message.chat.id,
+            new_message.thread_id,
+            new_message.business_connection_id,
+        )
+        stack_key = (*chat_key, stack_id)
+        # another event could have sent new message of this stack
+        # while current one was processed, it must be edited instead
+        replaces_last = (
+            old_message is None
+            or old_message.message_id == stack.last_message_id
+        )
+
+        async def send() -> None:
+            target = old_message
+            if replaces_last:
+                target = outbox.last_message(stack_key, target)
+            sent_message = await send_message(
+                message_manager, media_id_storage,
+                bot, new_message, target,
+            )
+            if not sent_message:
+                return
+            outbox.remember(stack_key, sent_message)
+            # records read by the finished event can be changed already
+            await reconcile_last_message(
+                proxy.detached(), stack_id, sent_message,
+            )
+
+        return partial(outbox.submit, chat_key, send)
+
     async def _fix_cached_media_id(self, new_message: NewMessage):
         if not new_message.media or new_message.media.file_id:
             return
@@ -456,6 +566,7 @@ class ManagerImpl(DialogManager):
                 message_id=current_message.message_id,
                 business_connection_id=event_context.business_connection_id,
                 content_type=current_message.content_type,
+                digest=self._last_message_digest(current_message.message_id),
             )
         elif not stack or not stack.last_message_id:
             return None
@@ -470,8 +581,15 @@ class ManagerImpl(DialogManager):
                 message_id=stack.last_message_id,
                 business_connection_id=event_context.business_connection_id,
                 content_type=stack.content_type,
+                digest=stack.last_message_digest,
             )
 
+    def _last_message_digest(self, message_id: int) -> str | None:
+        stack = self.current_stack()
+        if not stack or stack.last_message_id != message_id:
+            return None
+        return stack.last_message_digest
+
     def _get_last_message(self) -> OldMessage | None:
         if isinstance(self.event, ErrorEvent):
             event = self.event.update.event
@@ -496,16 +614,11 @@ class ManagerImpl(DialogManager):
             message_id=stack.last_message_id,
             business_connection_id=event_context.business_connection_id,
             content_type=stack.content_type,
+            digest=stack.last_message_digest,
         )
 
     def _save_last_message(self, message: OldMessage) -> None:
-        stack = self.current_stack()
-        stack.last_message_id = message.message_id
-        stack.last_media_id = message.media_id
-        stack.last_media_unique_id = message.media_uniq_id
-        stack.last_reply_keyboard = message.has_reply_keyboard
-        stack.content_type = message.content_type
-        stack.has_protected_content = message.has_protected_content
+        save_last_message(self.current_stack(), message)
 
     def _calc_show_mode(self) -> ShowMode:  # noqa: PLR0911
         if self.show_mode is not ShowMode.AUTO:
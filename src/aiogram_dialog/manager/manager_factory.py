@@ -9,6 +9,7 @@ from aiogram_dialog.api.protocols import (
     MessageManagerProtocol,
 )
 from .manager import ManagerImpl
+from .outbox import MessageOutbox
 
 
 class DefaultManagerFactory(DialogManagerFactory):
@@ -17,10 +18,12 @@ class DefaultManagerFactory(DialogManagerFactory):
             message_manager: MessageManagerProtocol,
             media_id_storage: MediaIdStorageProtocol,
             getter: DataGetter | None,
+            outbox: MessageOutbox | None = None,
     ) -> None:
         self.message_manager = message_manager
         self.media_id_storage = media_id_storage
         self.getter = getter
+        self.outbox = outbox
 
     def __call__(
             self, event: ChatEvent, data: dict,
@@ -35,4 +38,5 @@ class DefaultManagerFactory(DialogManagerFactory):
             registry=registry,
             router=router,
             getter=self.getter,
+            outbox=self.outbox,
         )
@@ -29,7 +29,7 @@ from aiogram_dialog.api.protocols import (
     MessageManagerProtocol,
     MessageNotModified,
 )
-from aiogram_dialog.utils import get_media_id
+from aiogram_dialog.utils import get_media_id, message_digest
 
 logger = getLogger(__name__)
 
@@ -72,6 +72,7 @@ def _combine(sent_message: NewMessage, message_result: Message) -> OldMessage:
         media_id=(media_id.file_id if media_id else None),
         business_connection_id=message_result.business_connection_id,
         content_type=message_result.content_type,
+        digest=message_digest(sent_message),
     )
 
 
@@ -197,6 +198,12 @@ class MessageManager(MessageManagerProtocol):
                 await self.send_message(bot, new_message),
             )
 
+        if old_message.digest and (
+            old_message.digest == message_digest(new_message)
+        ):
+            logger.debug("Message digest did not change")
+            return old_message
+
         if not self._message_changed(new_message, old_message):
             logger.debug("Message dit not change")
             # nothing changed: text, keyboard or media
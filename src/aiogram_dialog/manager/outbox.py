@@ -0,0 +1,74 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from logging import getLogger
+
+from cachetools import LRUCache
+
+from aiogram_dialog.api.entities import OldMessage
+
+logger = getLogger(__name__)
+
+SendCallback = Callable[[], Awaitable[None]]
+
+
+class MessageOutbox:
+    """
+    Sends dialog messages after events are processed.
+
+    Messages are rendered while the stack is locked, but are sent only
+    after it is saved and unlocked, so other events of the chat do not
+    wait for Telegram API calls. Messages for the same chat are sent
+    one by one in order of submitting.
+    """
+
+    def __init__(self, last_messages_size: int = 10240):
+        self._tails: dict[Hashable, asyncio.Task] = {}
+        # messages sent but possibly not yet seen in stored stacks
+        self._last_messages: LRUCache[Hashable, OldMessage] = LRUCache(
+            maxsize=last_messages_size,
+        )
+
+    def submit(self, key: Hashable, send: SendCallback) -> asyncio.Task:
+        task = asyncio.create_task(self._run(self._tails.get(key), send))
+        self._tails[key] = task
+        task.add_done_callback(partial(self._remove_tail, key))
+        return task
+
+    def _remove_tail(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tails.get(key) is task:
+            del self._tails[key]
+
+    async def _run(
+            self, previous: asyncio.Task | None, send: SendCallback,
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
+            await send()
+        except Exception:
+            logger.exception("Cannot send dialog message")
+
+    def last_message(
+            self, key: Hashable, old_message: OldMessage | None,
+    ) -> OldMessage | None:
+        """
+        Find the latest message of the stack.
+
+        Message ids grow within a chat, so a message sent by outbox
+        replaces `old_message` if it has bigger id.
+        """
+        last = self._last_messages.get(key)
+        if last is None:
+            return old_message
+        if old_message is None or last.message_id > old_message.message_id:
+            return last
+        return old_message
+
+    def remember(self, key: Hashable, message: OldMessage) -> None:
+        self._last_messages[key] = message
+
+    async def join(self) -> None:
+        """Wait until all submitted messages are sent."""
+        while self._tails:
+            await asyncio.wait(list(self._tails.values()))
@@ -0,0 +1,160 @@
+from collections.abc import Callable
+from copy import copy
+from dataclasses import replace
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from aiogram.fsm.state import State
+
+from aiogram_dialog.api.entities import EVENT_CONTEXT_KEY, NewMessage
+from aiogram_dialog.api.protocols import DialogManager
+from aiogram_dialog.cache import CacheStats, StatsTTLCache
+
+RenderKeyFunc = Callable[[State, dict, DialogManager], Any]
+
+# data which is different for each event and not used by most of widgets
+IGNORED_DATA_KEYS = frozenset(("event", "middleware_data"))
+
+_SCALAR_TYPES = (
+    str, int, float, bytes, Enum, date, time, timedelta, Decimal,
+    type(None),
+)
+
+
+class Uncacheable(Exception):
+    pass
+
+
+def freeze(value: Any) -> Any:
+    """
+    Make an immutable copy of data to be compared later.
+
+    Only builtin types are supported, any other object cannot be
+    checked for changes, so `Uncacheable` is raised
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        # `1`, `1.0` and `True` are equal but rendered differently
+        return type(value), value
+    if isinstance(value, dict):
+        return dict, tuple(
+            (freeze(key), freeze(item)) for key, item in value.items()
+        )
+    if isinstance(value, list | tuple):
+        return type(value), tuple(freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset, frozenset(freeze(item) for item in value)
+    raise Uncacheable(f"Cannot check {type(value)} for changes")
+
+
+def get_locale(middleware_data: dict) -> Any:
+    """
+    Get locale used by i18n middleware if any.
+
+    `aiogram.utils.i18n` and `aiogram_i18n` contexts are supported
+    as well as a plain `locale` value in middleware data
+    """
+    i18n = middleware_data.get("i18n")
+    for attr in ("current_locale", "locale"):
+        locale = getattr(i18n, attr, None)
+        if isinstance(locale, str):
+            return locale
+    return middleware_data.get("locale")
+
+
+def current_period(period: timedelta = timedelta(minutes=15)) -> datetime:
+    """
+    Get current UTC time rounded down to the period.
+
+    Offsets of all timezones are multiples of 15 minutes, so the period
+    changes whenever the date changes in any of them
+    """
+    now = datetime.now(timezone.utc)
+    return now - (now - datetime.min.replace(tzinfo=timezone.utc)) % period
+
+
+def default_render_key(
+        state: State, data: dict, manager: DialogManager,
+) -> Any:
+    """
+    Fingerprint of all inputs used by window widgets.
+
+    User language, i18n locale and current date (e.g. for `Calendar`)
+    are included. Other `event` and `middleware_data` values are
+    ignored. Do not use render cache for windows depending on them
+    or provide your own key function
+    """
+    event_context = manager.middleware_data[EVENT_CONTEXT_KEY]
+    return (
+        state.state,
+        event_context.chat.id,
+        event_context.thread_id,
+        event_context.business_connection_id,
+        event_context.user.language_code,
+        get_locale(manager.middleware_data),
+        current_period(),
+        freeze(manager.current_context().widget_data),
+        freeze({
+            key: value
+            for key, value in data.items()
+            if key not in IGNORED_DATA_KEYS
+        }),
+    )
+
+
+def _copy_message(message: NewMessage) -> NewMessage:
+    # manager modifies show mode and media file id of rendered message
+    return replace(message, media=copy(message.media))
+
+
+class RenderCache:
+    """
+    Cache of rendered messages for `Window`.
+
+    Last rendered message is stored per dialog context and reused while
+    the fingerprint of rendering inputs is the same.
+    If the key function returns `None` or raises `Uncacheable`
+    the message is rendered without cache.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 10240,
+            ttl: float = 600,
+            key: RenderKeyFunc = default_render_key,
+    ):
+        self.key = key
+        self.stats = CacheStats()
+        self.cache = StatsTTLCache(
+            maxsize=maxsize, ttl=ttl, stats=self.stats,
+        )
+
+    def fingerprint(
+            self, state: State, data: dict, manager: DialogManager,
+    ) -> Any:
+        try:
+            return self.key(state, data, manager)
+        except Uncacheable:
+            return None
+
+    def get(
+            self, manager: DialogManager, fingerprint: Any,
+    ) -> NewMessage | None:
+        if fingerprint is not None:
+            cached = self.cache.get(manager.current_context().id)
+            if cached is not None and cached[0] == fingerprint:
+                self.stats.hits += 1
+                return _copy_message(cached[1])
+        self.stats.misses += 1
+        return None
+
+    def set(
+            self, manager: DialogManager, fingerprint: Any,
+            message: NewMessage,
+    ) -> None:
+        if fingerprint is None:
+            return
+        self.cache[manager.current_context().id] = (
+            fingerprint, _copy_message(message),
+        )
@@ -6,24 +6,31 @@ from aiogram.fsm.state import State, StatesGroup, any_state
 from aiogram.fsm.storage.base import BaseEventIsolation
 from aiogram.fsm.storage.memory import SimpleEventIsolation
 
-from aiogram_dialog.api.entities import DIALOG_EVENT_NAME
+from aiogram_dialog.api.entities import DIALOG_EVENT_NAME, OutdatedClickMode
 from aiogram_dialog.api.exceptions import UnregisteredDialogError
 from aiogram_dialog.api.internal import DataGetter, DialogManagerFactory
 from aiogram_dialog.api.protocols import (
     BgManagerFactory,
     DialogProtocol,
     DialogRegistryProtocol,
+    DialogStorageProtocol,
     MediaIdStorageProtocol,
     MessageManagerProtocol,
+    RecordSerializerProtocol,
     StackAccessValidator,
+    VersionedDialogStorageProtocol,
 )
 from aiogram_dialog.context.intent_middleware import (
+    ConflictRetryMiddleware,
+    DialogResolverMiddleware,
     IntentErrorMiddleware,
     IntentMiddlewareFactory,
+    OutdatedClickStats,
     context_saver_middleware,
     context_unlocker_middleware,
 )
 from aiogram_dialog.context.media_storage import MediaIdStorage
+from aiogram_dialog.context.storage import StorageProxyFactory, StorageStats
 from aiogram_dialog.manager.bg_manager import BgManagerFactoryImpl
 from aiogram_dialog.manager.manager_factory import DefaultManagerFactory
 from aiogram_dialog.manager.manager_middleware import (
@@ -31,7 +38,9 @@ from aiogram_dialog.manager.manager_middleware import (
     ManagerMiddleware,
 )
 from aiogram_dialog.manager.message_manager import MessageManager
+from aiogram_dialog.manager.outbox import MessageOutbox
 from aiogram_dialog.manager.update_handler import handle_update
+from aiogram_dialog.widgets.utils import ensure_data_getter
 from .about import about_dialog
 from .context.access_validator import DefaultAccessValidator
 
@@ -53,6 +62,7 @@ class DialogRegistry(DialogRegistryProtocol):
         self._loaded = False
         self._dialogs = {}
         self._states_groups = {}
+        self._states_index = {}
 
     def _ensure_loaded(self):
         if not self._loaded:
@@ -72,6 +82,10 @@ class DialogRegistry(DialogRegistryProtocol):
         self._ensure_loaded()
         return self._states_groups
 
+    def states_index(self) -> dict[str, State]:
+        self._ensure_loaded()
+        return self._states_index
+
     def refresh(self):
         for dialog in collect_dialogs(self.router):
             states_group = dialog.states_group()
@@ -88,6 +102,11 @@ class DialogRegistry(DialogRegistryProtocol):
             d.states_group_name(): d.states_group()
             for d in self._dialogs.values()
         }
+        self._states_index = {
+            state.state: state
+            for states_group in self._states_groups.values()
+            for state in states_group.__all_states__
+        }
         self._loaded = True
 
 
@@ -106,6 +125,12 @@ def _register_middleware(
         bg_manager_factory: BgManagerFactory,
         stack_access_validator: StackAccessValidator,
         events_isolation: BaseEventIsolation,
+        dialog_storage: DialogStorageProtocol | None,
+        storage_stats: StorageStats,
+        record_serializer: RecordSerializerProtocol | None,
+        outdated_click_mode: OutdatedClickMode,
+        outdated_click_stats: OutdatedClickStats,
+        conflict_retries: int,
 ):
     registry = DialogRegistry(router)
     manager_middleware = ManagerMiddleware(
@@ -113,10 +138,20 @@ def _register_middleware(
         router=router,
         registry=registry,
     )
+    storage_proxy_factory = StorageProxyFactory(
+        registry=registry,
+        events_isolation=events_isolation,
+        dialog_storage=dialog_storage,
+        stats=storage_stats,
+        serializer=record_serializer,
+    )
     intent_middleware = IntentMiddlewareFactory(
         registry=registry,
         access_validator=stack_access_validator,
         events_isolation=events_isolation,
+        storage_proxy_factory=storage_proxy_factory,
+        outdated_click_mode=outdated_click_mode,
+        outdated_click_stats=outdated_click_stats,
     )
     # delayed configuration of middlewares
     router.startup.register(_startup_callback(registry))
@@ -126,6 +161,7 @@ def _register_middleware(
         registry=registry,
         events_isolation=events_isolation,
         access_validator=stack_access_validator,
+        storage_proxy_factory=storage_proxy_factory,
     ))
 
     router.message.middleware(manager_middleware)
@@ -136,6 +172,15 @@ def _register_middleware(
     router.chat_join_request.middleware(manager_middleware)
     router.errors.middleware(manager_middleware)
 
+    if isinstance(dialog_storage, VersionedDialogStorageProtocol):
+        conflict_retry = ConflictRetryMiddleware(conflict_retries)
+        router.message.outer_middleware(conflict_retry)
+        router.business_message.outer_middleware(conflict_retry)
+        router.callback_query.outer_middleware(conflict_retry)
+        update_handler.outer_middleware(conflict_retry)
+        router.my_chat_member.outer_middleware(conflict_retry)
+        router.chat_join_request.outer_middleware(conflict_retry)
+
     router.message.outer_middleware(intent_middleware.process_message)
     router.business_message.outer_middleware(intent_middleware.process_message)
     router.callback_query.outer_middleware(
@@ -151,6 +196,13 @@ def _register_middleware(
         intent_middleware.process_chat_join_request,
     )
 
+    dialog_resolver = DialogResolverMiddleware(registry)
+    router.message.outer_middleware(dialog_resolver)
+    router.business_message.outer_middleware(dialog_resolver)
+    router.callback_query.outer_middleware(dialog_resolver)
+    router.my_chat_member.outer_middleware(dialog_resolver)
+    router.chat_join_request.outer_middleware(dialog_resolver)
+
     router.message.outer_middleware(context_unlocker_middleware)
     router.business_message.outer_middleware(context_unlocker_middleware)
     router.callback_query.outer_middleware(context_unlocker_middleware)
@@ -175,6 +227,7 @@ def _prepare_dialog_manager_factory(
         message_manager: MessageManagerProtocol | None,
         media_id_storage: MediaIdStorageProtocol | None,
         getter: DataGetter | None,
+        message_outbox: MessageOutbox | None,
 ) -> DialogManagerFactory:
     if dialog_manager_factory is not None:
         return dialog_manager_factory
@@ -182,10 +235,13 @@ def _prepare_dialog_manager_factory(
         media_id_storage = MediaIdStorage()
     if message_manager is None:
         message_manager = MessageManager()
+    if getter is not None:
+        getter = ensure_data_getter(getter)
     return DefaultManagerFactory(
         message_manager=message_manager,
         media_id_storage=media_id_storage,
         getter=getter,
+        outbox=message_outbox,
     )
 
 
@@ -227,6 +283,13 @@ def setup_dialogs(
         stack_access_validator: StackAccessValidator | None = None,
         events_isolation: BaseEventIsolation | None = None,
         getter: DataGetter | None = None,
+        dialog_storage: DialogStorageProtocol | None = None,
+        storage_stats: StorageStats | None = None,
+        record_serializer: RecordSerializerProtocol | None = None,
+        outdated_click_mode: OutdatedClickMode = OutdatedClickMode.RAISE,
+        outdated_click_stats: OutdatedClickStats | None = None,
+        conflict_retries: int = 0,
+        message_outbox: MessageOutbox | None = None,
 ) -> BgManagerFactory:
     _setup_event_observer(router)
     _register_event_handler(router, handle_update)
@@ -237,11 +300,16 @@ def setup_dialogs(
         message_manager=message_manager,
         media_id_storage=media_id_storage,
         getter=getter,
+        message_outbox=message_outbox,
     )
     stack_access_validator = _prepare_stack_access_validator(
         stack_access_validator,
     )
     events_isolation = _prepare_events_isolation(events_isolation)
+    if storage_stats is None:
+        storage_stats = StorageStats()
+    if outdated_click_stats is None:
+        outdated_click_stats = OutdatedClickStats()
     bg_manager_factory = BgManagerFactoryImpl(router)
     _register_middleware(
         router=router,
@@ -249,5 +317,11 @@ def setup_dialogs(
         bg_manager_factory=bg_manager_factory,
         stack_access_validator=stack_access_validator,
         events_isolation=events_isolation,
+        dialog_storage=dialog_storage,
+        storage_stats=storage_stats,
+        record_serializer=record_serializer,
+        outdated_click_mode=outdated_click_mode,
+        outdated_click_stats=outdated_click_stats,
+        conflict_retries=conflict_retries,
     )
     return bg_manager_factory
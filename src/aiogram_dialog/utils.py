@@ -1,5 +1,8 @@
+import asyncio
+import json
 import sys
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from hashlib import blake2b
 from logging import getLogger
 from typing import Any, ParamSpec, TypeVar
 
@@ -19,7 +22,9 @@ from aiogram.types import (
 from aiogram_dialog.api.entities import (
     ChatEvent,
     DialogUpdateEvent,
+    MediaAttachment,
     MediaId,
+    NewMessage,
 )
 from aiogram_dialog.api.internal import RawKeyboard
 
@@ -197,6 +202,43 @@ def get_media_id(
     )
 
 
+def _media_digest_data(media: MediaAttachment | None) -> Any:
+    if not media:
+        return None
+    # file id is found after the media is sent, so it is not used
+    # when the source is known
+    file_id = None
+    if media.file_id and not (media.url or media.path):
+        file_id = media.file_id.file_unique_id or media.file_id.file_id
+    return [
+        media.type, media.url, str(media.path) if media.path else None,
+        file_id, media.kwargs,
+    ]
+
+
+def message_digest(new_message: NewMessage) -> str:
+    """
+    Calculate short digest of the rendered message content.
+
+    Messages with the same digest are shown the same way in Telegram
+    """
+    markup = new_message.reply_markup
+    link_preview = new_message.link_preview_options
+    content = [
+        new_message.text,
+        new_message.parse_mode,
+        bool(new_message.protect_content),
+        markup.model_dump(mode="json", exclude_none=True) if markup else None,
+        (
+            link_preview.model_dump(mode="json", exclude_none=True)
+            if link_preview else None
+        ),
+        _media_digest_data(new_message.media),
+    ]
+    raw = json.dumps(content, default=str, separators=(",", ":"))
+    return blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def intent_callback_data(
         intent_id: str, callback_data: str | None,
 ) -> str | None:
@@ -227,6 +269,21 @@ def remove_intent_id(callback_data: str) -> tuple[str | None, str]:
 P = ParamSpec("P")
 R = TypeVar("R")
 
+
+async def gather_in_order(*aws: Awaitable[Any]) -> list[Any]:
+    """
+    Run awaitables concurrently.
+
+    All of them are awaited, then the first error in the order of
+    arguments is raised, so it is the same as for sequential calls
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
 def add_exception_note(f: Callable[P, R]) -> Callable[P, R]:
     async def inner(self: Any, *args: P.args, **kwargs: P.kwargs) -> R:
         try:
@@ -2,10 +2,12 @@ __all__ = [
     "Actionable",
     "BaseScroll",
     "BaseWidget",
+    "ItemsSource",
     "ManagedScroll",
     "ManagedWidget",
     "OnPageChanged",
     "OnPageChangedVariants",
+    "PrefetchingSource",
     "Scroll",
     "Selector",
     "WhenCondition",
@@ -19,6 +21,7 @@ __all__ = [
 from .action import Actionable
 from .base import BaseWidget
 from .case import Selector, new_case_field, new_magic_selector
+from .items import ItemsSource, PrefetchingSource
 from .managed import ManagedWidget
 from .scroll import (
     BaseScroll,
@@ -1,23 +1,143 @@
-from collections.abc import Callable, Sequence
+import asyncio
+from abc import abstractmethod
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Sequence,
+)
 from operator import itemgetter
+from typing import Any, Protocol, runtime_checkable
 
 from magic_filter import MagicFilter
 
-ItemsGetter = Callable[[dict], Sequence]
-ItemsGetterVariant = str | ItemsGetter | MagicFilter | Sequence
+from aiogram_dialog.cache import CacheStats, StatsTTLCache
 
 
-def _get_identity(items: Sequence) -> ItemsGetter:
-    def identity(data) -> Sequence:
+@runtime_checkable
+class ItemsSource(Protocol):
+    """
+    Items which are loaded by parts, e.g. from database.
+
+    Paging widgets request only items of the current page.
+    """
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Get total number of items."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def slice(self, offset: int, limit: int) -> Sequence:
+        """Get items from `offset` to `offset + limit`."""
+        raise NotImplementedError
+
+
+Items = Iterable | ItemsSource
+ItemsGetter = Callable[[dict], Items]
+ItemsGetterVariant = str | ItemsGetter | MagicFilter | Sequence | ItemsSource
+
+
+class SequenceSource(ItemsSource):
+    def __init__(self, items: Sequence):
+        self.items = items
+
+    async def count(self) -> int:
+        return len(self.items)
+
+    async def slice(self, offset: int, limit: int) -> Sequence:
+        return self.items[offset:offset + limit]
+
+
+class PrefetchingSource(ItemsSource):
+    """
+    Wrapper which loads neighbouring pages in background.
+
+    Loaded parts and total count are reused for `ttl` seconds,
+    so the same instance should be used for the same items only.
+    """
+
+    def __init__(
+            self,
+            source: ItemsSource,
+            ttl: float = 60,
+            maxsize: int = 16,
+    ):
+        self.source = source
+        self.stats = CacheStats()
+        self.cache = StatsTTLCache(
+            maxsize=maxsize, ttl=ttl, stats=self.stats,
+        )
+
+    def invalidate(self) -> None:
+        self.cache.clear()
+
+    def _load(
+            self, key: Hashable, loader: Callable[[], Awaitable],
+    ) -> asyncio.Future:
+        future = self.cache.get(key)
+        if future is None:
+            future = asyncio.ensure_future(loader())
+            future.add_done_callback(lambda f: self._check_loaded(key, f))
+            self.cache[key] = future
+        return future
+
+    def _check_loaded(self, key: Hashable, future: asyncio.Future) -> None:
+        # do not reuse errors, exception is raised to waiting calls only
+        failed = future.cancelled() or future.exception() is not None
+        if failed and self.cache.get(key) is future:
+            del self.cache[key]
+
+    async def count(self) -> int:
+        return await asyncio.shield(self._load(None, self.source.count))
+
+    def _prefetch(self, offset: int, limit: int) -> None:
+        self._load(
+            (offset, limit), lambda: self.source.slice(offset, limit),
+        )
+
+    async def slice(self, offset: int, limit: int) -> Sequence:
+        result = self._load(
+            (offset, limit), lambda: self.source.slice(offset, limit),
+        )
+        total = await self.count()
+        if offset + limit < total:
+            self._prefetch(offset + limit, limit)
+        if offset > 0:
+            self._prefetch(max(0, offset - limit), limit)
+        return await asyncio.shield(result)
+
+
+def as_items_source(items: Items) -> ItemsSource:
+    if isinstance(items, ItemsSource):
+        return items
+    if not isinstance(items, Sequence):
+        # iterators, sets and dict views cannot be sliced
+        items = list(items)
+    return SequenceSource(items)
+
+
+def is_sliceable(items: Items) -> bool:
+    """Check if items can be counted and sliced without reading them."""
+    return isinstance(items, Sequence | ItemsSource)
+
+
+async def get_all_items(source: ItemsSource) -> Sequence:
+    return await source.slice(0, await source.count())
+
+
+def _get_identity(items: Any) -> ItemsGetter:
+    def identity(data) -> Items:
         return items
 
     return identity
 
 
 def _get_magic_getter(f: MagicFilter) -> ItemsGetter:
-    def items_magic(data: dict) -> Sequence:
+    def items_magic(data: dict) -> Items:
         items = f.resolve(data)
-        if isinstance(items, Sequence):
+        if isinstance(items, Sequence | ItemsSource):
             return items
         else:
             return []
@@ -30,6 +150,8 @@ def get_items_getter(attr_val: ItemsGetterVariant) -> ItemsGetter:
         return itemgetter(attr_val)
     elif isinstance(attr_val, MagicFilter):
         return _get_magic_getter(attr_val)
+    elif isinstance(attr_val, ItemsSource):
+        return _get_identity(attr_val)
     elif isinstance(attr_val, Callable):
         return attr_val
     else:
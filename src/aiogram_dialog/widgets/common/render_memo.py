@@ -0,0 +1,79 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_render_memo: ContextVar[dict | None] = ContextVar(
+    "aiogram_dialog_render_memo", default=None,
+)
+
+
+@contextmanager
+def render_scope() -> Iterator[None]:
+    """
+    Enable memoization of widget contents while rendering a window.
+
+    Values are dropped when the scope is exited.
+    """
+    token = _render_memo.set({})
+    try:
+        yield
+    finally:
+        _render_memo.reset(token)
+
+
+class _Entry:
+    def __init__(self, data: dict):
+        # data is stored to keep its id unique while scope is active
+        self.data = data
+        self.done = False
+        self.value: Any = None
+        self.waiter: asyncio.Future | None = None
+
+
+async def memoize(
+        widget: Any,
+        name: Hashable,
+        data: dict,
+        factory: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Calculate value once per render scope for the same widget and data.
+
+    Scrolls use it to share contents and page count with pagers.
+    Without render scope value is calculated each time.
+    """
+    memo = _render_memo.get()
+    if memo is None:
+        return await factory()
+    key = (id(widget), name, id(data))
+    entry = memo.get(key)
+    if entry is not None and entry.data is data:
+        if entry.done:
+            return entry.value
+        # calculation is started by concurrently rendered widget
+        if entry.waiter is None:
+            entry.waiter = asyncio.get_running_loop().create_future()
+        return await asyncio.shield(entry.waiter)
+
+    entry = memo[key] = _Entry(data)
+    try:
+        value = await factory()
+    except BaseException as e:
+        # failed calculation can be retried, e.g. after loading lazy data
+        if memo.get(key) is entry:
+            del memo[key]
+        if entry.waiter is not None:
+            if isinstance(e, asyncio.CancelledError):
+                entry.waiter.cancel()
+            else:
+                entry.waiter.set_exception(e)
+        raise
+    entry.value = value
+    entry.done = True
+    if entry.waiter is not None:
+        entry.waiter.set_result(value)
+    return value
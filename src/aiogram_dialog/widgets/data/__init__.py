@@ -1,13 +1,29 @@
 from .data_context import (
+    BoundGetter,
     CompositeGetter,
     DataGetter,
+    GetterTiming,
+    GetterTimings,
+    MappingGetter,
     PreviewAwareGetter,
     StaticGetter,
+    TimedGetter,
+    call_getter,
 )
+from .getter_cache import CachedGetter, GetterCacheKey, cached_getter
 
 __all__ = [
+    "BoundGetter",
+    "CachedGetter",
     "CompositeGetter",
     "DataGetter",
+    "GetterCacheKey",
+    "GetterTiming",
+    "GetterTimings",
+    "MappingGetter",
     "PreviewAwareGetter",
     "StaticGetter",
+    "TimedGetter",
+    "cached_getter",
+    "call_getter",
 ]
@@ -1,37 +1,159 @@
+import inspect
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
 from aiogram_dialog.api.internal.widgets import DataGetter
-from aiogram_dialog.api.protocols import DialogManager
+from aiogram_dialog.utils import gather_in_order
+
+
+class MappingGetter(ABC):
+    """
+    Getter which accepts middleware data as a mapping.
+
+    Used for getters provided by library, so the data is not unpacked
+    into keyword arguments on each level of nesting
+    """
+
+    @abstractmethod
+    async def call(self, data: Mapping[str, Any]) -> dict:
+        raise NotImplementedError
+
+    async def __call__(self, **kwargs) -> dict:
+        return await self.call(kwargs)
+
+
+async def call_getter(getter: DataGetter, data: Mapping[str, Any]) -> dict:
+    if isinstance(getter, MappingGetter):
+        return await getter.call(data)
+    return await getter(**data)
+
+
+class BoundGetter(MappingGetter):
+    """
+    Calls getter only with arguments declared in its signature.
+
+    Signature is inspected once, getters with `**kwargs` receive all data
+    """
+
+    def __init__(self, getter: DataGetter):
+        self.getter = getter
+        self.accepts_all = False
+        try:
+            parameters = inspect.signature(getter).parameters.values()
+        except (TypeError, ValueError):  # signature is not available
+            self.accepts_all = True
+            parameters = []
+        names = []
+        for parameter in parameters:
+            if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+                self.accepts_all = True
+            elif parameter.kind in (
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                inspect.Parameter.KEYWORD_ONLY,
+            ):
+                names.append(parameter.name)
+        self.names = tuple(names)
+
+    async def call(self, data: Mapping[str, Any]) -> dict:
+        if self.accepts_all:
+            return await self.getter(**data)
+        return await self.getter(**{
+            name: data[name] for name in self.names if name in data
+        })
+
+    def __repr__(self) -> str:
+        return f"BoundGetter({self.getter!r})"
 
 
-class CompositeGetter:
-    def __init__(self, *getters: DataGetter):
+class CompositeGetter(MappingGetter):
+    """
+    Merges results of several getters, later ones have higher priority.
+
+    If `concurrent` is set, getters are called concurrently
+    """
+
+    def __init__(self, *getters: DataGetter, concurrent: bool = False):
         self.getters: list[DataGetter] = list(getters)
+        self.concurrent = concurrent
 
-    async def __call__(self, **kwargs):
-        data = {}
+    async def call(self, data: Mapping[str, Any]) -> dict:
+        result = {}
+        if self.concurrent:
+            for getter_result in await gather_in_order(
+                *(call_getter(g, data) for g in self.getters),
+            ):
+                result.update(getter_result)
+            return result
         for g in self.getters:
-            data.update(await g(**kwargs))
-        return data
+            result.update(await call_getter(g, data))
+        return result
 
 
-class StaticGetter:
+class StaticGetter(MappingGetter):
     def __init__(self, data: dict):
         self.data = data
 
-    async def __call__(self, **kwargs):
+    async def call(self, data: Mapping[str, Any]) -> dict:
         return self.data
 
 
-class PreviewAwareGetter:
+@dataclass
+class GetterTiming:
+    calls: int = 0
+    total: float = 0
+    max: float = 0
+
+
+class GetterTimings:
+    """Collects execution time of getters by their names."""
+
+    def __init__(self):
+        self.timings: dict[str, GetterTiming] = {}
+
+    def add(self, name: str, elapsed: float) -> None:
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = GetterTiming()
+        timing.calls += 1
+        timing.total += elapsed
+        timing.max = max(timing.max, elapsed)
+
+    def wrap(self, getter: DataGetter, name: str | None = None) -> DataGetter:
+        if name is None:
+            name = _getter_name(getter)
+        return TimedGetter(getter, name, self)
+
+
+def _getter_name(getter: DataGetter) -> str:
+    if isinstance(getter, BoundGetter):
+        getter = getter.getter
+    return getattr(getter, "__qualname__", None) or repr(getter)
+
+
+class TimedGetter(MappingGetter):
+    def __init__(self, getter: DataGetter, name: str, timings: GetterTimings):
+        self.getter = getter
+        self.name = name
+        self.timings = timings
+
+    async def call(self, data: Mapping[str, Any]) -> dict:
+        started = time.perf_counter()
+        try:
+            return await call_getter(self.getter, data)
+        finally:
+            self.timings.add(self.name, time.perf_counter() - started)
+
+
+class PreviewAwareGetter(MappingGetter):
     def __init__(self, normal_getter: DataGetter, preview_getter: DataGetter):
         self.normal_getter = normal_getter
         self.preview_getter = preview_getter
 
-    async def __call__(self, dialog_manager: DialogManager, **kwargs):
-        if dialog_manager.is_preview():
-            return await self.preview_getter(
-                dialog_manager=dialog_manager, **kwargs,
-            )
+    async def call(self, data: Mapping[str, Any]) -> dict:
+        if data["dialog_manager"].is_preview():
+            return await call_getter(self.preview_getter, data)
         else:
-            return await self.normal_getter(
-                dialog_manager=dialog_manager, **kwargs,
-            )
+            return await call_getter(self.normal_getter, data)
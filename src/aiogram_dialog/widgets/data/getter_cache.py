@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import Callable, Hashable, Mapping
+from enum import Enum
+from typing import Any
+
+from aiogram_dialog.api.entities import EVENT_CONTEXT_KEY
+from aiogram_dialog.api.internal.widgets import DataGetter
+from aiogram_dialog.api.protocols import DialogManager
+from aiogram_dialog.cache import CacheStats, StatsTTLCache
+from .data_context import BoundGetter, MappingGetter, call_getter
+
+KeyFunc = Callable[[DialogManager], Hashable]
+
+
+class GetterCacheKey(Enum):
+    GLOBAL = "global"  # same data for all users
+    USER = "user"
+    CONTEXT = "context"  # opened dialog
+
+
+def _global_key(manager: DialogManager) -> Hashable:
+    return None
+
+
+def _user_key(manager: DialogManager) -> Hashable:
+    return manager.middleware_data[EVENT_CONTEXT_KEY].user.id
+
+
+def _context_key(manager: DialogManager) -> Hashable:
+    return manager.current_context().id
+
+
+_KEY_FUNCS = {
+    GetterCacheKey.GLOBAL: _global_key,
+    GetterCacheKey.USER: _user_key,
+    GetterCacheKey.CONTEXT: _context_key,
+}
+
+
+class CachedGetter(MappingGetter):
+    """
+    Getter which reuses results of another getter for `ttl` seconds.
+
+    Results are shared between calls with the same key, so they must not
+    be modified. Concurrent calls with the same key wait for a single
+    call of the original getter.
+    """
+
+    def __init__(
+            self,
+            getter: DataGetter,
+            key: GetterCacheKey | KeyFunc = GetterCacheKey.GLOBAL,
+            ttl: float = 60,
+            maxsize: int = 1024,
+    ):
+        if not isinstance(getter, MappingGetter):
+            getter = BoundGetter(getter)
+        self.getter = getter
+        if isinstance(key, GetterCacheKey):
+            key = _KEY_FUNCS[key]
+        self.key = key
+        self.stats = CacheStats()
+        self.cache = StatsTTLCache(
+            maxsize=maxsize, ttl=ttl, stats=self.stats,
+        )
+        self._pending: dict[Hashable, asyncio.Future] = {}
+
+    def invalidate(self) -> None:
+        self.cache.clear()
+
+    async def _load(self, key: Hashable, data: Mapping[str, Any]) -> dict:
+        try:
+            result = await call_getter(self.getter, data)
+            self.cache[key] = result
+            return result
+        finally:
+            del self._pending[key]
+
+    async def call(self, data: Mapping[str, Any]) -> dict:
+        key = self.key(data["dialog_manager"])
+        result = self.cache.get(key)
+        if result is not None:
+            self.stats.hits += 1
+            return result
+        self.stats.misses += 1
+        pending = self._pending.get(key)
+        if pending is None:
+            # loading is not cancelled together with one of waiting calls
+            pending = asyncio.ensure_future(self._load(key, data))
+            self._pending[key] = pending
+        return await asyncio.shield(pending)
+
+
+def cached_getter(
+        key: GetterCacheKey | KeyFunc = GetterCacheKey.GLOBAL,
+        ttl: float = 60,
+        maxsize: int = 1024,
+) -> Callable[[DataGetter], CachedGetter]:
+    """Decorator creating `CachedGetter`."""
+
+    def decorator(getter: DataGetter) -> CachedGetter:
+        return CachedGetter(getter, key=key, ttl=ttl, maxsize=maxsize)
+
+    return decorator
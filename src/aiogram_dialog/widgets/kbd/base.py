@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Iterable
 
 from aiogram.types import CallbackQuery
 
@@ -11,6 +12,23 @@ from aiogram_dialog.widgets.common import (
     WhenCondition,
 )
 
+CallbackRoutes = list[tuple[str, "Keyboard"]]
+
+
+def collect_callback_routes(
+        widgets: Iterable[KeyboardWidget],
+) -> CallbackRoutes | None:
+    """Join callback routes of widgets, `None` if any of them has no routes."""
+    routes = []
+    for widget in widgets:
+        if not isinstance(widget, Keyboard):
+            return None
+        widget_routes = widget.get_callback_routes()
+        if widget_routes is None:
+            return None
+        routes.extend(widget_routes)
+    return routes
+
 
 class Keyboard(Actionable, Whenable, KeyboardWidget):
     def __init__(self, id: str | None = None, when: WhenCondition = None):
@@ -46,6 +64,31 @@ class Keyboard(Actionable, Whenable, KeyboardWidget):
         """
         raise NotImplementedError
 
+    def _own_callback_routes(self) -> CallbackRoutes:
+        if not self.widget_id:
+            return []
+        return [(self.widget_id, self)]
+
+    def _overrides_callbacks(self, base: type["Keyboard"]) -> bool:
+        """Check if callback processing is changed compared to `base`."""
+        return any(
+            getattr(type(self), name) is not getattr(base, name)
+            for name in ("process_callback", "_process_other_callback")
+        )
+
+    def get_callback_routes(self) -> CallbackRoutes | None:
+        """
+        Get widget ids in callback data and widgets processing them.
+
+        Used by window to dispatch callbacks without walking through
+        the whole keyboard. `None` means that the widget can process
+        callbacks with any data, so all of them are passed to it.
+        Override this method if you override `_process_other_callback`.
+        """
+        if self._overrides_callbacks(Keyboard):
+            return None
+        return self._own_callback_routes()
+
     def callback_prefix(self):
         if not self.widget_id:
             return None
@@ -138,6 +181,11 @@ class Or(Keyboard):
                 return res
         return []
 
+    def get_callback_routes(self) -> CallbackRoutes | None:
+        if self._overrides_callbacks(Or):
+            return None
+        return collect_callback_routes(self.widgets)
+
     async def _process_other_callback(
             self,
             callback: CallbackQuery,
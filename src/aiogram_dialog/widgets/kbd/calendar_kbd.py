@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     Protocol,
@@ -16,9 +18,14 @@ from aiogram.types import CallbackQuery, InlineKeyboardButton
 from aiogram_dialog.api.entities import ChatEvent
 from aiogram_dialog.api.internal import RawKeyboard, StyleWidget, TextWidget
 from aiogram_dialog.api.protocols import DialogManager, DialogProtocol
-from aiogram_dialog.widgets.common import ManagedWidget, WhenCondition
-from aiogram_dialog.widgets.style import EMPTY_STYLE
+from aiogram_dialog.widgets.common import (
+    ManagedWidget,
+    WhenCondition,
+    true_condition,
+)
+from aiogram_dialog.widgets.style import EMPTY_STYLE, Style
 from aiogram_dialog.widgets.text import Format
+from aiogram_dialog.widgets.text.format import compile_format
 from aiogram_dialog.widgets.widget_event import (
     WidgetEventProcessor,
     ensure_event_processor,
@@ -64,6 +71,76 @@ def empty_button():
     return InlineKeyboardButton(text=" ", callback_data="")
 
 
+# text, style, data for them and callback data of a button.
+# `None` is used for empty button
+CellSpec = tuple[TextWidget, StyleWidget, dict, str] | None
+
+
+def _get_sync_render(
+        text: TextWidget, style: StyleWidget,
+) -> Callable[[dict], str] | None:
+    """Get function rendering text if text and style need no awaiting."""
+    if (
+            type(text) is Format
+            and text.condition is true_condition
+            and type(style) is Style
+            and style.condition is true_condition
+    ):
+        return compile_format(text.text)
+    return None
+
+
+def _overrides(view: Any, base: type, name: str) -> bool:
+    """Check if button rendering method is changed in subclass."""
+    return getattr(type(view), name) is not getattr(base, name)
+
+
+def _render_sync(
+        render: Callable[[dict], str], text: TextWidget, data: dict,
+) -> str:
+    try:
+        return render(data)
+    except Exception as e:
+        # same note as `Text.render_text` adds
+        if sys.version_info >= (3, 11):
+            e.add_note(f"at {text!r}")
+        raise
+
+
+async def render_cells(
+        cells: Iterable[CellSpec], manager: DialogManager,
+) -> list[InlineKeyboardButton]:
+    """
+    Render calendar buttons.
+
+    Default texts and styles are rendered in a batch without
+    calling widgets for each button.
+    """
+    preview = manager.is_preview()
+    buttons = []
+    for cell in cells:
+        if cell is None:
+            buttons.append(empty_button())
+            continue
+        text, style, data, callback_data = cell
+        render = None if preview else _get_sync_render(text, style)
+        if render is None:
+            buttons.append(InlineKeyboardButton(
+                text=await text.render_text(data, manager),
+                callback_data=callback_data,
+                style=await style.render_style(data, manager),
+                icon_custom_emoji_id=await style.render_emoji(data, manager),
+            ))
+        else:
+            buttons.append(InlineKeyboardButton(
+                text=_render_sync(render, text, data),
+                callback_data=callback_data,
+                style=style.style,
+                icon_custom_emoji_id=style.emoji_id,
+            ))
+    return buttons
+
+
 class CalendarScope(Enum):
     DAYS = "DAYS"
     MONTHS = "MONTHS"
@@ -95,6 +172,41 @@ def get_today(tz: timezone):
     return datetime.now(tz).date()
 
 
+@lru_cache(maxsize=1024)
+def month_grid(
+        month: date, firstweekday: int, min_date: date, max_date: date,
+) -> tuple[tuple[date | None, ...], ...]:
+    """
+    Get dates shown for a month split by weeks.
+
+    Dates out of the month or allowed range are replaced with `None`
+    """
+    # align beginning
+    start_date = month_begin(month)
+    min_date = max(min_date, start_date)
+    days_since_week_start = start_date.weekday() - firstweekday
+    if days_since_week_start < 0:
+        days_since_week_start += 7
+    start_date -= timedelta(days=days_since_week_start)
+    end_date = next_month_begin(month) - timedelta(days=1)
+    # align ending
+    max_date = min(max_date, end_date)
+    days_since_week_start = end_date.weekday() - firstweekday
+    days_till_week_end = (6 - days_since_week_start) % 7
+    end_date += timedelta(days=days_till_week_end)
+    grid = []
+    for offset in range(0, (end_date - start_date).days, 7):
+        row = []
+        for row_offset in range(7):
+            current_date = start_date + timedelta(days=offset + row_offset)
+            if min_date <= current_date <= max_date:
+                row.append(current_date)
+            else:
+                row.append(None)
+        grid.append(tuple(row))
+    return tuple(grid)
+
+
 class CalendarData(TypedDict):
     current_scope: str
     current_offset: str
@@ -220,13 +332,14 @@ class CalendarDaysView(CalendarScopeView):
         self.next_month_style = next_month_style
         self.prev_month_style = prev_month_style
 
-    async def _render_date_button(
+    def _date_cell(
             self,
-            selected_date: date,
+            selected_date: date | None,
             today: date,
             data: dict,
-            manager: DialogManager,
-    ) -> InlineKeyboardButton:
+    ) -> CellSpec:
+        if selected_date is None:
+            return None
         current_data = {
             "date": selected_date,
             "data": data,
@@ -239,18 +352,21 @@ class CalendarDaysView(CalendarScopeView):
             style = self.date_style
 
         raw_date = raw_from_date(selected_date)
-
-        return InlineKeyboardButton(
-            text=await text.render_text(
-                current_data, manager,
-            ),
-            callback_data=self.callback_generator(str(raw_date)),
-            style=await style.render_style(current_data, manager),
-            icon_custom_emoji_id=await style.render_emoji(
-                current_data, manager,
-            ),
+        return (
+            text, style, current_data,
+            self.callback_generator(str(raw_date)),
         )
 
+    async def _render_date_button(
+            self,
+            selected_date: date,
+            today: date,
+            data: dict,
+            manager: DialogManager,
+    ) -> InlineKeyboardButton:
+        cell = self._date_cell(selected_date, today, data)
+        return (await render_cells([cell], manager))[0]
+
     async def _render_days(
             self,
             config: CalendarConfig,
@@ -258,35 +374,31 @@ class CalendarDaysView(CalendarScopeView):
             data: dict,
             manager: DialogManager,
     ) -> list[list[InlineKeyboardButton]]:
-        keyboard = []
-        # align beginning
-        start_date = offset.replace(day=1)  # month beginning
-        min_date = max(config.min_date, start_date)
-        days_since_week_start = start_date.weekday() - config.firstweekday
-        if days_since_week_start < 0:
-            days_since_week_start += 7
-        start_date -= timedelta(days=days_since_week_start)
-        end_date = next_month_begin(offset) - timedelta(days=1)
-        # align ending
-        max_date = min(config.max_date, end_date)
-        days_since_week_start = end_date.weekday() - config.firstweekday
-        days_till_week_end = (6 - days_since_week_start) % 7
-        end_date += timedelta(days=days_till_week_end)
-        # add days
+        grid = month_grid(
+            month_begin(offset), config.firstweekday,
+            config.min_date, config.max_date,
+        )
         today = get_today(config.timezone)
-        for offset in range(0, (end_date - start_date).days, 7):  # noqa: PLR1704
-            row = []
-            for row_offset in range(7):
-                days_offset = timedelta(days=(offset + row_offset))
-                current_date = start_date + days_offset
-                if min_date <= current_date <= max_date:
-                    row.append(await self._render_date_button(
+        if _overrides(self, CalendarDaysView, "_render_date_button"):
+            return [
+                [
+                    await self._render_date_button(
                         current_date, today, data, manager,
-                    ))
-                else:
-                    row.append(empty_button())
-            keyboard.append(row)
-        return keyboard
+                    )
+                    if current_date is not None else empty_button()
+                    for current_date in row
+                ]
+                for row in grid
+            ]
+        buttons = await render_cells(
+            (
+                self._date_cell(current_date, today, data)
+                for row in grid
+                for current_date in row
+            ),
+            manager,
+        )
+        return [buttons[i:i + 7] for i in range(0, len(buttons), 7)]
 
     async def _render_week_header(
             self,
@@ -295,23 +407,18 @@ class CalendarDaysView(CalendarScopeView):
             manager: DialogManager,
     ) -> list[InlineKeyboardButton]:
         week_range = range(config.firstweekday, config.firstweekday + 7)
-        header = []
+        cells = []
         for week_day in week_range:
             week_day = week_day % 7 + 1
-            data = {
+            week_day_data = {
                 "week_day": week_day,
                 "date": BEARING_DATE.replace(day=week_day),
                 "data": data,
             }
-            header.append(InlineKeyboardButton(
-                text=await self.weekday_text.render_text(data, manager),
-                callback_data="",
-                style=await self.weekday_style.render_style(data, manager),
-                icon_custom_emoji_id=await self.weekday_style.render_emoji(
-                    data, manager,
-                ),
-            ))
-        return header
+            cells.append(
+                (self.weekday_text, self.weekday_style, week_day_data, ""),
+            )
+        return await render_cells(cells, manager)
 
     async def _render_pager(
             self,
@@ -550,17 +657,16 @@ class CalendarMonthView(CalendarScopeView):
         end = next_month_begin(start) - timedelta(days=1)
         return end >= config.min_date and start <= config.max_date
 
-    async def _render_month_button(
+    def _month_cell(
             self,
             month: int,
             this_month: int,
             data: dict,
             offset: date,
             config: CalendarConfig,
-            manager: DialogManager,
-    ) -> InlineKeyboardButton:
+    ) -> CellSpec:
         if not self._is_month_allowed(config, offset, month):
-            return empty_button()
+            return None
 
         month_data = {
             "month": month,
@@ -574,21 +680,23 @@ class CalendarMonthView(CalendarScopeView):
             text = self.month_text
             style = self.month_style
 
-        return InlineKeyboardButton(
-            text=await text.render_text(
-                month_data, manager,
-            ),
-            callback_data=self.callback_generator(
-                f"{CALLBACK_PREFIX_MONTH}{month}",
-            ),
-            style=await style.render_style(
-                month_data, manager,
-            ),
-            icon_custom_emoji_id=await style.render_emoji(
-                month_data, manager,
-            ),
+        return (
+            text, style, month_data,
+            self.callback_generator(f"{CALLBACK_PREFIX_MONTH}{month}"),
         )
 
+    async def _render_month_button(
+            self,
+            month: int,
+            this_month: int,
+            data: dict,
+            offset: date,
+            config: CalendarConfig,
+            manager: DialogManager,
+    ) -> InlineKeyboardButton:
+        cell = self._month_cell(month, this_month, data, offset, config)
+        return (await render_cells([cell], manager))[0]
+
     async def _render_months(
             self,
             config: CalendarConfig,
@@ -602,14 +710,27 @@ class CalendarMonthView(CalendarScopeView):
             this_month = today.month
         else:
             this_month = -1
+        if _overrides(self, CalendarMonthView, "_render_month_button"):
+            return [
+                [
+                    await self._render_month_button(
+                        row + column, this_month, data, offset, config,
+                        manager,
+                    )
+                    for column in range(config.month_columns)
+                ]
+                for row in range(1, 13, config.month_columns)
+            ]
         for row in range(1, 13, config.month_columns):
-            keyboard_row = []
-            for column in range(config.month_columns):
-                month = row + column
-                keyboard_row.append(await self._render_month_button(
-                    month, this_month, data, offset, config, manager,
-                ))
-            keyboard.append(keyboard_row)
+            keyboard.append(await render_cells(
+                (
+                    self._month_cell(
+                        row + column, this_month, data, offset, config,
+                    )
+                    for column in range(config.month_columns)
+                ),
+                manager,
+            ))
         return keyboard
 
     async def _render_header(
@@ -738,16 +859,15 @@ class CalendarYearsView(CalendarScopeView):
     def _is_year_allowed(self, config: CalendarConfig, year: int) -> bool:
         return config.min_date.year <= year <= config.max_date.year
 
-    async def _render_year_button(
+    def _year_cell(
             self,
             year: int,
             this_year: int,
             data: dict,
             config: CalendarConfig,
-            manager: DialogManager,
-    ) -> InlineKeyboardButton:
+    ) -> CellSpec:
         if not self._is_year_allowed(config, year):
-            return empty_button()
+            return None
         if year == this_year:
             text = self.this_year_text
             style = self.this_year_style
@@ -760,21 +880,22 @@ class CalendarYearsView(CalendarScopeView):
             "date": BEARING_DATE.replace(year=year),
             "data": data,
         }
-        return InlineKeyboardButton(
-            text=await text.render_text(
-                year_data, manager,
-            ),
-            callback_data=self.callback_generator(
-                f"{CALLBACK_PREFIX_YEAR}{year}",
-            ),
-            style=await style.render_style(
-                year_data, manager,
-            ),
-            icon_custom_emoji_id=await style.render_emoji(
-                year_data, manager,
-            ),
+        return (
+            text, style, year_data,
+            self.callback_generator(f"{CALLBACK_PREFIX_YEAR}{year}"),
         )
 
+    async def _render_year_button(
+            self,
+            year: int,
+            this_year: int,
+            data: dict,
+            config: CalendarConfig,
+            manager: DialogManager,
+    ) -> InlineKeyboardButton:
+        cell = self._year_cell(year, this_year, data, config)
+        return (await render_cells([cell], manager))[0]
+
     async def _render_years(
             self,
             config: CalendarConfig,
@@ -787,14 +908,27 @@ class CalendarYearsView(CalendarScopeView):
         years_columns = config.years_columns
         years_per_page = config.years_per_page
 
+        if _overrides(self, CalendarYearsView, "_render_year_button"):
+            return [
+                [
+                    await self._render_year_button(
+                        offset.year + row + column, this_year, data, config,
+                        manager,
+                    )
+                    for column in range(years_columns)
+                ]
+                for row in range(0, years_per_page, years_columns)
+            ]
         for row in range(0, years_per_page, years_columns):
-            keyboard_row = []
-            for column in range(years_columns):
-                curr_year = offset.year + row + column
-                keyboard_row.append(await self._render_year_button(
-                    curr_year, this_year, data, config, manager,
-                ))
-            keyboard.append(keyboard_row)
+            keyboard.append(await render_cells(
+                (
+                    self._year_cell(
+                        offset.year + row + column, this_year, data, config,
+                    )
+                    for column in range(years_columns)
+                ),
+                manager,
+            ))
         return keyboard
 
     async def render(
@@ -6,7 +6,11 @@ from aiogram.types import CallbackQuery, InlineKeyboardButton
 from aiogram_dialog.api.internal import ButtonVariant, RawKeyboard
 from aiogram_dialog.api.protocols import DialogManager, DialogProtocol
 from aiogram_dialog.widgets.common import WhenCondition
-from .base import Keyboard
+from .base import (
+    CallbackRoutes,
+    Keyboard,
+    collect_callback_routes,
+)
 
 
 class Group(Keyboard):
@@ -64,6 +68,14 @@ class Group(Keyboard):
             res.append(row)
         return res
 
+    def get_callback_routes(self) -> CallbackRoutes | None:
+        if self._overrides_callbacks(Group):
+            return None
+        routes = collect_callback_routes(self.buttons)
+        if routes is None:
+            return None
+        return self._own_callback_routes() + routes
+
     async def _process_other_callback(
             self,
             callback: CallbackQuery,
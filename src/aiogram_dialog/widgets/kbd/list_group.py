@@ -1,15 +1,22 @@
-from collections.abc import Callable, Sequence
+from collections.abc import Callable
+from itertools import chain
 from typing import Any
 
 from aiogram.types import CallbackQuery
 
 from aiogram_dialog.api.entities import ChatEvent
-from aiogram_dialog.api.internal import RawKeyboard, Widget
+from aiogram_dialog.api.internal import (
+    ButtonVariant,
+    PagedKeyboardWidget,
+    RawKeyboard,
+    Widget,
+)
 from aiogram_dialog.api.protocols import (
     DialogManager,
     DialogProtocol,
 )
 from aiogram_dialog.manager.sub_manager import SubManager
+from aiogram_dialog.utils import add_exception_note
 from aiogram_dialog.widgets.common import (
     BaseScroll,
     ManagedScroll,
@@ -19,15 +26,19 @@ from aiogram_dialog.widgets.common import (
 )
 from aiogram_dialog.widgets.common.items import (
     ItemsGetterVariant,
+    ItemsSource,
+    as_items_source,
     get_items_getter,
+    is_sliceable,
 )
+from aiogram_dialog.widgets.common.render_memo import memoize
 from aiogram_dialog.widgets.widget_event import ensure_event_processor
 from .base import Keyboard
 
 ItemIdGetter = Callable[[Any], str | int]
 
 
-class ListGroup(Keyboard, BaseScroll):
+class ListGroup(Keyboard, BaseScroll, PagedKeyboardWidget):
     def __init__(
             self,
             *buttons: Keyboard,
@@ -37,43 +48,99 @@ class ListGroup(Keyboard, BaseScroll):
             when: WhenCondition = None,
             page_size: int = 0,
             on_page_changed: OnPageChangedVariants = None,
+            item_rows: int | None = None,
     ):
         super().__init__(id=id, when=when)
         self.buttons = buttons
         self.item_id_getter = item_id_getter
         self.items_getter = get_items_getter(items)
         self.page_size = page_size
+        # exact number of rows for each item, if it is known
+        # `ScrollingGroup` can render only visible items
+        self.item_rows = item_rows
         self.on_page_changed = ensure_event_processor(on_page_changed)
 
-    def _get_page_count(self, items: Sequence[object]) -> int:
+    def _get_page_count(self, total: int) -> int:
         if self.page_size == 0:
             return 1
-        total = len(items)
         return total // self.page_size + bool(total % self.page_size)
 
     async def get_page_count(self, data: dict, manager: DialogManager) -> int:
         if self.page_size == 0:
             return 1
-        return self._get_page_count(self.items_getter(data))
-
+        source = as_items_source(self.items_getter(data))
+        total = await memoize(self, "count", data, source.count)
+        return self._get_page_count(total)
+
+    async def _get_page_range(
+            self, data: dict, manager: DialogManager,
+    ) -> tuple[ItemsSource, int, int]:
+        """Get items source, offset and number of items on current page."""
+        source = as_items_source(self.items_getter(data))
+        total = await memoize(self, "count", data, source.count)
+        if self.page_size == 0 or total == 0:
+            return source, 0, total
+        page = await self.get_page(manager)
+        total_pages = self._get_page_count(total)
+        offset = min(total_pages - 1, page) * self.page_size
+        return source, offset, min(self.page_size, total - offset)
 
     async def _render_keyboard(
         self, data: dict, manager: DialogManager,
     ) -> RawKeyboard:
         kbd: RawKeyboard = []
-        items = self.items_getter(data)
-        if self.page_size > 0:
-            page = await self.get_page(manager)
-            total_pages = self._get_page_count(items)
-            offset = min(total_pages - 1, page) * self.page_size
-            items = items[offset:offset+self.page_size]
-        else:
-            offset = 0
-
+        source, offset, count = await self._get_page_range(data, manager)
+        items = await source.slice(offset, count)
         for pos, item in enumerate(items, offset):
             kbd.extend(await self._render_item(pos, item, data, manager))
         return kbd
 
+    async def get_rows_count(
+            self, data: dict, manager: DialogManager,
+    ) -> int | None:
+        if self.item_rows is None:
+            return None
+        if not self.is_(data, manager):
+            return 0
+        if not is_sliceable(self.items_getter(data)):
+            return None  # items can be read only once
+        _, _, count = await self._get_page_range(data, manager)
+        return count * self.item_rows
+
+    @add_exception_note
+    async def render_rows(
+            self, data: dict, manager: DialogManager, offset: int, limit: int,
+    ) -> RawKeyboard:
+        if not self.is_(data, manager):
+            return []
+        if self.item_rows is None:
+            kbd = await self._render_keyboard(data, manager)
+            return kbd[offset:offset + limit]
+        source, items_offset, count = await self._get_page_range(
+            data, manager,
+        )
+        first = offset // self.item_rows
+        last = min(count, -(-(offset + limit) // self.item_rows))
+        if last <= first:
+            return []
+        items = await source.slice(items_offset + first, last - first)
+        kbd: RawKeyboard = []
+        for pos, item in enumerate(items, items_offset + first):
+            kbd.extend(await self._render_item(pos, item, data, manager))
+        skipped = offset - first * self.item_rows
+        return kbd[skipped:skipped + limit]
+
+    async def get_buttons_count(
+            self, data: dict, manager: DialogManager,
+    ) -> int | None:
+        return None  # items can have different number of buttons in a row
+
+    async def render_buttons(
+            self, data: dict, manager: DialogManager, offset: int, limit: int,
+    ) -> list[ButtonVariant]:
+        kbd = await self.render_keyboard(data, manager)
+        return list(chain.from_iterable(kbd))[offset:offset + limit]
+
     async def _render_item(
             self,
             pos: int,
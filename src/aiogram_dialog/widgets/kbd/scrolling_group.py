@@ -1,13 +1,16 @@
 
+from itertools import chain
+
 from aiogram.types import CallbackQuery, InlineKeyboardButton
 
-from aiogram_dialog.api.internal import RawKeyboard
+from aiogram_dialog.api.internal import PagedKeyboardWidget, RawKeyboard
 from aiogram_dialog.api.protocols import DialogManager, DialogProtocol
 from aiogram_dialog.widgets.common import (
     BaseScroll,
     OnPageChangedVariants,
     WhenCondition,
 )
+from aiogram_dialog.widgets.common.render_memo import memoize
 from .base import Keyboard
 from .group import Group
 
@@ -30,19 +33,6 @@ class ScrollingGroup(Group, BaseScroll):
         self.hide_on_single_page = hide_on_single_page
         self.hide_pager = hide_pager
 
-    def _get_page_count(
-            self,
-            keyboard: RawKeyboard,
-    ) -> int:
-        return len(keyboard) // self.height + bool(len(keyboard) % self.height)
-
-    async def _render_contents(
-            self,
-            data: dict,
-            manager: DialogManager,
-    ) -> RawKeyboard:
-        return await super()._render_keyboard(data, manager)
-
     async def _render_pager(
             self,
             pages: int,
@@ -82,30 +72,99 @@ class ScrollingGroup(Group, BaseScroll):
             ],
         ]
 
-    async def _render_page(
+    async def _get_parts(
             self,
-            page: int,
-            keyboard: list[list[InlineKeyboardButton]],
-    ) -> list[list[InlineKeyboardButton]]:
-        pages = self._get_page_count(keyboard)
-        last_page = pages - 1
-        current_page = min(last_page, page)
-        page_offset = current_page * self.height
+            data: dict,
+            manager: DialogManager,
+    ) -> list[tuple[int, PagedKeyboardWidget | list]]:
+        """
+        Get sizes of children contents without rendering when possible.
+
+        Size is counted in rows or in buttons if rows are rebuilt using
+        `width`. Children which cannot count it are rendered at once.
+        """
+        parts = []
+        for b in self.buttons:
+            size = None
+            if isinstance(b, PagedKeyboardWidget):
+                if self.width is None:
+                    size = await b.get_rows_count(data, manager)
+                else:
+                    size = await b.get_buttons_count(data, manager)
+            if size is not None:
+                parts.append((size, b))
+                continue
+            b_kbd = await b.render_keyboard(data, manager)
+            if self.width is not None:
+                b_kbd = list(chain.from_iterable(b_kbd))
+            parts.append((len(b_kbd), b_kbd))
+        return parts
+
+    def _get_parts_page_count(
+            self,
+            parts: list[tuple[int, PagedKeyboardWidget | list]],
+    ) -> int:
+        total = sum(size for size, _ in parts)
+        if self.width is not None:
+            total = total // self.width + bool(total % self.width)
+        return total // self.height + bool(total % self.height)
 
-        return keyboard[page_offset: page_offset + self.height]
+    async def _render_parts_page(
+            self,
+            page: int,
+            pages: int,
+            parts: list[tuple[int, PagedKeyboardWidget | list]],
+            data: dict,
+            manager: DialogManager,
+    ) -> RawKeyboard:
+        if pages == 0:
+            return []
+        page_size = self.height
+        if self.width is not None:
+            page_size *= self.width
+        start = min(pages - 1, page) * page_size
+        end = start + page_size
+
+        contents = []
+        part_start = 0
+        for size, part in parts:
+            part_end = part_start + size
+            offset = max(start, part_start) - part_start
+            limit = min(end, part_end) - part_start - offset
+            part_start = part_end
+            if limit <= 0:
+                continue
+            if isinstance(part, list):
+                contents.extend(part[offset:offset + limit])
+            elif self.width is None:
+                contents.extend(
+                    await part.render_rows(data, manager, offset, limit),
+                )
+            else:
+                contents.extend(
+                    await part.render_buttons(data, manager, offset, limit),
+                )
+        if self.width is not None:
+            return self._wrap_kbd(contents)
+        return contents
 
     async def _render_keyboard(
             self,
             data: dict,
             manager: DialogManager,
     ) -> RawKeyboard:
-        keyboard = await self._render_contents(data, manager)
-        pages = self._get_page_count(keyboard)
+        parts = await memoize(
+            self, "parts", data, lambda: self._get_parts(data, manager),
+        )
+        pages = self._get_parts_page_count(parts)
 
         pager = await self._render_pager(pages, manager)
-        page_keyboard = await self._render_page(
+        page_keyboard = await self._render_parts_page(
             page=await self.get_page(manager),
-            keyboard=keyboard,
+            pages=pages,
+            parts=parts,
+            data=data,
+            manager=manager,
         )
 
         return page_keyboard + pager
@@ -121,5 +180,7 @@ class ScrollingGroup(Group, BaseScroll):
         return True
 
     async def get_page_count(self, data: dict, manager: DialogManager) -> int:
-        keyboard = await self._render_contents(data, manager)
-        return self._get_page_count(keyboard=keyboard)
+        parts = await memoize(
+            self, "parts", data, lambda: self._get_parts(data, manager),
+        )
+        return self._get_parts_page_count(parts)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import (
     Any,
     Generic,
@@ -10,12 +10,22 @@ from typing import (
 from aiogram.types import CallbackQuery, InlineKeyboardButton
 
 from aiogram_dialog.api.entities import ChatEvent
-from aiogram_dialog.api.internal import RawKeyboard, StyleWidget, TextWidget
+from aiogram_dialog.api.internal import (
+    PagedKeyboardWidget,
+    RawKeyboard,
+    StyleWidget,
+    TextWidget,
+)
 from aiogram_dialog.api.protocols import DialogManager, DialogProtocol
+from aiogram_dialog.utils import add_exception_note
 from aiogram_dialog.widgets.common import ManagedWidget, WhenCondition
 from aiogram_dialog.widgets.common.items import (
     ItemsGetterVariant,
+    ItemsSource,
+    as_items_source,
+    get_all_items,
     get_items_getter,
+    is_sliceable,
 )
 from aiogram_dialog.widgets.style import EMPTY_STYLE, StyleCase
 from aiogram_dialog.widgets.text import Case
@@ -57,7 +67,7 @@ class OnItemClick(Protocol[ManagedT, T]):
         raise NotImplementedError
 
 
-class Select(Keyboard, Generic[T]):
+class Select(Keyboard, PagedKeyboardWidget, Generic[T]):
     def __init__(
             self,
             text: TextWidget,
@@ -86,13 +96,65 @@ class Select(Keyboard, Generic[T]):
             data: dict,
             manager: DialogManager,
     ) -> RawKeyboard:
+        items = await get_all_items(self._get_source(data))
+        return [await self._render_items(items, 0, data, manager)]
+
+    def _get_source(self, data: dict) -> ItemsSource:
+        return as_items_source(self.items_getter(data))
+
+    async def _render_items(
+            self, items: Sequence, offset: int, data: dict,
+            manager: DialogManager,
+    ) -> list[InlineKeyboardButton]:
         return [
-            [
-                await self._render_button(pos, item, item, data, manager)
-                for pos, item in enumerate(self.items_getter(data))
-            ],
+            await self._render_button(pos, item, item, data, manager)
+            for pos, item in enumerate(items, offset)
         ]
 
+    def _overrides_rendering(self) -> bool:
+        """Check if keyboard is rendered differently than by `Select`."""
+        return any(
+            getattr(type(self), name) is not getattr(Select, name)
+            for name in ("render_keyboard", "_render_keyboard")
+        )
+
+    async def get_rows_count(
+            self, data: dict, manager: DialogManager,
+    ) -> int | None:
+        if self._overrides_rendering():
+            return None
+        if not self.is_(data, manager):
+            return 0
+        return 1  # all items are in the same row
+
+    async def render_rows(
+            self, data: dict, manager: DialogManager, offset: int, limit: int,
+    ) -> RawKeyboard:
+        if offset > 0 or limit <= 0:
+            return []
+        return await self.render_keyboard(data, manager)
+
+    async def get_buttons_count(
+            self, data: dict, manager: DialogManager,
+    ) -> int | None:
+        if self._overrides_rendering():
+            return None
+        if not self.is_(data, manager):
+            return 0
+        items = self.items_getter(data)
+        if not is_sliceable(items):
+            return None  # items can be read only once
+        return await as_items_source(items).count()
+
+    @add_exception_note
+    async def render_buttons(
+            self, data: dict, manager: DialogManager, offset: int, limit: int,
+    ) -> list[InlineKeyboardButton]:
+        if not self.is_(data, manager):
+            return []
+        items = await self._get_source(data).slice(offset, limit)
+        return await self._render_items(items, offset, data, manager)
+
     async def _render_button(
             self, pos: int, item: Any, target_item: Any, data: dict,
             manager: DialogManager,
@@ -506,7 +568,7 @@ class Toggle(Radio[T], Generic[T]):
             data: dict,
             manager: DialogManager,
     ) -> RawKeyboard:
-        items_it = iter(self.items_getter(data))
+        items_it = iter(await get_all_items(self._get_source(data)))
         first_item = next(items_it, None)
         if first_item is None:
             return [[]]
@@ -8,8 +8,10 @@ from aiogram_dialog.widgets.common import (
 )
 from aiogram_dialog.widgets.common.items import (
     ItemsGetterVariant,
+    as_items_source,
     get_items_getter,
 )
+from aiogram_dialog.widgets.common.render_memo import memoize
 from .base import Media
 
 
@@ -30,11 +32,11 @@ class MediaScroll(Media, BaseScroll):
     async def _render_media(
             self, data: dict, manager: DialogManager,
     ) -> MediaAttachment | None:
-        items = self.items_getter(data)
-        pages = len(items)
+        source = as_items_source(self.items_getter(data))
+        pages = await memoize(self, "count", data, source.count)
         current_page = min(await self.get_page(manager), pages)
 
-        item = items[current_page]
+        item = (await source.slice(current_page, 1))[0]
         return await self.media.render_media(
             {
                 "current_page": current_page,
@@ -49,5 +51,5 @@ class MediaScroll(Media, BaseScroll):
         )
 
     async def get_page_count(self, data: dict, manager: DialogManager) -> int:
-        items = self.items_getter(data)
-        return len(items)
+        source = as_items_source(self.items_getter(data))
+        return await memoize(self, "count", data, source.count)
@@ -1,3 +1,8 @@
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from string import Formatter
+from typing import Any
+
 from aiogram_dialog.api.protocols import DialogManager
 from aiogram_dialog.widgets.common import WhenCondition
 from .base import Text
@@ -26,14 +31,83 @@ class _FormatDataStub:
         return f"{{{res}}}"
 
 
+RenderFunc = Callable[[Mapping[str, Any]], str]
+
+_FORMATTER = Formatter()
+
+
+def _compile_field(
+        field_name: str, format_spec: str, conversion: str | None,
+) -> RenderFunc:
+    if not format_spec and conversion is None and field_name.isidentifier():
+        def render_plain(data: Mapping[str, Any]) -> str:
+            return format(data[field_name])
+
+        return render_plain
+
+    def render(data: Mapping[str, Any]) -> str:
+        value, _ = _FORMATTER.get_field(field_name, (), data)
+        value = _FORMATTER.convert_field(value, conversion)
+        return format(value, format_spec)
+
+    return render
+
+
+def _is_supported(field_name: str, format_spec: str) -> bool:
+    first = field_name.split(".", 1)[0].split("[", 1)[0]
+    if not first or first.isdigit():
+        return False  # positional fields are not supported by format_map
+    return "{" not in format_spec  # nested fields
+
+
+@lru_cache(maxsize=4096)
+def compile_format(text: str) -> RenderFunc:
+    """
+    Parse format string once into a function with `str.format_map` result.
+
+    Compiled functions are shared for the same text. Templates with
+    nested or positional fields are rendered using `str.format_map`
+    """
+    try:
+        parsed = list(_FORMATTER.parse(text))
+    except ValueError:
+        return text.format_map  # raise the same error on render
+    parts: list[str | RenderFunc] = []
+    for literal, field_name, format_spec, conversion in parsed:
+        if literal:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        if not _is_supported(field_name, format_spec):
+            return text.format_map
+        parts.append(_compile_field(field_name, format_spec, conversion))
+
+    if not parts:
+        return lambda data: ""
+    if len(parts) == 1:
+        part = parts[0]
+        if isinstance(part, str):
+            return lambda data: part
+        return part
+
+    def render(data: Mapping[str, Any]) -> str:
+        return "".join([
+            part if isinstance(part, str) else part(data)
+            for part in parts
+        ])
+
+    return render
+
+
 class Format(Text):
     def __init__(self, text: str, when: WhenCondition = None):
         super().__init__(when=when)
         self.text = text
+        self._render = compile_format(text)
 
     async def _render_text(
             self, data: dict, manager: DialogManager,
     ) -> str:
         if manager.is_preview():
             return self.text.format_map(_FormatDataStub(data=data))
-        return self.text.format_map(data)
+        return self._render(data)
@@ -3,10 +3,12 @@ from collections.abc import Callable, Iterable, Mapping
 from typing import (
     Any,
 )
+from weakref import WeakKeyDictionary, WeakSet
 
 from aiogram import Bot, Dispatcher
-from jinja2 import BaseLoader, Environment
+from jinja2 import BaseLoader, Environment, Template, meta
 
+from aiogram_dialog.api.entities import RenderData
 from aiogram_dialog.api.protocols import DialogManager
 from aiogram_dialog.widgets.common import WhenCondition
 from .base import Text
@@ -20,10 +22,49 @@ Filters = (
 )
 
 
+# all created widgets to be compiled at startup
+_jinja_widgets: WeakSet["Jinja"] = WeakSet()
+
+
+def _is_cacheable(env: Environment) -> bool:
+    # templates from other loaders can be reloaded by environment
+    return isinstance(env.loader, StubLoader) or not env.auto_reload
+
+
 class Jinja(Text):
     def __init__(self, text: str, when: WhenCondition = None):
         super().__init__(when=when)
         self.template_text = text
+        self._templates: WeakKeyDictionary[Environment, Template] = (
+            WeakKeyDictionary()
+        )
+        self._variables: WeakKeyDictionary[Environment, frozenset[str]] = (
+            WeakKeyDictionary()
+        )
+        _jinja_widgets.add(self)
+
+    def get_template(self, env: Environment) -> Template:
+        """Get template compiled once for the environment."""
+        if not _is_cacheable(env):
+            return env.get_template(self.template_text)
+        template = self._templates.get(env)
+        if template is None:
+            template = env.get_template(self.template_text)
+            self._templates[env] = template
+        return template
+
+    def get_variables(self, env: Environment) -> frozenset[str] | None:
+        """Get names of data used by template, `None` if unknown."""
+        if not _is_cacheable(env):
+            return None
+        variables = self._variables.get(env)
+        if variables is None:
+            source, _, _ = env.loader.get_source(env, self.template_text)
+            variables = frozenset(
+                meta.find_undeclared_variables(env.parse(source)),
+            )
+            self._variables[env] = variables
+        return variables
 
     async def _render_text(
             self, data: dict, manager: DialogManager,
@@ -33,7 +74,10 @@ class Jinja(Text):
         else:
             bot: Bot = manager.middleware_data.get("bot")
             env: Environment = getattr(bot, JINJA_ENV_FIELD, default_env)
-        template = env.get_template(self.template_text)
+        template = self.get_template(env)
+        if isinstance(data, RenderData):
+            # template data is not lazy, so load all used values
+            data = data.resolve(self.get_variables(env))
 
         if env.is_async:
             return await template.render_async(data)
@@ -61,12 +105,33 @@ def _create_env(
     return env
 
 
+def precompile_templates(env: Environment) -> None:
+    """Compile templates of all created `Jinja` widgets."""
+    for widget in list(_jinja_widgets):
+        widget.get_template(env)
+        widget.get_variables(env)
+
+
+def _precompile_callback(env: Environment) -> Callable:
+    async def _precompile_templates():
+        precompile_templates(env)
+
+    return _precompile_templates
+
+
 def setup_jinja(
         dp: Bot | Dispatcher,
         *args: Any,
         filters: Filters | None = None,
+        precompile: bool = False,
         **kwargs: Any,
 ) -> Environment:
+    """
+    Create jinja environment used by `Jinja` widgets.
+
+    If `precompile` is set, templates of all widgets are compiled on
+    dispatcher startup, so errors in them are found early
+    """
     env = _create_env(*args, filters=filters, **kwargs)
     if isinstance(dp, Bot):
         warnings.warn(
@@ -75,8 +140,12 @@ def setup_jinja(
             stacklevel=2,
         )
         setattr(dp, JINJA_ENV_FIELD, env)
+        if precompile:
+            precompile_templates(env)
     else:
         dp[JINJA_ENV_FIELD] = env
+        if precompile:
+            dp.startup.register(_precompile_callback(env))
     return env
 
 
@@ -1,6 +1,3 @@
-from collections.abc import Sequence
-from typing import Any
-
 from aiogram_dialog.api.internal import TextWidget
 from aiogram_dialog.api.protocols import DialogManager
 from aiogram_dialog.widgets.common import (
@@ -10,8 +7,10 @@ from aiogram_dialog.widgets.common import (
 )
 from aiogram_dialog.widgets.common.items import (
     ItemsGetterVariant,
+    as_items_source,
     get_items_getter,
 )
+from aiogram_dialog.widgets.common.render_memo import memoize
 from .base import Text
 
 
@@ -36,16 +35,18 @@ class List(Text, BaseScroll):
     async def _render_text(
             self, data: dict, manager: DialogManager,
     ) -> str:
-        items = self.items_getter(data)
-        pages = self._get_page_count(items)
+        source = as_items_source(self.items_getter(data))
+        total = await memoize(self, "count", data, source.count)
+        pages = self._get_page_count(total)
         if self.page_size is None:
             current_page = 0
             start = 0
+            items = await source.slice(0, total)
         else:
             last_page = pages - 1
             current_page = min(last_page, await self.get_page(manager))
-            start = current_page * self.page_size
-            items = items[start:start + self.page_size]
+            start = max(0, current_page * self.page_size)
+            items = await source.slice(start, self.page_size)
 
         texts = [
             await self.field.render_text(
@@ -65,12 +66,13 @@ class List(Text, BaseScroll):
         return self.sep.join(filter(None, texts))
 
     async def get_page_count(self, data: dict, manager: DialogManager) -> int:
-        items = self.items_getter(data)
-        return self._get_page_count(items)
+        source = as_items_source(self.items_getter(data))
+        total = await memoize(self, "count", data, source.count)
+        return self._get_page_count(total)
 
-    def _get_page_count(self, items: Sequence[Any]) -> int:
-        if not items:
+    def _get_page_count(self, total: int) -> int:
+        if not total:
             return 0
         if self.page_size is None:
             return 1
-        return len(items) // self.page_size + bool(len(items) % self.page_size)
+        return total // self.page_size + bool(total % self.page_size)
@@ -1,3 +1,12 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from hashlib import blake2b
+from typing import NamedTuple
+
+from aiogram.enums import ParseMode
+from cachetools import LRUCache
+
 from aiogram_dialog.api.internal import TextWidget
 from aiogram_dialog.api.protocols import DialogManager
 from aiogram_dialog.widgets.common import (
@@ -5,8 +14,186 @@ from aiogram_dialog.widgets.common import (
     OnPageChangedVariants,
     WhenCondition,
 )
+from aiogram_dialog.widgets.common.render_memo import memoize
 from .base import Text
 
+_HTML_TOKEN_RE = re.compile(
+    r"<(?P<closing>/?)(?P<name>[a-zA-Z][\w-]*)[^>]*>|&#?\w+;",
+)
+_BREAKS = ("\n\n", "\n", " ")
+# characters which are not shown without previous one
+_JOINERS = frozenset("\u200d\ufe0e\ufe0f")
+_SKIN_TONES = range(0x1F3FB, 0x1F400)
+
+
+class Page(NamedTuple):
+    start: int
+    end: int
+    prefix: str = ""  # tags opened on previous pages
+    suffix: str = ""  # closing tags for tags opened on this page
+
+
+def _is_joined(text: str, pos: int) -> bool:
+    """Check if characters around `pos` must be on the same page."""
+    if pos <= 0 or pos >= len(text):
+        return False
+    char = text[pos]
+    return (
+        char in _JOINERS
+        or text[pos - 1] == "\u200d"
+        or unicodedata.combining(char) != 0
+        or ord(char) in _SKIN_TONES
+    )
+
+
+def _find_token(
+        unsafe: list[tuple[int, int]], starts: list[int], pos: int,
+) -> tuple[int, int] | None:
+    """Find a token which cannot be split at `pos`."""
+    i = bisect_left(starts, pos) - 1
+    if i >= 0 and pos < unsafe[i][1]:
+        return unsafe[i]
+    return None
+
+
+def _find_page_end(
+        text: str, start: int, page_size: int,
+        unsafe: list[tuple[int, int]], starts: list[int],
+        opening_ends: dict[int, int], closing_starts: dict[int, int],
+) -> int:
+    limit = start + page_size
+    if limit >= len(text):
+        return len(text)
+    end = limit
+    min_end = start + page_size // 2
+    for separator in _BREAKS:
+        pos = text.rfind(separator, min_end, limit)
+        if pos != -1:
+            end = pos + len(separator)
+            break
+    if token := _find_token(unsafe, starts, end):
+        end = token[0]
+    while end in opening_ends:
+        # tag opened right before the end of page would be empty
+        end = opening_ends[end]
+    while end > start and _is_joined(text, end):
+        end -= 1
+    if end > start:
+        while end in closing_starts:
+            # tag closed right after the end of page would be empty
+            end = closing_starts[end]
+        return end
+    # too long unbreakable part, page is made longer than requested
+    return _extend_page_end(
+        text, limit, unsafe, starts, opening_ends, closing_starts,
+    )
+
+
+def _extend_page_end(
+        text: str, end: int,
+        unsafe: list[tuple[int, int]], starts: list[int],
+        opening_ends: dict[int, int], closing_starts: dict[int, int],
+) -> int:
+    while True:
+        if token := _find_token(unsafe, starts, end):
+            end = token[1]
+        elif end in opening_ends or _is_joined(text, end):
+            end += 1
+        elif end in closing_starts:
+            end = closing_starts[end]
+        else:
+            return end
+
+
+def _skip_invisible(text: str, pos: int, tags: dict[int, int]) -> int:
+    """Find the first visible character at or after `pos`."""
+    while pos < len(text):
+        if pos in tags:
+            pos = tags[pos]
+        elif text[pos].isspace():
+            pos += 1
+        else:
+            return pos
+    return pos
+
+
+def _update_opened(opened: list[re.Match], token: re.Match) -> None:
+    name = token.group("name")
+    if not name:
+        return  # entity
+    if not token.group("closing"):
+        opened.append(token)
+        return
+    for i in range(len(opened) - 1, -1, -1):
+        if opened[i].group("name") == name:
+            del opened[i:]
+            return
+
+
+def build_page_index(
+        text: str, page_size: int, html: bool = False,
+) -> list[Page]:
+    """
+    Split text into pages of at most `page_size` characters.
+
+    Pages are split by paragraphs, lines or words when possible and
+    never inside of a character sequence shown as a single symbol.
+    For HTML pages are not split inside of tags and entities, and
+    tags opened on previous pages are reopened and closed on each page.
+    Each page contains visible text, so whitespace and tags without it
+    are attached to neighbouring pages.
+    """
+    if page_size <= 0:
+        return [Page(0, len(text))] if text else []
+    tokens = list(_HTML_TOKEN_RE.finditer(text)) if html else []
+    unsafe = [match.span() for match in tokens]
+    starts = [token_start for token_start, _ in unsafe]
+    opening_ends = {
+        match.end(): match.start()
+        for match in tokens
+        if match.group("name") and not match.group("closing")
+    }
+    closing_starts = {
+        match.start(): match.end()
+        for match in tokens
+        if match.group("closing")
+    }
+    tags = {
+        match.start(): match.end()
+        for match in tokens
+        if match.group("name")
+    }
+    pages = []
+    opened: list[re.Match] = []
+    token_pos = 0
+    start = 0
+    while start < len(text):
+        end = _find_page_end(
+            text, start, page_size, unsafe, starts,
+            opening_ends, closing_starts,
+        )
+        visible = _skip_invisible(text, start, tags)
+        if visible >= len(text):
+            end = len(text)
+        elif visible >= end:
+            end = _extend_page_end(
+                text, visible + 1, unsafe, starts,
+                opening_ends, closing_starts,
+            )
+        if _skip_invisible(text, end, tags) >= len(text):
+            # nothing is left to be shown on the next page
+            end = len(text)
+        prefix = "".join(tag.group() for tag in opened)
+        while token_pos < len(tokens) and tokens[token_pos].start() < end:
+            _update_opened(opened, tokens[token_pos])
+            token_pos += 1
+        suffix = "".join(
+            f"</{tag.group('name')}>" for tag in reversed(opened)
+        )
+        pages.append(Page(start, end, prefix, suffix))
+        start = end
+    return pages
+
 
 class ScrollingText(Text, BaseScroll):
     def __init__(
@@ -16,34 +203,49 @@ class ScrollingText(Text, BaseScroll):
             page_size: int = 0,
             when: WhenCondition = None,
             on_page_changed: OnPageChangedVariants = None,
+            parse_mode: str | None = None,
+            index_cache_size: int = 256,
     ):
         Text.__init__(self, when=when)
         BaseScroll.__init__(self, id=id, on_page_changed=on_page_changed)
         self.text = text
         self.page_size = page_size
+        self.html = parse_mode == ParseMode.HTML
+        self.index_cache = LRUCache(maxsize=index_cache_size)
+
+    def _get_index(self, text: str) -> list[Page]:
+        raw = text.encode(errors="surrogatepass")
+        key = blake2b(raw, digest_size=16).digest()
+        index = self.index_cache.get(key)
+        if index is None:
+            index = build_page_index(text, self.page_size, self.html)
+            self.index_cache[key] = index
+        return index
 
     def _get_page_count(
             self,
             text: str,
     ) -> int:
-        return len(text) // self.page_size + bool(len(text) % self.page_size)
+        return len(self._get_index(text))
 
     async def _render_contents(
             self,
             data: dict,
             manager: DialogManager,
     ) -> str:
-        return await self.text.render_text(data, manager)
+        return await memoize(
+            self, "contents", data,
+            lambda: self.text.render_text(data, manager),
+        )
 
     async def _render_text(self, data, manager: DialogManager) -> str:
         text = await self._render_contents(data, manager)
-        pages = self._get_page_count(text)
+        index = self._get_index(text)
+        if not index:
+            return ""
         page = await self.get_page(manager)
-        last_page = pages - 1
-        current_page = min(last_page, page)
-        page_offset = current_page * self.page_size
-
-        return text[page_offset: page_offset + self.page_size]
+        start, end, prefix, suffix = index[min(len(index) - 1, page)]
+        return prefix + text[start:end] + suffix
 
     async def get_page_count(self, data: dict, manager: DialogManager) -> int:
         text = await self._render_contents(data, manager)
@@ -6,7 +6,13 @@ from aiogram_dialog.api.internal import (
     LinkPreviewWidget,
     TextWidget,
 )
-from .data.data_context import CompositeGetter, StaticGetter
+from .data.data_context import (
+    BoundGetter,
+    CompositeGetter,
+    GetterTimings,
+    MappingGetter,
+    StaticGetter,
+)
 from .input import BaseInput, CombinedInput, MessageHandlerFunc, MessageInput
 from .kbd import Group, Keyboard
 from .link_preview import LinkPreviewBase
@@ -135,13 +141,25 @@ def ensure_widgets(
     )
 
 
-def ensure_data_getter(getter: GetterVariant) -> DataGetter:
+def ensure_data_getter(
+        getter: GetterVariant,
+        concurrent: bool = False,
+        timings: GetterTimings | None = None,
+) -> DataGetter:
     if isinstance(getter, Callable):
+        if not isinstance(getter, MappingGetter):
+            # arguments are selected once using signature
+            getter = BoundGetter(getter)
+        if timings is not None:
+            return timings.wrap(getter)
         return getter
     elif isinstance(getter, dict):
         return StaticGetter(getter)
     elif isinstance(getter, (list, tuple)):
-        return CompositeGetter(*map(ensure_data_getter, getter))
+        return CompositeGetter(
+            *(ensure_data_getter(g, concurrent, timings) for g in getter),
+            concurrent=concurrent,
+        )
     elif getter is None:
         return StaticGetter({})
     else:
@@ -16,13 +16,18 @@ from aiogram_dialog.api.entities import (
     MarkupVariant,
     MediaAttachment,
     NewMessage,
+    RenderData,
 )
+from aiogram_dialog.api.exceptions import LazyDataNotLoaded
 from aiogram_dialog.api.internal import Widget, WindowProtocol
 from .api.entities import Data
 from .api.internal.widgets import MarkupFactory
 from .api.protocols import DialogManager, DialogProtocol
 from .dialog import OnResultEvent
-from .widgets.data import PreviewAwareGetter
+from .render_cache import RenderCache
+from .utils import gather_in_order
+from .widgets.common.render_memo import render_scope
+from .widgets.data import GetterTimings, PreviewAwareGetter
 from .widgets.kbd import Keyboard
 from .widgets.link_preview import LinkPreview
 from .widgets.markup.inline_keyboard import InlineKeyboardFactory
@@ -51,6 +56,10 @@ class Window(WindowProtocol):
             protect_content: bool | None = None,
             preview_add_transitions: list[Keyboard] | None = None,
             preview_data: GetterVariant = None,
+            render_cache: RenderCache | None = None,
+            concurrent_render: bool = False,
+            concurrent_getters: bool = False,
+            getter_timings: GetterTimings | None = None,
     ):
         (
             self.text,
@@ -60,15 +69,18 @@ class Window(WindowProtocol):
             self.link_preview,
         ) = ensure_widgets(widgets)
         self.getter = PreviewAwareGetter(
-            ensure_data_getter(getter),
+            ensure_data_getter(getter, concurrent_getters, getter_timings),
             ensure_data_getter(preview_data),
         )
+        self.concurrent_getters = concurrent_getters
         self.state = state
         self.on_process_result = on_process_result
         self.markup_factory = markup_factory
         self.parse_mode = parse_mode
         self.protect_content = protect_content
         self.preview_add_transitions = preview_add_transitions
+        self.render_cache = render_cache
+        self.concurrent_render = concurrent_render
         if disable_web_page_preview is not None:
             if self.link_preview:
                 raise ValueError(
@@ -82,6 +94,24 @@ class Window(WindowProtocol):
                 stacklevel=2,
             )
             self.link_preview = LinkPreview(is_disabled=True)
+        self._callback_routes = self._build_callback_routes()
+
+    def _build_callback_routes(self) -> dict[str, Keyboard] | None:
+        """
+        Create index of widgets processing callbacks by widget id.
+
+        Returns `None` if any widget does not support routing.
+        """
+        if not self.keyboard:
+            return {}
+        routes = self.keyboard.get_callback_routes()
+        if routes is None:
+            return None
+        index = {}
+        for widget_id, widget in routes:
+            # the first one is used as while walking through keyboard
+            index.setdefault(widget_id, widget)
+        return index
 
     async def render_text(
             self, data: dict, manager: DialogManager,
@@ -114,8 +144,17 @@ class Window(WindowProtocol):
             self, dialog: "DialogProtocol",
             manager: DialogManager,
     ) -> dict:
-        data = await dialog.load_data(manager)
-        data.update(await self.getter(**manager.middleware_data))
+        if self.concurrent_getters:
+            data, window_data = await gather_in_order(
+                dialog.load_data(manager),
+                self.getter.call(manager.middleware_data),
+            )
+        else:
+            data = await dialog.load_data(manager)
+            window_data = await self.getter.call(manager.middleware_data)
+        if not isinstance(data, RenderData):
+            data = RenderData(data)
+        data.update(window_data)
         return data
 
     async def process_message(
@@ -132,11 +171,15 @@ class Window(WindowProtocol):
             self, callback: CallbackQuery, dialog: DialogProtocol,
             manager: DialogManager,
     ) -> bool:
-        if self.keyboard:
+        if self._callback_routes is None:
             return await self.keyboard.process_callback(
                 callback, dialog, manager,
             )
-        return False
+        widget_id, _, _ = callback.data.partition(":")
+        widget = self._callback_routes.get(widget_id)
+        if widget is None:
+            return False
+        return await widget.process_callback(callback, dialog, manager)
 
     async def process_result(
             self, start_data: Data, result: Any, manager: DialogManager,
@@ -144,6 +187,37 @@ class Window(WindowProtocol):
         if self.on_process_result:
             await self.on_process_result(start_data, result, manager)
 
+    async def _render_parts(
+            self, data: dict, manager: DialogManager,
+    ) -> tuple:
+        if self.concurrent_render:
+            return await gather_in_order(
+                self.render_text(data, manager),
+                self.render_kbd(data, manager),
+                self.render_media(data, manager),
+                self.render_link_preview(data, manager),
+            )
+        return (
+            await self.render_text(data, manager),
+            await self.render_kbd(data, manager),
+            await self.render_media(data, manager),
+            await self.render_link_preview(data, manager),
+        )
+
+    async def _render_lazy_parts(
+            self, data: dict, manager: DialogManager,
+    ) -> tuple:
+        while True:
+            try:
+                return await self._render_parts(data, manager)
+            except LazyDataNotLoaded as e:
+                if not (
+                    isinstance(data, RenderData) and data.is_loading(e.key)
+                ):
+                    raise
+            # render again with loaded values
+            await data.load_pending()
+
     async def render(
             self, dialog: DialogProtocol,
             manager: DialogManager,
@@ -155,26 +229,47 @@ class Window(WindowProtocol):
         except Exception:
             logger.error("Cannot get window data for state %s", self.state)
             raise
+        use_cache = self.render_cache and not manager.is_preview()
+        if use_cache:
+            cached = self.render_cache.get(
+                manager,
+                self.render_cache.fingerprint(
+                    self.state, current_data, manager,
+                ),
+            )
+            if cached:
+                return cached
         try:
             event_context = cast(
                 EventContext, manager.middleware_data.get(EVENT_CONTEXT_KEY),
             )
-            return NewMessage(
+            with render_scope():
+                parts = await self._render_lazy_parts(current_data, manager)
+            text, reply_markup, media, link_preview_options = parts
+            new_message = NewMessage(
                 chat=chat,
                 thread_id=event_context.thread_id,
                 business_connection_id=event_context.business_connection_id,
-                text=await self.render_text(current_data, manager),
-                reply_markup=await self.render_kbd(current_data, manager),
+                text=text,
+                reply_markup=reply_markup,
                 parse_mode=self.parse_mode,
                 protect_content=self.protect_content,
-                media=await self.render_media(current_data, manager),
-                link_preview_options=await self.render_link_preview(
-                    current_data, manager,
-                ),
+                media=media,
+                link_preview_options=link_preview_options,
             )
         except Exception:
             logger.error("Cannot render window for state %s", self.state)
             raise
+        if use_cache:
+            # widgets can initialize their data while rendering
+            self.render_cache.set(
+                manager,
+                self.render_cache.fingerprint(
+                    self.state, current_data, manager,
+                ),
+                new_message,
+            )
+        return new_message
 
     def get_state(self) -> State:
         return self.state
@@ -0,0 +1,39 @@
+import pytest
+
+from aiogram_dialog.widgets.data import BoundGetter
+from aiogram_dialog.widgets.utils import ensure_data_getter
+
+DATA = {"dialog_manager": "manager", "event": "event", "i18n": "i18n"}
+
+
+async def declared_getter(dialog_manager, *, i18n, unknown=None):
+    return {"args": (dialog_manager, i18n, unknown)}
+
+
+async def kwargs_getter(dialog_manager, **kwargs):
+    return {"args": (dialog_manager, kwargs)}
+
+
+@pytest.mark.asyncio
+async def test_declared_arguments():
+    getter = ensure_data_getter(declared_getter)
+    assert isinstance(getter, BoundGetter)
+    assert not getter.accepts_all
+    assert await getter.call(DATA) == {"args": ("manager", "i18n", None)}
+    assert await getter(**DATA) == {"args": ("manager", "i18n", None)}
+
+
+@pytest.mark.asyncio
+async def test_kwargs():
+    getter = BoundGetter(kwargs_getter)
+    assert getter.accepts_all
+    assert await getter.call(DATA) == {
+        "args": ("manager", {"event": "event", "i18n": "i18n"}),
+    }
+
+
+@pytest.mark.asyncio
+async def test_missing_argument():
+    getter = BoundGetter(declared_getter)
+    with pytest.raises(TypeError):
+        await getter.call({"dialog_manager": "manager"})
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.data import CompositeGetter, GetterTimings
+from aiogram_dialog.widgets.text import Format
+
+
+class MainSG(StatesGroup):
+    start = State()
+
+
+async def start(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_getters():
+    window_started = asyncio.Event()
+    dialog_started = asyncio.Event()
+
+    async def global_getter(**kwargs):
+        # waits for getters which are called later in sequential mode
+        await asyncio.wait_for(dialog_started.wait(), 1)
+        await asyncio.wait_for(window_started.wait(), 1)
+        return {"a": "global", "b": "global", "c": "global"}
+
+    async def dialog_getter(**kwargs):
+        dialog_started.set()
+        return {"b": "dialog", "c": "dialog"}
+
+    async def window_getter(**kwargs):
+        window_started.set()
+        return {"c": "window"}
+
+    async def extra_getter(**kwargs):
+        return {"d": "extra"}
+
+    timings = GetterTimings()
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(
+        Window(
+            Format("{a} {b} {c} {d}"),
+            getter=[window_getter, extra_getter],
+            state=MainSG.start,
+            concurrent_getters=True,
+            getter_timings=timings,
+        ),
+        getter=dialog_getter,
+        concurrent_getters=True,
+    ))
+    dp.message.register(start, CommandStart())
+    message_manager = MockMessageManager()
+    setup_dialogs(dp, message_manager=message_manager, getter=global_getter)
+    client = BotClient(dp)
+
+    await client.send("/start")
+    assert message_manager.one_message().text == "global dialog window extra"
+    assert timings.timings.keys() == {
+        window_getter.__qualname__, extra_getter.__qualname__,
+    }
+    assert timings.timings[window_getter.__qualname__].calls == 1
+
+
+@pytest.mark.asyncio
+async def test_composite_getter_precedence():
+    async def first(**kwargs):
+        await asyncio.sleep(0.01)
+        return {"a": 1, "b": 1}
+
+    async def second(**kwargs):
+        return {"b": 2}
+
+    getter = CompositeGetter(first, second, concurrent=True)
+    assert await getter() == {"a": 1, "b": 2}
@@ -0,0 +1,93 @@
+import asyncio
+import sys
+
+import pytest
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import ContentType, Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.api.entities import MediaAttachment
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.media import Media
+from aiogram_dialog.widgets.text import Const, Text
+
+
+class MainSG(StatesGroup):
+    start = State()
+
+
+class WaitingText(Text):
+    def __init__(self, event: asyncio.Event):
+        super().__init__()
+        self.event = event
+
+    async def _render_text(self, data, manager: DialogManager) -> str:
+        await asyncio.wait_for(self.event.wait(), 1)
+        return "Text"
+
+
+class SignalMedia(Media):
+    def __init__(self, event: asyncio.Event):
+        super().__init__()
+        self.event = event
+
+    async def _render_media(
+            self, data, manager: DialogManager,
+    ) -> MediaAttachment:
+        self.event.set()
+        return MediaAttachment(ContentType.PHOTO, url="https://example.com")
+
+
+class FailingMedia(Media):
+    async def _render_media(
+            self, data, manager: DialogManager,
+    ) -> MediaAttachment:
+        raise ValueError("Cannot render")
+
+
+async def start(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+
+def create_client(window: Window) -> BotClient:
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(window))
+    dp.message.register(start, CommandStart())
+    setup_dialogs(dp, message_manager=MockMessageManager())
+    return BotClient(dp)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_render():
+    # text is rendered only after media is started
+    event = asyncio.Event()
+    client = create_client(Window(
+        WaitingText(event),
+        SignalMedia(event),
+        state=MainSG.start,
+        concurrent_render=True,
+    ))
+    await client.send("/start")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_render_error():
+    client = create_client(Window(
+        Const("Text"),
+        FailingMedia(),
+        state=MainSG.start,
+        concurrent_render=True,
+    ))
+    with pytest.raises(ValueError, match="Cannot render") as exc_info:
+        await client.send("/start")
+    if sys.version_info >= (3, 11):
+        assert "FailingMedia" in exc_info.value.__notes__[0]
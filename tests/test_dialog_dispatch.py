@@ -0,0 +1,116 @@
+import pytest
+from aiogram import Dispatcher, F, Router
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.context.intent_filter import IntentFilter
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.text import Const
+
+DIALOGS_COUNT = 5
+
+
+def create_states_group(index: int) -> type[StatesGroup]:
+    return type(f"SG{index}", (StatesGroup,), {"start": State()})
+
+
+STATES_GROUPS = [create_states_group(i) for i in range(DIALOGS_COUNT)]
+
+
+@pytest.fixture
+def handled():
+    return []
+
+
+@pytest.fixture
+def dp(handled):
+    async def on_input(message: Message, widget, manager: DialogManager):
+        handled.append(manager.current_context().state.group)
+
+    async def before(message: Message):
+        handled.append("before")
+
+    async def after(message: Message):
+        handled.append("after")
+
+    async def start(message: Message, dialog_manager: DialogManager):
+        await dialog_manager.start(
+            STATES_GROUPS[-1].start, mode=StartMode.RESET_STACK,
+        )
+
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.message.register(start, CommandStart())
+    before_router = Router()
+    before_router.message.register(before, F.text == "before")
+    dp.include_router(before_router)
+    for states_group in STATES_GROUPS:
+        dp.include_router(Dialog(Window(
+            Const(states_group.__name__),
+            MessageInput(on_input),
+            state=states_group.start,
+        )))
+    after_router = Router()
+    after_router.message.register(after)
+    dp.include_router(after_router)
+    setup_dialogs(dp, message_manager=MockMessageManager())
+    return dp
+
+
+@pytest.mark.asyncio
+async def test_dispatch(dp, handled, monkeypatch):
+    filter_calls = []
+    original_call = IntentFilter.__call__
+
+    async def call(self, obj, **kwargs):
+        filter_calls.append(self.aiogd_intent_state_group)
+        return await original_call(self, obj, **kwargs)
+
+    monkeypatch.setattr(IntentFilter, "__call__", call)
+    client = BotClient(dp)
+
+    await client.send("hello")
+    assert handled == ["after"]
+    assert filter_calls == []
+
+    await client.send("/start")
+    handled.clear()
+    await client.send("before")
+    await client.send("hello")
+    assert handled == ["before", STATES_GROUPS[-1]]
+    assert filter_calls == [STATES_GROUPS[-1]]
+
+
+@pytest.mark.asyncio
+async def test_outer_middleware():
+    calls = []
+
+    async def middleware(handler, event, data):
+        calls.append(data["event_router"])
+        return await handler(event, data)
+
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dialogs = [
+        Dialog(Window(
+            Const(states_group.__name__),
+            state=states_group.start,
+        ))
+        for states_group in STATES_GROUPS
+    ]
+    for dialog in dialogs:
+        dialog.message.outer_middleware(middleware)
+        dp.include_router(dialog)
+    setup_dialogs(dp, message_manager=MockMessageManager())
+    client = BotClient(dp)
+
+    await client.send("hello")
+    assert calls == dialogs
@@ -0,0 +1,69 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from aiogram.types import User
+
+from aiogram_dialog.api.entities import EVENT_CONTEXT_KEY
+from aiogram_dialog.widgets.data import GetterCacheKey, cached_getter
+
+
+def create_manager(user_id: int) -> MagicMock:
+    manager = MagicMock()
+    event_context = MagicMock()
+    event_context.user = User(id=user_id, is_bot=False, first_name="")
+    manager.middleware_data = {EVENT_CONTEXT_KEY: event_context}
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    calls = []
+
+    @cached_getter()
+    async def getter(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        return {"value": len(calls)}
+
+    manager = create_manager(1)
+    results = await asyncio.gather(*(
+        getter(dialog_manager=manager, extra=1) for _ in range(10)
+    ))
+    assert results == [{"value": 1}] * 10
+    assert calls == [{"dialog_manager": manager, "extra": 1}]
+    assert await getter(dialog_manager=create_manager(2)) == {"value": 1}
+    assert getter.stats.hits == 1
+
+    getter.invalidate()
+    assert await getter(dialog_manager=manager) == {"value": 2}
+
+
+@pytest.mark.asyncio
+async def test_user_key():
+    @cached_getter(key=GetterCacheKey.USER)
+    async def getter(dialog_manager, **kwargs):
+        user = dialog_manager.middleware_data[EVENT_CONTEXT_KEY].user
+        return {"user_id": user.id}
+
+    assert await getter(dialog_manager=create_manager(1)) == {"user_id": 1}
+    assert await getter(dialog_manager=create_manager(2)) == {"user_id": 2}
+    assert await getter(dialog_manager=create_manager(1)) == {"user_id": 1}
+    assert getter.stats.hits == 1
+    assert getter.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_error_not_cached():
+    calls = []
+
+    @cached_getter()
+    async def getter(**kwargs):
+        calls.append(1)
+        raise ValueError
+
+    manager = create_manager(1)
+    for _ in range(2):
+        with pytest.raises(ValueError):  # noqa: PT011
+            await getter(dialog_manager=manager)
+    assert len(calls) == 2
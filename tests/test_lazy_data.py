@@ -0,0 +1,112 @@
+import pytest
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.api.entities import Lazy, RenderData
+from aiogram_dialog.api.exceptions import LazyDataNotLoaded
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.kbd import Select
+from aiogram_dialog.widgets.link_preview import LinkPreview
+from aiogram_dialog.widgets.text import Format, Jinja, Multi
+
+
+class MainSG(StatesGroup):
+    start = State()
+
+
+async def start(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrent_render", [False, True])
+async def test_lazy_data(concurrent_render):
+    calls = []
+
+    async def load_name():
+        calls.append("name")
+        return "John"
+
+    async def load_hidden():
+        calls.append("hidden")
+        return "secret"
+
+    def load_items():
+        calls.append("items")
+        return ["a", "b"]
+
+    async def load_preview():
+        calls.append("preview")
+        return True
+
+    async def getter(**kwargs):
+        return {
+            "name": Lazy(load_name),
+            "hidden": Lazy(load_hidden),
+            "items": Lazy(load_items),
+            "show_hidden": False,
+            "preview": Lazy(load_preview),
+        }
+
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(Window(
+        Multi(
+            Format("Hello, {name}"),
+            Format("{hidden}", when="show_hidden"),
+            Jinja("Bye, {{name}}"),
+        ),
+        Select(
+            Format("{item}"),
+            id="select",
+            item_id_getter=str,
+            items="items",
+        ),
+        LinkPreview(is_disabled=True, when="preview"),
+        getter=getter,
+        concurrent_render=concurrent_render,
+        state=MainSG.start,
+    )))
+    dp.message.register(start, CommandStart())
+    message_manager = MockMessageManager()
+    setup_dialogs(dp, message_manager=message_manager)
+    client = BotClient(dp)
+
+    await client.send("/start")
+    message = message_manager.one_message()
+    assert message.text == "Hello, John\nBye, John"
+    assert [
+        button.text for button in message.reply_markup.inline_keyboard[0]
+    ] == ["a", "b"]
+    # loaded once, hidden widget data is not loaded
+    assert sorted(calls) == ["items", "name", "preview"]
+
+
+@pytest.mark.asyncio
+async def test_render_data_copy():
+    calls = []
+
+    async def load_name():
+        calls.append("name")
+        return "John"
+
+    data = RenderData(name=Lazy(load_name), x=1)
+    copy = data.copy()
+    with pytest.raises(LazyDataNotLoaded):
+        copy["name"]
+    with pytest.raises(LazyDataNotLoaded):
+        dict(data)
+    assert data.is_loading("name")
+    await data.load_pending()
+    assert {**copy} == {"name": "John", "x": 1}
+    assert dict(data) == {"name": "John", "x": 1}
+    assert calls == ["name"]
@@ -0,0 +1,56 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram.types import Chat, InlineKeyboardButton, InlineKeyboardMarkup
+
+from aiogram_dialog import ShowMode
+from aiogram_dialog.api.entities import NewMessage, OldMessage, UnknownText
+from aiogram_dialog.manager.message_manager import MessageManager
+from aiogram_dialog.utils import message_digest
+
+CHAT = Chat(id=1, type="private")
+
+
+def new_message(button: str) -> NewMessage:
+    return NewMessage(
+        chat=CHAT,
+        text="Hello",
+        reply_markup=InlineKeyboardMarkup(inline_keyboard=[[
+            InlineKeyboardButton(text=button, callback_data=button),
+        ]]),
+        show_mode=ShowMode.EDIT,
+    )
+
+
+def old_message(digest: str) -> OldMessage:
+    return OldMessage(
+        chat=CHAT,
+        message_id=1,
+        media_id=None,
+        media_uniq_id=None,
+        text=UnknownText.UNKNOWN,
+        digest=digest,
+    )
+
+
+def test_digest():
+    assert message_digest(new_message("a")) == message_digest(
+        new_message("a"),
+    )
+    assert message_digest(new_message("a")) != message_digest(
+        new_message("b"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_same_digest_not_sent():
+    bot = AsyncMock()
+    message_manager = MessageManager()
+    old = old_message(message_digest(new_message("a")))
+
+    result = await message_manager.show_message(bot, new_message("a"), old)
+    assert result is old
+    bot.edit_message_text.assert_not_called()
+
+    await message_manager.show_message(bot, new_message("b"), old)
+    bot.edit_message_text.assert_called_once()
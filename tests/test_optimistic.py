@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import SimpleEventIsolation
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.api.exceptions import ConcurrentUpdateError
+from aiogram_dialog.context.dialog_storage import MemoryVersionedDialogStorage
+from aiogram_dialog.context.storage import StorageProxy, StorageStats
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.bot_client import FakeBot
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.text import Const
+
+
+class MainSG(StatesGroup):
+    start = State()
+
+
+def create_proxy(
+        dialog_storage: MemoryVersionedDialogStorage, stats: StorageStats,
+) -> StorageProxy:
+    return StorageProxy(
+        storage=JsonMemoryStorage(),
+        events_isolation=SimpleEventIsolation(),
+        user_id=1,
+        chat_id=1,
+        thread_id=None,
+        business_connection_id=None,
+        bot=FakeBot(),
+        state_groups={MainSG.__full_group_name__: MainSG},
+        dialog_storage=dialog_storage,
+        stats=stats,
+    )
+
+
+@pytest.mark.asyncio
+async def test_versioned_storage():
+    storage = MemoryVersionedDialogStorage()
+    key = StorageKey(bot_id=1, chat_id=1, user_id=1, destiny="x")
+
+    assert await storage.get_many_versioned([key]) == [({}, 0)]
+    assert await storage.compare_and_set_many({key: 0}, [(key, {"a": 1})])
+    assert await storage.get_many_versioned([key]) == [({"a": 1}, 1)]
+    assert await storage.compare_and_set_many({key: 0}, [(key, {})]) is None
+    assert await storage.compare_and_set_many({key: 1}, [(key, {})]) == [2]
+    assert await storage.get_many([key]) == [{}]
+
+
+@pytest.mark.asyncio
+async def test_proxy_conflict():
+    dialog_storage = MemoryVersionedDialogStorage()
+    stats = StorageStats()
+    first = create_proxy(dialog_storage, stats)
+    second = create_proxy(dialog_storage, stats)
+
+    first_stack = await first.load_stack()
+    # no lock is taken, so concurrent event is not blocked
+    second_stack = await second.load_stack()
+
+    await second.save(second_stack.push(MainSG.start, None), second_stack)
+    with pytest.raises(ConcurrentUpdateError):
+        await first.save(first_stack.push(MainSG.start, None), first_stack)
+    assert stats.conflicts == 1
+
+    stack = await first.load_stack()
+    assert stack.intents == second_stack.intents
+
+
+@pytest.mark.asyncio
+async def test_conflict_retried():
+    barrier = asyncio.Barrier(2)
+    calls = []
+
+    async def start(message: Message, dialog_manager: DialogManager):
+        calls.append(message.text)
+        if len(calls) <= barrier.parties:
+            # both events have read the stack before any of them saves
+            await barrier.wait()
+        await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+    dialog_storage = MemoryVersionedDialogStorage()
+    stats = StorageStats()
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(Window(Const("stub"), state=MainSG.start)))
+    dp.message.register(start, CommandStart())
+    setup_dialogs(
+        dp,
+        message_manager=MockMessageManager(),
+        dialog_storage=dialog_storage,
+        storage_stats=stats,
+        conflict_retries=1,
+    )
+    client = BotClient(dp)
+
+    await asyncio.gather(client.send("/start"), client.send("/start"))
+
+    assert len(calls) == 3
+    assert stats.conflicts == 1
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from aiogram import Dispatcher, F
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.api.entities import NewMessage, OldMessage
+from aiogram_dialog.context.dialog_storage import MemoryVersionedDialogStorage
+from aiogram_dialog.manager.outbox import MessageOutbox
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.text import Const
+
+
+class MainSG(StatesGroup):
+    start = State()
+
+
+class BlockingMessageManager(MockMessageManager):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+        self.old_message_ids = []
+
+    async def show_message(
+            self, bot, new_message: NewMessage,
+            old_message: OldMessage | None,
+    ) -> OldMessage:
+        await self.release.wait()
+        self.old_message_ids.append(old_message and old_message.message_id)
+        return await super().show_message(bot, new_message, old_message)
+
+
+async def start(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+
+@pytest.mark.asyncio
+async def test_send_after_unlock():
+    last_message_ids = []
+
+    async def check(message: Message, dialog_manager: DialogManager):
+        last_message_ids.append(dialog_manager.current_stack().last_message_id)
+
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(Window(Const("First"), state=MainSG.start)))
+    dp.message.register(start, CommandStart())
+    dp.message.register(check, F.text == "check")
+    message_manager = BlockingMessageManager()
+    outbox = MessageOutbox()
+    setup_dialogs(dp, message_manager=message_manager, message_outbox=outbox)
+    client = BotClient(dp)
+
+    # events are processed while messages are still being sent
+    await client.send("/start")
+    await client.send("/start")
+    await client.send("check")
+    assert not message_manager.sent_messages
+    assert last_message_ids == [None]
+
+    message_manager.release.set()
+    await outbox.join()
+
+    assert [m.text for m in message_manager.sent_messages] == ["First"] * 2
+    # second message replaced the first one sent by outbox
+    assert message_manager.old_message_ids == [None, 1]
+    await client.send("check")
+    assert last_message_ids == [None, 2]
+
+
+@pytest.mark.asyncio
+async def test_optimistic_reconcile():
+    last_message_ids = []
+
+    async def edit(message: Message, dialog_manager: DialogManager):
+        dialog_manager.dialog_data["edited"] = True
+
+    async def check(message: Message, dialog_manager: DialogManager):
+        last_message_ids.append(dialog_manager.current_stack().last_message_id)
+
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(Window(Const("First"), state=MainSG.start)))
+    dp.message.register(start, CommandStart())
+    dp.message.register(edit, F.text == "edit")
+    dp.message.register(check, F.text == "check")
+    message_manager = BlockingMessageManager()
+    outbox = MessageOutbox()
+    setup_dialogs(
+        dp,
+        message_manager=message_manager,
+        message_outbox=outbox,
+        dialog_storage=MemoryVersionedDialogStorage(),
+    )
+    client = BotClient(dp)
+
+    await client.send("/start")
+    # context is changed after the event, but before message is sent
+    await client.send("edit")
+    message_manager.release.set()
+    await outbox.join()
+
+    await client.send("check")
+    assert last_message_ids == [1]
@@ -0,0 +1,141 @@
+import pytest
+from aiogram import Dispatcher
+from aiogram.filters import Command, CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    OutdatedClickMode,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.api.exceptions import OutdatedIntent
+from aiogram_dialog.context.intent_middleware import OutdatedClickStats
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.keyboard import InlineButtonTextLocator
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.utils import join_reply_callback
+from aiogram_dialog.widgets.kbd import Next
+from aiogram_dialog.widgets.text import Const
+
+
+class MainSG(StatesGroup):
+    start = State()
+    next = State()
+
+
+async def start(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+
+async def start_sub(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.next)
+
+
+def create_dispatcher() -> Dispatcher:
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(
+        Window(Const("First"), Next(), state=MainSG.start),
+        Window(Const("Second"), state=MainSG.next),
+    ))
+    dp.message.register(start, CommandStart())
+    dp.message.register(start_sub, Command("sub"))
+    return dp
+
+
+@pytest.mark.parametrize(("mode", "reshown"), [
+    (OutdatedClickMode.ANSWER, 0),
+    (OutdatedClickMode.SHOW, 1),
+])
+@pytest.mark.asyncio
+async def test_outdated_click(mode, reshown):
+    stats = OutdatedClickStats()
+    dp = create_dispatcher()
+    message_manager = MockMessageManager()
+    setup_dialogs(
+        dp,
+        message_manager=message_manager,
+        outdated_click_mode=mode,
+        outdated_click_stats=stats,
+    )
+    client = BotClient(dp)
+
+    await client.send("/start")
+    old_message = message_manager.one_message()
+    await client.send("/sub")
+    message_manager.reset_history()
+
+    await client.click(old_message, InlineButtonTextLocator("Next"))
+    assert stats == OutdatedClickStats(clicks=1, reshown=reshown)
+    if reshown:
+        assert message_manager.one_message().text == "Second"
+    else:
+        assert not message_manager.sent_messages
+
+
+@pytest.mark.asyncio
+async def test_outdated_click_raise():
+    stats = OutdatedClickStats()
+    dp = create_dispatcher()
+    errors = []
+
+    async def on_error(event, **kwargs):
+        errors.append(event.exception)
+
+    dp.errors.register(on_error)
+    message_manager = MockMessageManager()
+    setup_dialogs(
+        dp, message_manager=message_manager, outdated_click_stats=stats,
+    )
+    client = BotClient(dp)
+
+    await client.send("/start")
+    old_message = message_manager.one_message()
+    await client.send("/sub")
+    await client.click(old_message, InlineButtonTextLocator("Next"))
+
+    assert stats.clicks == 1
+    assert len(errors) == 1
+    assert isinstance(errors[0], OutdatedIntent)
+
+
+@pytest.mark.parametrize(("mode", "reshown"), [
+    (OutdatedClickMode.ANSWER, 0),
+    (OutdatedClickMode.SHOW, 1),
+])
+@pytest.mark.asyncio
+async def test_outdated_reply_click(mode, reshown):
+    stats = OutdatedClickStats()
+    dp = create_dispatcher()
+    errors = []
+
+    async def on_error(event, **kwargs):
+        errors.append(event.exception)
+
+    dp.errors.register(on_error)
+    message_manager = MockMessageManager()
+    setup_dialogs(
+        dp,
+        message_manager=message_manager,
+        outdated_click_mode=mode,
+        outdated_click_stats=stats,
+    )
+    client = BotClient(dp)
+
+    await client.send("/start")
+    old_message = message_manager.one_message()
+    await client.send("/sub")
+    message_manager.reset_history()
+
+    # reply keyboard click cannot be answered as a callback query
+    button = old_message.reply_markup.inline_keyboard[0][0]
+    await client.send(join_reply_callback(button.text, button.callback_data))
+    assert not errors
+    assert stats == OutdatedClickStats(clicks=1, reshown=reshown)
+    if reshown:
+        assert message_manager.one_message().text == "Second"
+    else:
+        assert not message_manager.sent_messages
@@ -0,0 +1,140 @@
+import pytest
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.render_cache import (
+    RenderCache,
+    Uncacheable,
+    current_period,
+    freeze,
+)
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.keyboard import InlineButtonTextLocator
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Checkbox
+from aiogram_dialog.widgets.text import Const, Format
+
+
+class MainSG(StatesGroup):
+    start = State()
+
+
+async def start(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+
+async def on_start(start_data, dialog_manager: DialogManager):
+    dialog_manager.dialog_data["name"] = "John"
+
+
+async def on_message(
+        message: Message, widget: MessageInput, dialog_manager: DialogManager,
+):
+    if message.text == "change":
+        dialog_manager.dialog_data["name"] = message.text
+
+
+@pytest.mark.asyncio
+async def test_render_cache():
+    render_cache = RenderCache()
+    dialog = Dialog(Window(
+        Format("Hello, {dialog_data[name]}"),
+        Checkbox(Const("On"), Const("Off"), id="check"),
+        MessageInput(on_message),
+        state=MainSG.start,
+        render_cache=render_cache,
+    ), on_start=on_start)
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(dialog)
+    dp.message.register(start, CommandStart())
+    client = BotClient(dp)
+    message_manager = MockMessageManager()
+    setup_dialogs(dp, message_manager=message_manager)
+
+    await client.send("/start")
+    assert message_manager.one_message().text == "Hello, John"
+    assert render_cache.stats.misses == 1
+
+    message_manager.reset_history()
+    await client.send("same")
+    assert message_manager.one_message().text == "Hello, John"
+    assert render_cache.stats.hits == 1
+
+    message_manager.reset_history()
+    await client.send("change")
+    assert message_manager.one_message().text == "Hello, change"
+    assert render_cache.stats.misses == 2
+
+    # widget data is a part of fingerprint
+    message = message_manager.last_message()
+    message_manager.reset_history()
+    await client.click(message, InlineButtonTextLocator("Off"))
+    keyboard = message_manager.one_message().reply_markup.inline_keyboard
+    assert keyboard[0][0].text == "On"
+    assert render_cache.stats.misses == 3
+
+
+def test_freeze():
+    assert freeze({"a": [1]}) == freeze({"a": [1]})
+    assert freeze(1) != freeze(True)
+    assert freeze([1]) != freeze((1,))
+    with pytest.raises(Uncacheable):
+        freeze({"a": object()})
+
+
+class FakeI18n:
+    def __init__(self, locale: str):
+        self.current_locale = locale
+
+
+@pytest.mark.asyncio
+async def test_render_cache_locale_and_date(monkeypatch):
+    render_cache = RenderCache()
+    dialog = Dialog(Window(
+        Format("Hello, {dialog_data[name]}"),
+        MessageInput(on_message),
+        state=MainSG.start,
+        render_cache=render_cache,
+    ), on_start=on_start)
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(dialog)
+    dp.message.register(start, CommandStart())
+    client = BotClient(dp)
+    setup_dialogs(dp, message_manager=MockMessageManager())
+
+    i18n = dp["i18n"] = FakeI18n("en")
+
+    await client.send("/start")
+    await client.send("same")
+    assert render_cache.stats.hits == 1
+    assert render_cache.stats.misses == 1
+
+    # another locale is rendered again
+    i18n.current_locale = "de"
+    await client.send("same")
+    assert render_cache.stats.misses == 2
+
+    # date can be changed
+    monkeypatch.setattr(
+        "aiogram_dialog.render_cache.current_period",
+        lambda: "tomorrow",
+    )
+    await client.send("same")
+    assert render_cache.stats.misses == 3
+
+
+def test_current_period():
+    period = current_period()
+    assert period.minute % 15 == 0
+    assert period.second == period.microsecond == 0
+    assert period.tzinfo is not None
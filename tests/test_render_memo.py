@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import Message
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.common.render_memo import memoize, render_scope
+from aiogram_dialog.widgets.kbd import (
+    FirstPage,
+    LastPage,
+    NextPage,
+    NumberedPager,
+)
+from aiogram_dialog.widgets.text import ScrollingText, Text
+
+
+class MainSG(StatesGroup):
+    start = State()
+
+
+class CountingText(Text):
+    def __init__(self, text: str):
+        super().__init__()
+        self.text = text
+        self.calls = 0
+
+    async def _render_text(self, data, manager: DialogManager) -> str:
+        self.calls += 1
+        return self.text
+
+
+async def start(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+
+@pytest.mark.asyncio
+async def test_scroll_with_pagers():
+    text = CountingText("x" * 100)
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(Dialog(Window(
+        ScrollingText(text, id="scroll", page_size=10),
+        NumberedPager(scroll="scroll"),
+        FirstPage(scroll="scroll"),
+        NextPage(scroll="scroll"),
+        LastPage(scroll="scroll"),
+        state=MainSG.start,
+    )))
+    dp.message.register(start, CommandStart())
+    message_manager = MockMessageManager()
+    setup_dialogs(dp, message_manager=message_manager)
+    client = BotClient(dp)
+
+    await client.send("/start")
+
+    message = message_manager.one_message()
+    assert message.text == "x" * 10
+    assert text.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_memoize():
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return len(calls)
+
+    data = {}
+    assert await memoize(None, "value", data, factory) == 1
+    with render_scope():
+        assert await memoize(None, "value", data, factory) == 2
+        assert await memoize(None, "value", data, factory) == 2
+        assert await memoize(None, "value", {}, factory) == 3
+    assert await memoize(None, "value", data, factory) == 4
+
+
+@pytest.mark.asyncio
+async def test_memoize_concurrent():
+    calls = []
+    event = asyncio.Event()
+
+    async def factory():
+        calls.append(1)
+        await event.wait()
+        return len(calls)
+
+    data = {}
+    with render_scope():
+        first = asyncio.ensure_future(memoize(None, "value", data, factory))
+        second = asyncio.ensure_future(memoize(None, "value", data, factory))
+        await asyncio.sleep(0)
+        event.set()
+        assert await asyncio.gather(first, second) == [1, 1]
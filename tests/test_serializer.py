@@ -0,0 +1,75 @@
+from aiogram_dialog.context.serializer import (
+    CompactRecordSerializer,
+    DictRecordSerializer,
+)
+
+CONTEXT = {
+    "_intent_id": "intent",
+    "_stack_id": "",
+    "state": "MainSG:start",
+    "start_data": None,
+    "dialog_data": {"key": "value"},
+    "widget_data": {},
+    "access_settings": {"user_ids": [1], "custom": None},
+}
+STACK = {
+    "_id": "",
+    "intents": ["intent"],
+    "last_message_id": 1,
+    "last_reply_keyboard": False,
+    "last_media_id": None,
+    "last_media_unique_id": None,
+    "last_income_media_group_id": None,
+    "last_message_digest": None,
+}
+
+
+def test_context_roundtrip():
+    serializer = CompactRecordSerializer()
+    record = serializer.dump_context(CONTEXT)
+    assert "widget_data" not in record
+    assert "w" not in record
+    assert serializer.load_context(record) == CONTEXT
+
+
+def test_stack_roundtrip():
+    serializer = CompactRecordSerializer()
+    record = serializer.dump_stack(STACK)
+    assert record == {"v": 1, "i": "", "n": ["intent"], "m": 1}
+    assert serializer.load_stack(record) == STACK
+
+
+def test_compression():
+    serializer = CompactRecordSerializer(compress_threshold=100)
+    context = {**CONTEXT, "dialog_data": {"key": "value" * 100}}
+    record = serializer.dump_context(context)
+    assert "d" not in record
+    assert len(record["z"]) < 100
+    assert serializer.load_context(record) == context
+
+    small_record = serializer.dump_context(CONTEXT)
+    assert small_record["d"] == CONTEXT["dialog_data"]
+
+
+def test_legacy_format():
+    serializer = CompactRecordSerializer()
+    assert serializer.load_context(CONTEXT) == CONTEXT
+    assert serializer.load_stack(STACK) == STACK
+
+
+def test_compression_not_json():
+    serializer = CompactRecordSerializer(compress_threshold=10)
+    dialog_data = {1: "x" * 50, "t": (1, 2)}
+    context = {**CONTEXT, "dialog_data": dialog_data}
+    record = serializer.dump_context(context)
+    assert "z" not in record
+    assert serializer.load_context(record)["dialog_data"] == dialog_data
+
+
+def test_dict_reads_compact():
+    compact = CompactRecordSerializer(compress_threshold=10)
+    serializer = DictRecordSerializer()
+    context = {**CONTEXT, "dialog_data": {"key": "value" * 10}}
+    assert serializer.dump_context(context) == context
+    assert serializer.load_context(compact.dump_context(context)) == context
+    assert serializer.load_stack(compact.dump_stack(STACK)) == STACK
@@ -0,0 +1,367 @@
+from collections.abc import Sequence
+from typing import ClassVar
+
+import pytest
+from aiogram import Dispatcher
+from aiogram.filters import CommandStart
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import SimpleEventIsolation
+from aiogram.types import Chat, Message, User
+
+from aiogram_dialog import (
+    Dialog,
+    DialogManager,
+    StartMode,
+    Window,
+    setup_dialogs,
+)
+from aiogram_dialog.api.entities import Context, EventContext, Stack
+from aiogram_dialog.api.entities.stack import stack_id_from_intent
+from aiogram_dialog.api.exceptions import UnknownState
+from aiogram_dialog.api.protocols import (
+    DialogRegistryProtocol,
+    DialogStorageProtocol,
+    StorageRecord,
+)
+from aiogram_dialog.context.dialog_storage import (
+    CachedDialogStorage,
+    FsmDialogStorage,
+    MemoryVersionedDialogStorage,
+)
+from aiogram_dialog.context.intent_middleware import IntentMiddlewareFactory
+from aiogram_dialog.context.storage import (
+    StorageProxy,
+    StorageProxyFactory,
+    StorageStats,
+)
+from aiogram_dialog.test_tools import BotClient, MockMessageManager
+from aiogram_dialog.test_tools.bot_client import FakeBot
+from aiogram_dialog.test_tools.keyboard import InlineButtonTextLocator
+from aiogram_dialog.test_tools.memory_storage import JsonMemoryStorage
+from aiogram_dialog.widgets.kbd import Next
+from aiogram_dialog.widgets.text import Const
+
+
+class MainSG(StatesGroup):
+    start = State()
+    next = State()
+
+
+class CountingDialogStorage(FsmDialogStorage):
+    def __init__(self, storage):
+        super().__init__(storage)
+        self.reads = []
+        self.writes = []
+
+    def reset(self):
+        self.reads.clear()
+        self.writes.clear()
+
+    async def get_many(
+            self, keys: Sequence[StorageKey],
+    ) -> list[StorageRecord]:
+        self.reads.append(len(keys))
+        return await super().get_many(keys)
+
+    async def set_many(
+            self, items: Sequence[tuple[StorageKey, StorageRecord]],
+    ) -> None:
+        self.writes.append(len(items))
+        await super().set_many(items)
+
+
+def create_dialog() -> Dialog:
+    return Dialog(
+        Window(
+            Const("First"),
+            Next(),
+            state=MainSG.start,
+        ),
+        Window(
+            Const("Second"),
+            state=MainSG.next,
+        ),
+    )
+
+
+async def start(message: Message, dialog_manager: DialogManager):
+    await dialog_manager.start(MainSG.start, mode=StartMode.RESET_STACK)
+
+
+@pytest.mark.asyncio
+async def test_batched_save():
+    storage = JsonMemoryStorage()
+    dialog_storage = CountingDialogStorage(storage)
+    dp = Dispatcher(storage=storage)
+    dp.include_router(create_dialog())
+    dp.message.register(start, CommandStart())
+
+    client = BotClient(dp)
+    message_manager = MockMessageManager()
+    setup_dialogs(
+        dp,
+        message_manager=message_manager,
+        dialog_storage=dialog_storage,
+    )
+
+    await client.send("/start")
+    first_message = message_manager.one_message()
+    dialog_storage.reset()
+
+    message_manager.reset_history()
+    await client.click(first_message, InlineButtonTextLocator("Next"))
+    assert message_manager.one_message().text == "Second"
+    # context and stack are saved together
+    assert dialog_storage.writes == [2]
+    # and loaded together as stack id is known from intent id
+    assert dialog_storage.reads == [2]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_not_saved():
+    storage = JsonMemoryStorage()
+    dialog_storage = CountingDialogStorage(storage)
+    storage_stats = StorageStats()
+    dp = Dispatcher(storage=storage)
+    dp.include_router(create_dialog())
+    dp.message.register(start, CommandStart())
+
+    client = BotClient(dp)
+    message_manager = MockMessageManager()
+    setup_dialogs(
+        dp,
+        message_manager=message_manager,
+        dialog_storage=dialog_storage,
+        storage_stats=storage_stats,
+    )
+
+    await client.send("/start")
+    dialog_storage.reset()
+    skipped = storage_stats.skipped_writes
+
+    # redraw: new message id is stored, context is not changed
+    await client.send("whatever")
+    assert dialog_storage.writes == [1]
+    assert storage_stats.skipped_writes == skipped + 1
+
+
+class ExpiringStorage(JsonMemoryStorage):
+    data_ttl = 60
+
+
+@pytest.mark.asyncio
+async def test_unchanged_expiration_prolonged():
+    storage = ExpiringStorage()
+    dialog_storage = CountingDialogStorage(storage)
+    dp = Dispatcher(storage=storage)
+    dp.include_router(create_dialog())
+    dp.message.register(start, CommandStart())
+
+    client = BotClient(dp)
+    setup_dialogs(
+        dp,
+        message_manager=MockMessageManager(),
+        dialog_storage=dialog_storage,
+    )
+
+    await client.send("/start")
+    dialog_storage.reset()
+
+    # unchanged context is written again to reset its expiration
+    await client.send("whatever")
+    assert sorted(dialog_storage.writes) == [1, 1]
+
+
+@pytest.mark.parametrize(("stack_id", "embedded"), [
+    ("", ""),
+    ("<->", "<->"),
+    ("<12345>", ""),
+    ("abcd", None),
+    ("a.b", None),
+])
+def test_stack_id_from_intent(stack_id, embedded):
+    context = Stack(_id=stack_id).push(MainSG.start, None)
+    assert stack_id_from_intent(context.id) == embedded
+    assert stack_id_from_intent("legacy") is None
+
+
+def create_proxy(
+        storage: JsonMemoryStorage, user_id: int, chat_id: int,
+        dialog_storage: DialogStorageProtocol | None = None,
+) -> StorageProxy:
+    return StorageProxy(
+        storage=storage,
+        events_isolation=SimpleEventIsolation(),
+        user_id=user_id,
+        chat_id=chat_id,
+        thread_id=None,
+        business_connection_id=None,
+        bot=FakeBot(),
+        state_groups={MainSG.__full_group_name__: MainSG},
+        dialog_storage=dialog_storage,
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_intent():
+    storage = JsonMemoryStorage()
+    proxy = create_proxy(storage, user_id=1, chat_id=-1)
+    stack = await proxy.load_stack()
+    context = stack.push(MainSG.start, None)
+    await proxy.save(context, stack)
+    await proxy.unlock()
+
+    loaded_context, loaded_stack = await proxy.load_intent(
+        context.id, stack_id_from_intent(context.id),
+    )
+    await proxy.unlock()
+    assert loaded_context == context
+    assert loaded_stack.id == stack.id == "<1>"
+    assert loaded_stack.intents == [context.id]
+
+    # another user clicks: guessed default stack is not the right one
+    other_proxy = create_proxy(storage, user_id=2, chat_id=-1)
+    _, loaded_stack = await other_proxy.load_intent(
+        context.id, stack_id_from_intent(context.id),
+    )
+    await other_proxy.unlock()
+    assert loaded_stack.id == "<1>"
+    assert loaded_stack.intents == [context.id]
+
+
+@pytest.mark.asyncio
+async def test_load_intent_wrong_stack_version():
+    dialog_storage = MemoryVersionedDialogStorage()
+    proxy = create_proxy(JsonMemoryStorage(), 1, -1, dialog_storage)
+    stack = await proxy.load_stack()
+    context = stack.push(MainSG.start, None)
+    await proxy.save(context, stack)
+    await proxy.unlock()
+
+    other_proxy = create_proxy(JsonMemoryStorage(), 2, -1, dialog_storage)
+    _, loaded_stack = await other_proxy.load_intent(
+        context.id, stack_id_from_intent(context.id),
+    )
+    await other_proxy.unlock()
+    # only records which are really loaded are checked while saving
+    assert set(other_proxy._versions) == {  # noqa: SLF001
+        other_proxy._context_key(context.id),  # noqa: SLF001
+        other_proxy._stack_key(loaded_stack.id),  # noqa: SLF001
+    }
+
+
+class StackLoggingFactory(IntentMiddlewareFactory):
+    loaded_stacks: ClassVar[list[str]] = []
+
+    async def _load_stack(self, event, stack_id, proxy, data):
+        self.loaded_stacks.append(stack_id)
+        return await super()._load_stack(event, stack_id, proxy, data)
+
+
+@pytest.mark.asyncio
+async def test_load_intent_stack_hook(monkeypatch):
+    monkeypatch.setattr(
+        "aiogram_dialog.setup.IntentMiddlewareFactory", StackLoggingFactory,
+    )
+    dp = Dispatcher(storage=JsonMemoryStorage())
+    dp.include_router(create_dialog())
+    dp.message.register(start, CommandStart())
+    client = BotClient(dp)
+    message_manager = MockMessageManager()
+    setup_dialogs(dp, message_manager=message_manager)
+
+    await client.send("/start")
+    first_message = message_manager.one_message()
+    StackLoggingFactory.loaded_stacks.clear()
+
+    message_manager.reset_history()
+    await client.click(first_message, InlineButtonTextLocator("Next"))
+    assert message_manager.one_message().text == "Second"
+    # overridden stack loader is used instead of loading with context
+    assert StackLoggingFactory.loaded_stacks == [""]
+
+
+def storage_key(destiny: str) -> StorageKey:
+    return StorageKey(bot_id=1, chat_id=1, user_id=1, destiny=destiny)
+
+
+@pytest.mark.asyncio
+async def test_cached_storage():
+    inner = CountingDialogStorage(JsonMemoryStorage())
+    cached = CachedDialogStorage(inner, maxsize=2)
+    key1, key2, key3 = map(storage_key, ("1", "2", "3"))
+
+    assert await cached.get_many([key1]) == [{}]
+    assert await cached.get_many([key1]) == [{}]
+    assert cached.stats.misses == 1
+    assert cached.stats.hits == 1
+
+    await cached.set_many([(key1, {"x": 1}), (key2, {"x": 2})])
+    records = await cached.get_many([key1, key2])
+    assert records == [{"x": 1}, {"x": 2}]
+    assert inner.reads == [1]
+    records[0]["x"] = 100  # returned records are copies
+    assert await cached.get_many([key1]) == [{"x": 1}]
+
+    await cached.set_many([(key3, {"x": 3})])
+    assert cached.stats.evictions == 1
+    assert await cached.get_many([key2]) == [{"x": 2}]
+    assert inner.reads == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_states_index():
+    proxy = StorageProxy(
+        storage=JsonMemoryStorage(),
+        events_isolation=SimpleEventIsolation(),
+        user_id=1,
+        chat_id=1,
+        thread_id=None,
+        business_connection_id=None,
+        bot=FakeBot(),
+        state_groups={MainSG.__full_group_name__: MainSG},
+        states_index={state.state: state for state in MainSG.__all_states__},
+    )
+    await proxy.save_context(Context(
+        _intent_id="known",
+        _stack_id="",
+        state=MainSG.next,
+        start_data=None,
+    ))
+    context = await proxy.load_context("known")
+    assert context.state is MainSG.next
+
+    await proxy.save_context(Context(
+        _intent_id="unknown",
+        _stack_id="",
+        state=State("unknown", group_name="MainSG"),
+        start_data=None,
+    ))
+    with pytest.raises(UnknownState):
+        await proxy.load_context("unknown")
+
+
+class MinimalRegistry(DialogRegistryProtocol):
+    def find_dialog(self, state):
+        raise NotImplementedError
+
+    def states_groups(self):
+        return {MainSG.__full_group_name__: MainSG}
+
+
+def test_registry_without_states_index():
+    factory = StorageProxyFactory(
+        registry=MinimalRegistry(),
+        events_isolation=SimpleEventIsolation(),
+    )
+    event_context = EventContext(
+        bot=FakeBot(),
+        chat=Chat(id=1, type="private"),
+        user=User(id=1, is_bot=False, first_name="x"),
+        thread_id=None,
+        business_connection_id=None,
+    )
+    proxy = factory(event_context, JsonMemoryStorage())
+    assert proxy.states_index == {}
+    assert proxy._state(MainSG.next.state) is MainSG.next  # noqa: SLF001
@@ -1,6 +1,17 @@
+import sys
+from datetime import date
+
 import pytest
+from aiogram.types import InlineKeyboardButton
 
-from aiogram_dialog.widgets.kbd import Calendar, CalendarScope
+from aiogram_dialog.widgets.kbd import Calendar, CalendarConfig, CalendarScope
+from aiogram_dialog.widgets.kbd.calendar_kbd import (
+    CalendarDaysView,
+    CalendarMonthView,
+    CalendarYearsView,
+    month_grid,
+)
+from aiogram_dialog.widgets.text import Format
 
 
 @pytest.mark.asyncio
@@ -17,3 +28,122 @@ async def test_render_calendar(mock_manager):
     assert res_years
     assert res_years != res_days
     assert res_years != res_months
+
+
+class SlowCalendar(Calendar):
+    """Calendar with texts which cannot be rendered in a batch."""
+
+    def _init_views(self):
+        def text(fmt: str) -> Format:
+            return Format(fmt, when=lambda *args: True)
+
+        return {
+            CalendarScope.DAYS: CalendarDaysView(
+                self._item_callback_data,
+                date_text=text("{date:%d}"),
+                today_text=text("[ {date:%d} ]"),
+                weekday_text=text("{date:%a}"),
+            ),
+            CalendarScope.MONTHS: CalendarMonthView(
+                self._item_callback_data,
+                month_text=text("{date:%B}"),
+                this_month_text=text("[ {date:%B} ]"),
+            ),
+            CalendarScope.YEARS: CalendarYearsView(
+                self._item_callback_data,
+                year_text=text("{date:%Y}"),
+                this_year_text=text("[ {date:%Y} ]"),
+            ),
+        }
+
+
+@pytest.mark.parametrize("scope", list(CalendarScope))
+@pytest.mark.asyncio
+async def test_batch_render(mock_manager, scope):
+    config = CalendarConfig(min_date=date(2020, 3, 5))
+    calendar = Calendar(id="calendar", config=config)
+    slow_calendar = SlowCalendar(id="calendar", config=config)
+    calendar.set_scope(scope, mock_manager)
+    calendar.set_offset(date(2020, 3, 1), mock_manager)
+
+    keyboard = await calendar.render_keyboard({}, mock_manager)
+    expected = await slow_calendar.render_keyboard({}, mock_manager)
+
+    assert keyboard == expected
+
+
+def test_month_grid():
+    grid = month_grid(
+        date(2024, 2, 1), 0, date(2024, 2, 3), date(2100, 1, 1),
+    )
+    assert len(grid) == 5
+    assert grid[0] == (None, None, None, None, None, date(2024, 2, 3),
+                       date(2024, 2, 4))
+    assert grid[-1][3] == date(2024, 2, 29)
+    assert grid[-1][4] is None
+
+
+class StarDaysView(CalendarDaysView):
+    async def _render_date_button(self, selected_date, today, data, manager):
+        return InlineKeyboardButton(text="*", callback_data="")
+
+
+class StarMonthView(CalendarMonthView):
+    async def _render_month_button(
+            self, month, this_month, data, offset, config, manager,
+    ):
+        return InlineKeyboardButton(text="*", callback_data="")
+
+
+class StarYearsView(CalendarYearsView):
+    async def _render_year_button(
+            self, year, this_year, data, config, manager,
+    ):
+        return InlineKeyboardButton(text="*", callback_data="")
+
+
+class StarCalendar(Calendar):
+    def _init_views(self):
+        return {
+            CalendarScope.DAYS: StarDaysView(self._item_callback_data),
+            CalendarScope.MONTHS: StarMonthView(self._item_callback_data),
+            CalendarScope.YEARS: StarYearsView(self._item_callback_data),
+        }
+
+
+@pytest.mark.parametrize(("scope", "stars"), [
+    (CalendarScope.DAYS, 31),
+    (CalendarScope.MONTHS, 12),
+    (CalendarScope.YEARS, 20),
+])
+@pytest.mark.asyncio
+async def test_overridden_buttons(mock_manager, scope, stars):
+    calendar = StarCalendar(id="calendar")
+    calendar.set_scope(scope, mock_manager)
+    calendar.set_offset(date(2020, 3, 1), mock_manager)
+
+    keyboard = await calendar.render_keyboard({}, mock_manager)
+
+    texts = [button.text for row in keyboard for button in row]
+    assert texts.count("*") == stars
+
+
+class BrokenCalendar(Calendar):
+    def _init_views(self):
+        return {
+            CalendarScope.DAYS: CalendarDaysView(
+                self._item_callback_data,
+                date_text=Format("{missing}"),
+            ),
+        }
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="no notes")
+@pytest.mark.asyncio
+async def test_batch_render_error_note(mock_manager):
+    calendar = BrokenCalendar(id="calendar")
+    calendar.set_offset(date(2020, 3, 1), mock_manager)
+
+    with pytest.raises(KeyError) as e:
+        await calendar.render_keyboard({}, mock_manager)
+    assert any("Format" in note for note in e.value.__notes__)
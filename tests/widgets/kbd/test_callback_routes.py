@@ -0,0 +1,101 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from aiogram.fsm.state import State
+from aiogram.types import CallbackQuery, Chat, Message, User
+
+from aiogram_dialog import Window
+from aiogram_dialog.widgets.kbd import (
+    Button,
+    Keyboard,
+    ListGroup,
+    Row,
+    ScrollingGroup,
+    Select,
+)
+from aiogram_dialog.widgets.text import Const, Format
+
+
+class CustomKeyboard(Keyboard):
+    async def _render_keyboard(self, data, manager):
+        return []
+
+    async def _process_other_callback(self, callback, dialog, manager):
+        return callback.data == "custom"
+
+
+def create_callback(data: str) -> CallbackQuery:
+    user = User(id=1, is_bot=False, first_name="User")
+    return CallbackQuery(
+        id="1",
+        data=data,
+        chat_instance="",
+        from_user=user,
+        message=Message(
+            message_id=1,
+            date=datetime.fromtimestamp(1234567890),
+            chat=Chat(id=1, type="private"),
+            from_user=user,
+        ),
+    )
+
+
+def create_keyboard(on_click) -> list[Keyboard]:
+    return [
+        Button(Const("a"), id="a"),
+        Row(Button(Const("b"), id="b")),
+        ScrollingGroup(
+            Select(
+                Format("{item}"),
+                id="s",
+                item_id_getter=str,
+                items=[1, 2],
+                on_click=on_click,
+            ),
+            id="sg",
+            width=1,
+            height=1,
+        ),
+        ListGroup(
+            Button(Const("c"), id="c"),
+            id="lg",
+            item_id_getter=str,
+            items=[1, 2],
+        ),
+    ]
+
+
+def test_routes():
+    keyboard = Row(*create_keyboard(None))
+    routes = keyboard.get_callback_routes()
+    assert [widget_id for widget_id, _ in routes] == [
+        "a", "b", "sg", "s", "lg",
+    ]
+    assert Row(CustomKeyboard(), keyboard).get_callback_routes() is None
+
+
+@pytest.mark.parametrize("custom", [False, True])
+@pytest.mark.asyncio
+async def test_dispatch(mock_manager, custom):
+    clicks = []
+
+    async def on_click(event, select, manager, item_id):
+        clicks.append(item_id)
+
+    widgets = create_keyboard(on_click)
+    if custom:
+        widgets.append(CustomKeyboard())
+    window = Window(*widgets, state=State())
+    dialog = Mock()
+
+    assert await window.process_callback(
+        create_callback("s:2"), dialog, mock_manager,
+    )
+    assert clicks == ["2"]
+    assert not await window.process_callback(
+        create_callback("unknown"), dialog, mock_manager,
+    )
+    assert await window.process_callback(
+        create_callback("custom"), dialog, mock_manager,
+    ) == custom
@@ -0,0 +1,122 @@
+import pytest
+
+from aiogram_dialog.widgets.kbd import (
+    Button,
+    ListGroup,
+    ScrollingGroup,
+    Select,
+)
+from aiogram_dialog.widgets.text import Const, Format, Text
+
+
+class CountingFormat(Text):
+    def __init__(self, text: str):
+        super().__init__()
+        self.text = Format(text)
+        self.calls = 0
+
+    async def _render_text(self, data, manager) -> str:
+        self.calls += 1
+        return await self.text.render_text(data, manager)
+
+
+def texts(keyboard) -> list[list[str]]:
+    return [[button.text for button in row] for row in keyboard]
+
+
+@pytest.mark.asyncio
+async def test_select_page(mock_manager) -> None:
+    text = CountingFormat("{item}")
+    group = ScrollingGroup(
+        Button(Const("first"), id="first"),
+        Select(
+            text,
+            id="select",
+            item_id_getter=str,
+            items=range(100),
+        ),
+        id="sg",
+        width=3,
+        height=2,
+        hide_pager=True,
+    )
+    mock_manager.current_context().widget_data["sg"] = 1
+
+    keyboard = await group.render_keyboard(data={}, manager=mock_manager)
+
+    assert texts(keyboard) == [["5", "6", "7"], ["8", "9", "10"]]
+    assert keyboard[0][0].callback_data == "select:5"
+    assert text.calls == 6
+    assert await group.get_page_count({}, mock_manager) == 17
+
+
+@pytest.mark.asyncio
+async def test_select_last_page(mock_manager) -> None:
+    group = ScrollingGroup(
+        Select(
+            Format("{item} {pos}"),
+            id="select",
+            item_id_getter=str,
+            items=range(7),
+        ),
+        id="sg",
+        width=3,
+        height=2,
+        hide_pager=True,
+    )
+    mock_manager.current_context().widget_data["sg"] = 10
+
+    keyboard = await group.render_keyboard(data={}, manager=mock_manager)
+
+    assert texts(keyboard) == [["6 7"]]
+
+
+@pytest.mark.asyncio
+async def test_list_group_page(mock_manager) -> None:
+    text = CountingFormat("{item}")
+    group = ScrollingGroup(
+        ListGroup(
+            Button(text, id="button"),
+            Button(Const("-"), id="delete"),
+            id="lg",
+            item_id_getter=str,
+            items=range(100),
+            item_rows=2,
+        ),
+        id="sg",
+        height=3,
+        hide_pager=True,
+    )
+    mock_manager.current_context().widget_data["sg"] = 1
+
+    keyboard = await group.render_keyboard(data={}, manager=mock_manager)
+
+    assert texts(keyboard) == [["-"], ["2"], ["-"]]
+    assert text.calls == 2
+    assert await group.get_page_count({}, mock_manager) == 67
+
+
+class ReversedSelect(Select):
+    async def _render_keyboard(self, data, manager):
+        keyboard = await super()._render_keyboard(data, manager)
+        return [row[::-1] for row in keyboard]
+
+
+@pytest.mark.asyncio
+async def test_select_subclass_page(mock_manager) -> None:
+    group = ScrollingGroup(
+        ReversedSelect(
+            Format("{item}"),
+            id="select",
+            item_id_getter=str,
+            items=range(7),
+        ),
+        id="sg",
+        width=3,
+        height=2,
+        hide_pager=True,
+    )
+
+    keyboard = await group.render_keyboard(data={}, manager=mock_manager)
+
+    assert texts(keyboard) == [["6", "5", "4"], ["3", "2", "1"]]
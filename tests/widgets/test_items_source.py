@@ -0,0 +1,159 @@
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from aiogram_dialog.widgets.common import ItemsSource, PrefetchingSource
+from aiogram_dialog.widgets.kbd import (
+    Button,
+    ListGroup,
+    ScrollingGroup,
+    Select,
+)
+from aiogram_dialog.widgets.text import Format, List
+
+
+class RangeSource(ItemsSource):
+    def __init__(self, total: int):
+        self.total = total
+        self.slices = []
+
+    async def count(self) -> int:
+        return self.total
+
+    async def slice(self, offset: int, limit: int) -> Sequence:
+        self.slices.append((offset, limit))
+        return range(offset, min(self.total, offset + limit))
+
+
+def texts(keyboard) -> list[list[str]]:
+    return [[button.text for button in row] for row in keyboard]
+
+
+@pytest.mark.asyncio
+async def test_select(mock_manager) -> None:
+    source = RangeSource(1_000_000)
+    group = ScrollingGroup(
+        Select(
+            Format("{item}"),
+            id="select",
+            item_id_getter=str,
+            items="items",
+        ),
+        id="sg",
+        width=2,
+        height=2,
+        hide_pager=True,
+    )
+    mock_manager.current_context().widget_data["sg"] = 3
+    data = {"items": source}
+
+    keyboard = await group.render_keyboard(data=data, manager=mock_manager)
+
+    assert texts(keyboard) == [["12", "13"], ["14", "15"]]
+    assert source.slices == [(12, 4)]
+    assert await group.get_page_count(data, mock_manager) == 250_000
+
+
+@pytest.mark.asyncio
+async def test_list_group(mock_manager) -> None:
+    source = RangeSource(10)
+    group = ListGroup(
+        Button(Format("{item}"), id="button"),
+        id="lg",
+        item_id_getter=str,
+        items=source,
+        page_size=4,
+    )
+    mock_manager.current_context().widget_data["lg"] = {"": {"lg": 5}}
+
+    keyboard = await group.render_keyboard(data={}, manager=mock_manager)
+
+    assert texts(keyboard) == [["8"], ["9"]]
+    assert source.slices == [(8, 2)]
+
+
+@pytest.mark.asyncio
+async def test_list(mock_manager) -> None:
+    source = RangeSource(10)
+    text = List(
+        Format("{pos}. {item}"),
+        items=source,
+        id="list",
+        page_size=3,
+    )
+    mock_manager.current_context().widget_data["list"] = 1
+
+    result = await text.render_text(data={}, manager=mock_manager)
+
+    assert result == "4. 3\n5. 4\n6. 5"
+    assert await text.get_page_count({}, mock_manager) == 4
+
+
+@pytest.mark.asyncio
+async def test_prefetch() -> None:
+    source = RangeSource(10)
+    prefetching = PrefetchingSource(source)
+
+    assert list(await prefetching.slice(3, 3)) == [3, 4, 5]
+    await asyncio.sleep(0)
+    assert sorted(source.slices) == [(0, 3), (3, 3), (6, 3)]
+
+    assert list(await prefetching.slice(6, 3)) == [6, 7, 8]
+    await asyncio.sleep(0)
+    assert sorted(source.slices) == [(0, 3), (3, 3), (6, 3), (9, 3)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("get_items", [
+    lambda: {"a": 1, "b": 2, "c": 3}.keys(),
+    lambda: (x for x in "abc"),
+])
+async def test_not_sliceable_items(mock_manager, get_items) -> None:
+    select = Select(
+        Format("{item}"),
+        id="select",
+        item_id_getter=str,
+        items="items",
+    )
+    group = ScrollingGroup(
+        Select(
+            Format("{item}"),
+            id="select",
+            item_id_getter=str,
+            items="items",
+        ),
+        id="sg",
+        width=2,
+        height=1,
+        hide_pager=True,
+    )
+    list_group = ScrollingGroup(
+        ListGroup(
+            Button(Format("{item}"), id="button"),
+            id="lg",
+            item_id_getter=str,
+            items="items",
+        ),
+        id="lsg",
+        height=2,
+        hide_pager=True,
+    )
+    text = List(Format("{item}"), items="items", id="list", page_size=2)
+
+    keyboard = await select.render_keyboard(
+        data={"items": get_items()}, manager=mock_manager,
+    )
+    assert texts(keyboard) == [["a", "b", "c"]]
+    keyboard = await group.render_keyboard(
+        data={"items": get_items()}, manager=mock_manager,
+    )
+    assert texts(keyboard) == [["a", "b"]]
+    keyboard = await list_group.render_keyboard(
+        data={"items": get_items()}, manager=mock_manager,
+    )
+    assert texts(keyboard) == [["a"], ["b"]]
+    result = await text.render_text(
+        data={"items": get_items()}, manager=mock_manager,
+    )
+    assert result == "a\nb"
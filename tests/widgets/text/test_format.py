@@ -1,6 +1,7 @@
 import pytest
 
 from aiogram_dialog.widgets.text import Format
+from aiogram_dialog.widgets.text.format import compile_format
 
 
 @pytest.mark.asyncio
@@ -12,3 +13,35 @@ async def test_render_format(mock_manager) -> None:
     )
 
     assert rendered_text == "Hello, Tishka17!"
+
+
+@pytest.mark.parametrize("template", [
+    "",
+    "text",
+    "{{escaped}} {name}",
+    "{name!r:>10}",
+    "{user.name} {items[0]} {mapping[key]}",
+    "{price:.2f}",
+    "{name:{width}}",
+])
+def test_compile_format(template: str) -> None:
+    class User:
+        name = "Tishka17"
+
+    data = {
+        "name": "Tishka17",
+        "user": User(),
+        "items": [1, 2],
+        "mapping": {"key": "value"},
+        "price": 1.5,
+        "width": 10,
+    }
+    assert compile_format(template)(data) == template.format_map(data)
+
+
+def test_compile_format_errors() -> None:
+    with pytest.raises(KeyError):
+        compile_format("{missing}")({})
+    with pytest.raises(ValueError, match="expected"):
+        compile_format("{name")({})
+    assert compile_format("{name}") is compile_format("{name}")
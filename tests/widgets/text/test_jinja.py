@@ -1,7 +1,11 @@
+from unittest.mock import Mock
+
 import pytest
+from aiogram import Dispatcher
 
 from aiogram_dialog import DialogManager
-from aiogram_dialog.widgets.text import Jinja
+from aiogram_dialog.widgets.text import Jinja, setup_jinja
+from aiogram_dialog.widgets.text.jinja import JINJA_ENV_FIELD, default_env
 
 
 @pytest.fixture
@@ -34,3 +38,22 @@ async def test_render_jinja(mock_manager) -> None:
 * <a href="https://yandex.ru/search/?text=dog">Dog</a>
 * <a href="https://yandex.ru/search/?text=my brother&#39;s tortoise">My brother&#39;s tortoise</a>
 """  # noqa: E501
+
+
+@pytest.mark.asyncio
+async def test_template_cache(mock_manager) -> None:
+    dp = Dispatcher()
+    env = setup_jinja(dp, precompile=True)
+    mock_manager.middleware_data = {JINJA_ENV_FIELD: env}
+    jinja = Jinja("Hello, {{name}}")
+    await dp.emit_startup()
+
+    # compiled on startup, not by render
+    env.get_template = Mock(side_effect=AssertionError)
+    template = jinja.get_template(env)
+    rendered_text = await jinja.render_text(
+        data={"name": "Tishka17"}, manager=mock_manager,
+    )
+    assert rendered_text == "Hello, Tishka17"
+    assert jinja.get_template(env) is template
+    assert jinja.get_template(default_env) is not template
@@ -0,0 +1,78 @@
+import re
+
+import pytest
+from aiogram.enums import ParseMode
+
+from aiogram_dialog.widgets.text import Const, ScrollingText
+from aiogram_dialog.widgets.text.scrolling_text import build_page_index
+
+
+def split(text: str, page_size: int, html: bool = False) -> list[str]:
+    return [
+        prefix + text[start:end] + suffix
+        for start, end, prefix, suffix in build_page_index(
+            text, page_size, html,
+        )
+    ]
+
+
+def test_line_breaks():
+    text = "first line\nsecond line\n\nparagraph"
+    assert split(text, 25) == ["first line\nsecond line\n\n", "paragraph"]
+    assert split(text, 15) == ["first line\n", "second line\n\n", "paragraph"]
+
+
+def test_hard_split():
+    assert split("x" * 25, 10) == ["x" * 10, "x" * 10, "x" * 5]
+    assert split("", 10) == []
+
+
+def test_joined_symbols():
+    family = "\U0001F468‍\U0001F469‍\U0001F467"
+    pages = split("abcd" + family, 6)
+    assert pages == ["abcd", family]
+
+
+def test_html():
+    text = "<b>bold <i>text</i> here</b> &amp; <a href='x'>link</a>"
+    pages = split(text, 12, html=True)
+    assert pages == [
+        "<b>bold </b>",
+        "<b><i>text</i> </b>",
+        "<b>here</b> ",
+        "&amp; ",
+        "<a href='x'>l</a>",
+        "<a href='x'>ink</a>",
+    ]
+
+
+@pytest.mark.parametrize(("text", "page_size"), [
+    ("<b>" + "word " * 40 + "</b>", 103),
+    ("<b><i>" + "word " * 40 + "</i></b>\n\n", 50),
+    ("<b>x</b>" + " " * 30 + "<i></i>" + " " * 30 + "y", 10),
+    ("x" * 60 + " " * 200 + "y", 100),
+])
+def test_no_empty_pages(text, page_size):
+    pages = split(text, page_size, html=True)
+    assert "".join(re.sub("<[^>]*>", "", page) for page in pages) == (
+        re.sub("<[^>]*>", "", text)
+    )
+    for page in pages:
+        assert re.sub("<[^>]*>", "", page).strip()
+
+
+@pytest.mark.asyncio
+async def test_render(mock_manager):
+    scroll = ScrollingText(
+        Const("<b>" + "word " * 10 + "</b>"),
+        id="scroll",
+        page_size=22,
+        parse_mode=ParseMode.HTML,
+    )
+    mock_manager.current_context().widget_data["scroll"] = 1
+
+    text = await scroll.render_text({}, mock_manager)
+
+    assert text == "<b>word word word word </b>"
+    assert await scroll.get_page_count({}, mock_manager) == 3
+    assert len(scroll.index_cache) == 1